@@ -1,4 +1,5 @@
 # config.py
+import os
 
 COLORS = {
     'black': '#2c363f',
@@ -8,4 +9,67 @@ COLORS = {
     'ash': '#d6dbd2',
     'green': '#4CAF50',
     "secondary_bg": "#1A1A1A",
-}
\ No newline at end of file
+}
+
+# Database settings. INMAN_DATABASE_URL takes precedence over INMAN_DB_PATH.
+DB_PATH = os.environ.get("INMAN_DB_PATH", "inventory.db")
+DATABASE_URL = os.environ.get("INMAN_DATABASE_URL", f"sqlite:///{DB_PATH}")
+DATABASE_ECHO = os.environ.get("INMAN_DATABASE_ECHO", "0").lower() in ("1", "true", "yes")
+
+# Seconds a connection waits for the SQLite write lock before giving up
+DATABASE_BUSY_TIMEOUT = float(os.environ.get("INMAN_DATABASE_BUSY_TIMEOUT", "15"))
+
+# PRAGMAs applied to every new SQLite connection
+SQLITE_PRAGMAS = {
+    "journal_mode": "WAL",          # readers don't block the writer and vice versa
+    "synchronous": "NORMAL",        # safe with WAL, far fewer fsyncs than FULL
+    "cache_size": -64000,           # 64 MB page cache (negative value is in KiB)
+    "mmap_size": 268435456,         # 256 MB memory-mapped I/O
+    "temp_store": "MEMORY",
+    "foreign_keys": "ON",
+}
+
+# Listing pages: default page size and the row count above which totals are only estimated
+PAGE_SIZE = 100
+COUNT_ESTIMATE_LIMIT = 10000
+
+# Rows updated per transaction by migration backfills, keeps the write lock short
+MIGRATION_BATCH_SIZE = 5000
+
+# Audit log durability for log_action calls made outside a caller's transaction:
+#   "batched":   entries are buffered and written by a background flusher every
+#                AUDIT_LOG_FLUSH_INTERVAL seconds or once AUDIT_LOG_BATCH_SIZE are pending;
+#                a crash can lose the last interval of entries
+#   "immediate": every entry is committed before log_action returns
+# Entries logged with db=... are always written in the caller's transaction.
+AUDIT_LOG_DURABILITY = os.environ.get("INMAN_AUDIT_LOG_DURABILITY", "batched").lower()
+AUDIT_LOG_FLUSH_INTERVAL = float(os.environ.get("INMAN_AUDIT_LOG_FLUSH_INTERVAL", "2"))
+AUDIT_LOG_BATCH_SIZE = 200
+
+# Log retention: entries older than LOG_RETENTION_DAYS are counted into daily
+# summaries and moved to monthly gzip JSONL files in LOG_ARCHIVE_DIR
+LOG_RETENTION_DAYS = int(os.environ.get("INMAN_LOG_RETENTION_DAYS", "90"))
+LOG_ARCHIVE_DIR = os.environ.get("INMAN_LOG_ARCHIVE_DIR", "log_archive")
+LOG_RETENTION_BATCH_SIZE = 5000
+# Batches archived at startup; the CLI command catches up on larger backlogs
+LOG_RETENTION_STARTUP_BATCHES = 2
+
+# Query instrumentation: per call-site statement counts and timings, measurement
+# scopes and a report of the worst offenders. Off unless enabled here, with
+# `python -m inman --profile-queries` or from the query report window (Ctrl+Shift+Q)
+QUERY_INSTRUMENTATION = os.environ.get("INMAN_QUERY_INSTRUMENTATION", "0").lower() in ("1", "true", "yes")
+QUERY_REPORT_TOP = 10
+QUERY_SLOWEST_KEPT = 20
+
+# Slow query log: statements slower than SLOW_QUERY_THRESHOLD_MS are appended as
+# JSON lines to SLOW_QUERY_LOG_PATH with a fingerprint, redacted parameters, the
+# call stack and the query plan. The file sits next to the database, is only
+# created once a statement is slow and rotates at SLOW_QUERY_LOG_MAX_BYTES.
+# A threshold of 0 turns the log off.
+SLOW_QUERY_THRESHOLD_MS = float(os.environ.get("INMAN_SLOW_QUERY_MS", "250"))
+SLOW_QUERY_LOG_PATH = os.environ.get(
+    "INMAN_SLOW_QUERY_LOG", os.path.join(os.path.dirname(DB_PATH), "slow_queries.jsonl")
+)
+SLOW_QUERY_LOG_MAX_BYTES = 5 * 1024 * 1024
+SLOW_QUERY_LOG_BACKUPS = 3
+SLOW_QUERY_STACK_DEPTH = 8
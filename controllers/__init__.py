@@ -18,7 +18,9 @@ from .crud import (
     delete_employee,
     log_action,
     assign_item_to_employee,
+    bulk_assign_items,
     transfer_item,
+    transfer_items_bulk,
     update_employee,
     update_employee_id,
     remove_item_from_employee,
@@ -29,12 +31,34 @@ from .crud import (
     get_all_items_names_set,
     get_all_items_names_dict,
     get_employee_details_with_items_one,
+    get_employee_details_with_items_many,
     get_all_employees_ids,
     save_item_attribute,
-    remove_item_attribute
+    remove_item_attribute,
+    get_all_employees_page,
+    get_all_items_page,
+    get_employee_details_with_items_page
 )
 
 from .auth import hash_password, verify_password, create_user, authenticate_user
+from .counters import rebuild_counters, verify_counters, ensure_counters, get_counter_stats
+from .bulk_import import import_employees_bulk, read_employee_rows
+from .search_index import ensure_search_index, rebuild_search_index
+from .cache import get_cache_stats, clear_cache
+from .pagination import paginate, iter_pages
+from .audit import flush_audit_log
+from .retention import apply_log_retention, search_log_archive, get_log_summary
+from .instrumentation import (
+    enable_instrumentation,
+    disable_instrumentation,
+    measure,
+    instrumented,
+    get_query_report,
+    format_query_report,
+    reset_query_stats
+)
+from .slow_query_log import enable_slow_query_log, disable_slow_query_log, read_slow_query_log, summarize_slow_queries
+from .events import subscribe_changes, unsubscribe_changes, publish_change
 
 __all__ = [
     'create_division', 
@@ -56,7 +80,9 @@ __all__ = [
     'delete_employee',
     'log_action',
     'assign_item_to_employee',
+    'bulk_assign_items',
     'transfer_item',
+    'transfer_items_bulk',
     'update_employee',
     'update_employee_id',
     'remove_item_from_employee',
@@ -67,12 +93,48 @@ __all__ = [
     'get_all_items_names_set',
     'get_all_items_names_dict',
     'get_employee_details_with_items_one',
+    'get_employee_details_with_items_many',
     'get_all_employees_ids',
     'save_item_attribute',
-    'remove_item_attribute'
+    'remove_item_attribute',
+    'get_all_employees_page',
+    'get_all_items_page',
+    'get_employee_details_with_items_page',
 
     'hash_password', 
     'verify_password', 
     'create_user', 
     'authenticate_user',
+
+    'rebuild_counters',
+    'verify_counters',
+    'ensure_counters',
+    'get_counter_stats',
+
+    'import_employees_bulk',
+    'read_employee_rows',
+    'ensure_search_index',
+    'rebuild_search_index',
+    'get_cache_stats',
+    'clear_cache',
+    'paginate',
+    'iter_pages',
+    'flush_audit_log',
+    'apply_log_retention',
+    'search_log_archive',
+    'get_log_summary',
+    'enable_instrumentation',
+    'disable_instrumentation',
+    'measure',
+    'instrumented',
+    'get_query_report',
+    'format_query_report',
+    'reset_query_stats',
+    'enable_slow_query_log',
+    'disable_slow_query_log',
+    'read_slow_query_log',
+    'summarize_slow_queries',
+    'subscribe_changes',
+    'unsubscribe_changes',
+    'publish_change',
 ]
\ No newline at end of file
@@ -0,0 +1,132 @@
+# controllers/audit.py
+
+import atexit
+import threading
+from datetime import datetime
+from venv import logger
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+from models.models import Log
+from models.database import SessionLocal
+from config import AUDIT_LOG_DURABILITY, AUDIT_LOG_FLUSH_INTERVAL, AUDIT_LOG_BATCH_SIZE
+
+DURABILITY_POLICIES = ("batched", "immediate")
+
+class AuditLogger:
+    """
+    Writes audit log entries without a commit per entry.
+
+    Entries logged with the caller's session are added to that transaction
+    and commit (or roll back) together with the change they describe. Other
+    entries follow the durability policy: "batched" buffers them for a
+    background flusher that writes each batch with one INSERT, "immediate"
+    writes every entry before returning. Writes use their own session, never
+    the shared scoped session of the caller.
+    """
+    def __init__(self, durability: str = AUDIT_LOG_DURABILITY, flush_interval: float = AUDIT_LOG_FLUSH_INTERVAL,
+                 batch_size: int = AUDIT_LOG_BATCH_SIZE):
+        if durability not in DURABILITY_POLICIES:
+            raise ValueError(f"Unknown audit log durability '{durability}', choose from {', '.join(DURABILITY_POLICIES)}")
+        self.durability = durability
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self.buffer = []
+        self.lock = threading.Lock()
+        self.flush_lock = threading.Lock()
+        self.wake = threading.Event()
+        self.flusher = None
+
+    def log(self, action_type: str, details: str, user_id: int = None, db: Session = None):
+        """
+        Record an action
+
+        Args:
+            action_type (str): Kind of action, e.g. "transfer_item" or "error"
+            details (str): Human readable description
+            user_id (int, optional): User who performed the action
+            db (Session, optional): Open transaction to write the entry in
+
+        Returns:
+            The Log entry; it is only persisted once written
+        """
+        entry = Log(action_type=action_type, details=details, user_id=user_id, timestamp=datetime.utcnow())
+        if db is not None:
+            db.add(entry)
+            return entry
+
+        with self.lock:
+            self.buffer.append(entry)
+            pending = len(self.buffer)
+
+        if self.durability == "immediate":
+            self.flush()
+        else:
+            self._start_flusher()
+            if pending >= self.batch_size:
+                self.wake.set()
+        return entry
+
+    def flush(self):
+        """
+        Write all buffered entries in a single transaction
+
+        Returns:
+            int: Number of entries written
+        """
+        with self.flush_lock:
+            with self.lock:
+                entries, self.buffer = self.buffer, []
+            if not entries:
+                return 0
+
+            rows = [
+                {
+                    "action_type": entry.action_type,
+                    "details": entry.details,
+                    "user_id": entry.user_id,
+                    "timestamp": entry.timestamp
+                } for entry in entries
+            ]
+            try:
+                with SessionLocal() as db:
+                    db.execute(insert(Log), rows)
+                    db.commit()
+            except Exception as e:
+                # Keep the entries for the next attempt, ahead of newer ones
+                with self.lock:
+                    self.buffer[:0] = entries
+                logger.error(f"Error writing {len(entries)} audit log entries: {str(e)}")
+                return 0
+            return len(entries)
+
+    def pending(self):
+        with self.lock:
+            return len(self.buffer)
+
+    def _start_flusher(self):
+        if self.flusher is not None:
+            return
+        with self.lock:
+            if self.flusher is not None:
+                return
+            self.flusher = threading.Thread(target=self._run, name="inman-audit-log", daemon=True)
+            self.flusher.start()
+        # Write whatever is still buffered when the application exits
+        atexit.register(self.flush)
+
+    def _run(self):
+        while True:
+            self.wake.wait(self.flush_interval)
+            self.wake.clear()
+            self.flush()
+
+# Shared logger used by log_action
+audit_logger = AuditLogger()
+
+def log_action(action_type: str, details: str, user_id: int = None, db: Session = None):
+    """Record an action in the audit log, see AuditLogger.log"""
+    return audit_logger.log(action_type, details, user_id=user_id, db=db)
+
+def flush_audit_log():
+    """Write buffered audit log entries now, e.g. before reading the logs"""
+    return audit_logger.flush()
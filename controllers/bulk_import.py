@@ -0,0 +1,177 @@
+# controllers/bulk_import.py
+
+import csv
+import os
+from openpyxl import load_workbook
+from sqlalchemy import func
+from sqlalchemy.dialects.sqlite import insert
+from models.models import Employee, EmployeeItem
+from models.database import session_scope
+from controllers.crud import get_division_id_from_name
+from controllers.counters import adjust_division_counter
+from controllers.cache import bump_version
+from controllers.events import publish_change
+
+EMPLOYEE_IMPORT_COLUMNS = ("EMP_ID", "Name", "Division")
+
+def normalize_cell(value):
+    """Turn a spreadsheet cell into a stripped string, '' for empty cells"""
+    if value is None:
+        return ""
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)  # Excel stores numeric IDs as floats
+    return str(value).strip()
+
+def read_employee_rows(path: str):
+    """
+    Stream employee rows from an .xlsx or .csv file without loading it into memory
+
+    The first row must hold the EMP_ID, Name and Division headers.
+
+    Args:
+        path (str): Path of the spreadsheet
+
+    Yields:
+        Tuples of (row_number, emp_id, name, division), row_number as shown in Excel
+    """
+    extension = os.path.splitext(path)[1].lower()
+
+    if extension == ".csv":
+        with open(path, newline="", encoding="utf-8-sig") as file:
+            yield from _map_employee_rows(csv.reader(file))
+    elif extension in (".xlsx", ".xlsm"):
+        workbook = load_workbook(path, read_only=True, data_only=True)
+        try:
+            yield from _map_employee_rows(workbook.active.iter_rows(values_only=True))
+        finally:
+            workbook.close()
+    else:
+        raise ValueError(f"Unsupported file type '{extension}', use .xlsx or .csv")
+
+def _map_employee_rows(rows):
+    rows = iter(rows)
+    header = [normalize_cell(cell) for cell in next(rows, [])]
+    missing = [column for column in EMPLOYEE_IMPORT_COLUMNS if column not in header]
+    if missing:
+        raise ValueError(f"Missing column(s): {', '.join(missing)}")
+    positions = [header.index(column) for column in EMPLOYEE_IMPORT_COLUMNS]
+
+    for row_number, row in enumerate(rows, 2):
+        values = [normalize_cell(row[position]) if position < len(row) else "" for position in positions]
+        if any(values):  # Skip blank lines
+            yield (row_number, *values)
+
+def validate_employee_row(emp_id: str, name: str, division: str, division_ids: dict):
+    """
+    Check an import row against the cached {division_name: division_id} lookup
+
+    Returns:
+        Error message, or None if the row is valid
+    """
+    if not emp_id:
+        return "Employee ID is missing"
+    if not name:
+        return "Name is missing"
+    if not division:
+        return "Division is not specified"
+    if division not in division_ids:
+        return f"Division '{division}' not found"
+    return None
+
+def import_employees_bulk(path: str, batch_size: int = 500):
+    """
+    Import employees from a spreadsheet in batched transactions
+
+    Rows are streamed from the file, validated against a single division
+    lookup and upserted by EMP_ID, committing once per batch. Existing
+    employees get their name and division updated. A batch that fails is
+    retried one row at a time so only the offending rows are reported.
+
+    Args:
+        path (str): Path of an .xlsx or .csv file with EMP_ID, Name and Division columns
+        batch_size (int, optional): Rows written per transaction
+
+    Returns:
+        Dictionary with total, created and updated counts, and errors as a
+        list of {"row", "emp_id", "error"} dictionaries
+    """
+    division_ids = get_division_id_from_name() or {}
+    report = {"total": 0, "created": 0, "updated": 0, "errors": []}
+    seen = set()
+    batch = []
+    row_numbers = []
+
+    for row_number, emp_id, name, division in read_employee_rows(path):
+        report["total"] += 1
+        error = validate_employee_row(emp_id, name, division, division_ids)
+        if error is None and emp_id in seen:
+            error = f"Duplicate employee ID {emp_id} in file"
+        if error:
+            report["errors"].append({"row": row_number, "emp_id": emp_id, "error": error})
+            continue
+
+        seen.add(emp_id)
+        batch.append({"emp_id": emp_id, "name": name, "division_id": division_ids[division]})
+        row_numbers.append(row_number)
+        if len(batch) >= batch_size:
+            _import_employee_batch(batch, row_numbers, report)
+            batch = []
+            row_numbers = []
+
+    if batch:
+        _import_employee_batch(batch, row_numbers, report)
+
+    return report
+
+def _import_employee_batch(batch: list, row_numbers: list, report: dict):
+    try:
+        _upsert_employee_batch(batch, report)
+    except Exception as e:
+        if len(batch) == 1:
+            report["errors"].append({"row": row_numbers[0], "emp_id": batch[0]["emp_id"], "error": str(e)})
+            return
+        # Retry row by row to find the offending rows
+        for row, row_number in zip(batch, row_numbers):
+            _import_employee_batch([row], [row_number], report)
+
+def _upsert_employee_batch(batch: list, report: dict):
+    with session_scope() as db:
+        emp_ids = [row["emp_id"] for row in batch]
+        existing = dict(
+            db.query(Employee.emp_id, Employee.division_id).filter(Employee.emp_id.in_(emp_ids)).all()
+        )
+        moved = [row for row in batch if row["emp_id"] in existing and existing[row["emp_id"]] != row["division_id"]]
+        assigned = dict(
+            db.query(EmployeeItem.emp_id, func.count(EmployeeItem.id))
+            .filter(EmployeeItem.emp_id.in_([row["emp_id"] for row in moved]))
+            .group_by(EmployeeItem.emp_id)
+            .all()
+        ) if moved else {}
+
+        stmt = insert(Employee)
+        db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[Employee.emp_id],
+                set_={"name": stmt.excluded.name, "division_id": stmt.excluded.division_id}
+            ),
+            batch
+        )
+
+        # Keep the division counters in step with new and moved employees
+        for row in batch:
+            if row["emp_id"] not in existing:
+                adjust_division_counter(db, row["division_id"], employees=1)
+        for row in moved:
+            items = assigned.get(row["emp_id"], 0)
+            adjust_division_counter(db, existing[row["emp_id"]], employees=-1, items=-items)
+            adjust_division_counter(db, row["division_id"], employees=1, items=items)
+
+        db.commit()
+        bump_version("employees")
+        created = [emp_id for emp_id in emp_ids if emp_id not in existing]
+        if created:
+            publish_change("employee_created", emp_ids=created)
+        if existing:
+            publish_change("employee_updated", emp_ids=list(existing))
+        report["created"] += len(batch) - len(existing)
+        report["updated"] += len(existing)
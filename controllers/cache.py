@@ -0,0 +1,85 @@
+# controllers/cache.py
+
+import copy
+import threading
+from functools import wraps
+
+# Reference data is cached per namespace. CRUD writes bump the namespace
+# version, which makes every entry stored under an older version stale.
+# Assignments and transfers have no cached lookups, their versions let
+# screens such as the Dashboard tell whether their figures changed.
+_versions = {"divisions": 0, "items": 0, "employees": 0, "assignments": 0, "transfers": 0}
+_entries = {}  # (function name, args) -> (namespace version, value)
+_stats = {"hits": 0, "misses": 0, "invalidations": 0}
+_lock = threading.Lock()
+
+def bump_version(*namespaces: str):
+    """Invalidate the cached lookups of the given namespaces, called after a CRUD write commits"""
+    with _lock:
+        for namespace in namespaces:
+            _versions[namespace] += 1
+            _stats["invalidations"] += 1
+
+def get_version(namespace: str):
+    with _lock:
+        return _versions[namespace]
+
+def get_versions(*namespaces: str):
+    """Read several namespace versions at once, as a tuple in the order given"""
+    with _lock:
+        return tuple(_versions[namespace] for namespace in namespaces)
+
+def cached(namespace: str):
+    """
+    Read-through cache decorator for reference data lookups
+
+    Results are stored per call arguments and reused until a write bumps
+    the namespace version. Callers receive a copy, so mutating a result
+    does not affect the cache.
+    """
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            key = (func.__name__, args, tuple(sorted(kwargs.items())))
+            with _lock:
+                version = _versions[namespace]
+                entry = _entries.get(key)
+                if entry is not None and entry[0] == version:
+                    _stats["hits"] += 1
+                    return copy.deepcopy(entry[1])
+                _stats["misses"] += 1
+
+            value = func(*args, **kwargs)
+            with _lock:
+                # Skip storing if a write happened while the value was loading
+                if _versions[namespace] == version:
+                    _entries[key] = (version, value)
+            return copy.deepcopy(value)
+        return wrapper
+    return decorator
+
+def clear_cache():
+    """Drop every cached entry and reset the statistics"""
+    with _lock:
+        _entries.clear()
+        for name in _stats:
+            _stats[name] = 0
+
+def get_cache_stats():
+    """
+    Report cache effectiveness
+
+    Returns:
+        Dictionary with hits, misses, hit_rate, invalidations, the number of
+        stored entries and the current namespace versions
+    """
+    with _lock:
+        lookups = _stats["hits"] + _stats["misses"]
+        return {
+            "hits": _stats["hits"],
+            "misses": _stats["misses"],
+            "hit_rate": _stats["hits"] / lookups if lookups else 0.0,
+            "invalidations": _stats["invalidations"],
+            "entries": len(_entries),
+            "versions": dict(_versions)
+        }
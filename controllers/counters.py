@@ -0,0 +1,241 @@
+# controllers/counters.py
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+from sqlalchemy.dialects.sqlite import insert
+from models.models import Division, Employee, Item, EmployeeItem, DivisionCounter, ItemCounter
+from models.database import session_scope
+from controllers.cache import bump_version
+
+# Counter maintenance, called by the CRUD layer inside its own transaction
+def adjust_division_counter(db: Session, division_id: int, employees: int = 0, items: int = 0):
+    """
+    Add to the employee and item counts of a division
+
+    Args:
+        db (Session): Session of the transaction making the change
+        division_id (int): Division to update. Ignored if None
+        employees (int, optional): Change in employee count
+        items (int, optional): Change in assigned item count
+    """
+    if division_id is None or (not employees and not items):
+        return
+
+    stmt = insert(DivisionCounter).values(
+        division_id=division_id,
+        employee_count=employees,
+        item_count=items
+    )
+    db.execute(stmt.on_conflict_do_update(
+        index_elements=[DivisionCounter.division_id],
+        set_={
+            "employee_count": DivisionCounter.employee_count + employees,
+            "item_count": DivisionCounter.item_count + items
+        }
+    ))
+
+def adjust_item_counter(db: Session, item_id: int, assignments: int = 0):
+    """
+    Add to the assignment count of an item
+
+    Args:
+        db (Session): Session of the transaction making the change
+        item_id (int): Item to update. Ignored if None
+        assignments (int, optional): Change in assignment count
+    """
+    if item_id is None or not assignments:
+        return
+
+    stmt = insert(ItemCounter).values(item_id=item_id, assignment_count=assignments)
+    db.execute(stmt.on_conflict_do_update(
+        index_elements=[ItemCounter.item_id],
+        set_={"assignment_count": ItemCounter.assignment_count + assignments}
+    ))
+
+def create_division_counter(db: Session, division_id: int):
+    db.execute(insert(DivisionCounter).values(division_id=division_id).on_conflict_do_nothing())
+
+def create_item_counter(db: Session, item_id: int):
+    db.execute(insert(ItemCounter).values(item_id=item_id).on_conflict_do_nothing())
+
+def delete_division_counter(db: Session, division_id: int):
+    db.query(DivisionCounter).filter(DivisionCounter.division_id == division_id).delete()
+
+def delete_item_counter(db: Session, item_id: int):
+    db.query(ItemCounter).filter(ItemCounter.item_id == item_id).delete()
+
+def count_employee_assignments(db: Session, emp_id: str):
+    return db.query(func.count(EmployeeItem.id)).filter(EmployeeItem.emp_id == emp_id).scalar()
+
+# Reconciliation
+def compute_counters(db: Session):
+    """
+    Compute every counter from the base tables
+
+    Returns:
+        Tuple of ({division_id: (employee_count, item_count)},
+                  {item_id: assignment_count},
+                  {emp_id: item_count})
+    """
+    division_counts = {division_id: [0, 0] for (division_id,) in db.query(Division.division_id)}
+
+    for division_id, employee_count in (
+        db.query(Employee.division_id, func.count(Employee.emp_id))
+        .filter(Employee.division_id.in_(division_counts.keys()))
+        .group_by(Employee.division_id)
+    ):
+        division_counts[division_id][0] = employee_count
+
+    for division_id, item_count in (
+        db.query(Employee.division_id, func.count(EmployeeItem.id))
+        .join(EmployeeItem, EmployeeItem.emp_id == Employee.emp_id)
+        .filter(Employee.division_id.in_(division_counts.keys()))
+        .group_by(Employee.division_id)
+    ):
+        division_counts[division_id][1] = item_count
+
+    item_counts = {item_id: 0 for (item_id,) in db.query(Item.item_id)}
+    for item_id, assignment_count in (
+        db.query(EmployeeItem.item_id, func.count(EmployeeItem.id))
+        .filter(EmployeeItem.item_id.in_(item_counts.keys()))
+        .group_by(EmployeeItem.item_id)
+    ):
+        item_counts[item_id] = assignment_count
+
+    employee_counts = dict(
+        db.query(Employee.emp_id, func.count(EmployeeItem.id))
+        .outerjoin(EmployeeItem, EmployeeItem.emp_id == Employee.emp_id)
+        .group_by(Employee.emp_id)
+        .all()
+    )
+
+    return (
+        {division_id: tuple(counts) for division_id, counts in division_counts.items()},
+        item_counts,
+        employee_counts
+    )
+
+def verify_counters():
+    """
+    Compare the stored counters with counts computed from the base tables
+
+    Returns:
+        List of dictionaries describing each counter that has drifted
+    """
+    with session_scope() as db:
+        division_counts, item_counts, employee_counts = compute_counters(db)
+        mismatches = []
+
+        stored_divisions = {
+            counter.division_id: (counter.employee_count, counter.item_count)
+            for counter in db.query(DivisionCounter).all()
+        }
+        for division_id in set(division_counts) | set(stored_divisions):
+            expected = division_counts.get(division_id)
+            stored = stored_divisions.get(division_id)
+            if expected != stored:
+                mismatches.append({"table": "division_counters", "key": division_id, "stored": stored, "expected": expected})
+
+        stored_items = {counter.item_id: counter.assignment_count for counter in db.query(ItemCounter).all()}
+        for item_id in set(item_counts) | set(stored_items):
+            expected = item_counts.get(item_id)
+            stored = stored_items.get(item_id)
+            if expected != stored:
+                mismatches.append({"table": "item_counters", "key": item_id, "stored": stored, "expected": expected})
+
+        for emp_id, item_count in db.query(Employee.emp_id, Employee.item_count):
+            if (item_count or 0) != employee_counts.get(emp_id, 0):
+                mismatches.append({"table": "employees", "key": emp_id, "stored": item_count, "expected": employee_counts.get(emp_id, 0)})
+
+        return mismatches
+
+def rebuild_counters():
+    """
+    Recompute every counter from the base tables in a single transaction
+
+    Rewrites the division and item counter tables and fixes any drift in
+    Employee.item_count.
+
+    Returns:
+        Dictionary with the number of division, item and employee counters written
+    """
+    with session_scope() as db:
+        division_counts, item_counts, employee_counts = compute_counters(db)
+
+        db.query(DivisionCounter).delete()
+        db.query(ItemCounter).delete()
+
+        if division_counts:
+            db.execute(insert(DivisionCounter), [
+                {"division_id": division_id, "employee_count": employee_count, "item_count": item_count}
+                for division_id, (employee_count, item_count) in division_counts.items()
+            ])
+        if item_counts:
+            db.execute(insert(ItemCounter), [
+                {"item_id": item_id, "assignment_count": assignment_count}
+                for item_id, assignment_count in item_counts.items()
+            ])
+
+        # Fix drifted Employee.item_count values
+        drifted = [
+            {"emp_id": emp_id, "item_count": employee_counts.get(emp_id, 0)}
+            for emp_id, item_count in db.query(Employee.emp_id, Employee.item_count)
+            if (item_count or 0) != employee_counts.get(emp_id, 0)
+        ]
+        for row in drifted:
+            db.query(Employee).filter(Employee.emp_id == row["emp_id"]).update(
+                {Employee.item_count: row["item_count"]}, synchronize_session=False
+            )
+
+    # Counts shown from the counter tables may have changed
+    bump_version("assignments")
+    return {
+        "divisions": len(division_counts),
+        "items": len(item_counts),
+        "employees": len(drifted)
+    }
+
+def ensure_counters():
+    """
+    Populate the counter tables if they are empty but the inventory is not,
+    e.g. the first time an existing database is opened with this version.
+    """
+    with session_scope() as db:
+        has_counters = db.query(DivisionCounter).first() or db.query(ItemCounter).first()
+        has_data = db.query(Division).first() or db.query(Item).first()
+
+    if has_data and not has_counters:
+        return rebuild_counters()
+    return None
+
+# Reads
+def get_counter_stats():
+    """
+    Read inventory totals from the counter tables
+
+    Returns:
+        Dictionary with total employees, divisions, items and assignments,
+        plus {division_id: {"employee_count", "item_count"}} under "divisions".
+        total_employees includes employees without a division.
+    """
+    with session_scope() as db:
+        divisions = {
+            counter.division_id: {
+                "employee_count": counter.employee_count,
+                "item_count": counter.item_count
+            } for counter in db.query(DivisionCounter).all()
+        }
+        total_items, total_assignments = db.query(
+            func.count(ItemCounter.item_id),
+            func.coalesce(func.sum(ItemCounter.assignment_count), 0)
+        ).one()
+        # Division counters only cover employees with a division
+        unassigned_employees = db.query(func.count(Employee.emp_id)).filter(Employee.division_id.is_(None)).scalar()
+
+        return {
+            "total_employees": sum(d["employee_count"] for d in divisions.values()) + unassigned_employees,
+            "total_divisions": len(divisions),
+            "total_items": total_items,
+            "total_assignments": total_assignments,
+            "divisions": divisions
+        }
@@ -6,7 +6,22 @@ from models.models import *
 from models.database import session_scope, SessionLocal
 from datetime import datetime
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy import func
+from sqlalchemy import func, case, insert
+from collections import Counter
+from controllers.cache import cached, bump_version
+from controllers.events import publish_change
+from controllers.audit import log_action
+from controllers.pagination import paginate
+from config import PAGE_SIZE
+from controllers.counters import (
+    adjust_division_counter,
+    adjust_item_counter,
+    create_division_counter,
+    create_item_counter,
+    delete_division_counter,
+    delete_item_counter,
+    count_employee_assignments
+)
 
 # Division CRUD Operations
 def create_division(name: str):
@@ -14,8 +29,12 @@ def create_division(name: str):
         with session_scope() as db:
             division = Division(name=name)
             db.add(division)
+            db.flush()
+            create_division_counter(db, division.division_id)
             db.commit()
+            bump_version("divisions")
             db.refresh(division)
+            publish_change("division_created", division_ids=[division.division_id])
             db.close()
             return division
     except IntegrityError:
@@ -27,6 +46,7 @@ def get_division(division_id: int):
     db.close()
     return x
 
+@cached("divisions")
 def get_division_id_from_name(name: str = None):
     """
     Retrieve division ID based on division name
@@ -58,6 +78,7 @@ def get_division_id_from_name(name: str = None):
         logger.error(f"Error retrieving division ID for name {name}: {str(e)}")
         return None
         
+@cached("divisions")
 def get_all_divisions():
     with session_scope() as db:
         divisions = db.query(Division).all()
@@ -69,46 +90,82 @@ def get_all_divisions():
             } for div in divisions
         ]
 
+@cached("divisions")
 def get_all_division_names():
     with session_scope() as db:
         division_names = db.query(Division.name).all()
         db.close()
         return [name[0] for name in division_names]
 
+def load_division_counts(db: Session, divisions):
+    """
+    Build count details for a list of divisions with grouped aggregate queries
+
+    Employee counts and per-item assignment counts are computed with one
+    GROUP BY query each, so the number of queries stays the same no matter
+    how many divisions are passed in.
+
+    Args:
+        db (Session): Open database session
+        divisions (list): Division objects to build the details for
+
+    Returns:
+        List of dictionaries with employee_count, item_count and an items breakdown
+    """
+    division_ids = [division.division_id for division in divisions]
+    if not division_ids:
+        return []
+
+    # Count employees per division
+    employee_counts = dict(
+        db.query(Employee.division_id, func.count(Employee.emp_id))
+        .filter(Employee.division_id.in_(division_ids))
+        .group_by(Employee.division_id)
+        .all()
+    )
+
+    # Count assignments per division and item
+    items_data = (
+        db.query(
+            Employee.division_id,
+            Item.item_id,
+            Item.name,
+            func.count(EmployeeItem.id).label('count')
+        )
+        .select_from(EmployeeItem)
+        .join(Employee, EmployeeItem.emp_id == Employee.emp_id)
+        .join(Item, EmployeeItem.item_id == Item.item_id)
+        .filter(Employee.division_id.in_(division_ids))
+        .group_by(Employee.division_id, Item.item_id, Item.name)
+        .order_by(Employee.division_id, Item.name)
+        .all()
+    )
+
+    items_by_division = {}
+    for row in items_data:
+        items_by_division.setdefault(row.division_id, []).append({"name": row.name, "count": row.count})
+
+    division_details_list = []
+    for division in divisions:
+        items_list = items_by_division.get(division.division_id, [])
+        division_details_list.append({
+            "division_id": division.division_id,
+            "name": division.name,
+            "employee_count": employee_counts.get(division.division_id, 0),
+            "item_count": sum(item["count"] for item in items_list),
+            "items": items_list
+        })
+
+    return division_details_list
+
 def get_division_details_with_counts(division_id: int):
     with session_scope() as db:
         # Get the division
         division = db.query(Division).filter(Division.division_id == division_id).first()
         
         if division:
-            # Count employees in the division
-            employee_count = db.query(Employee).filter(Employee.division_id == division_id).count()
-            
-            # Count items owned by employees in the division
-            item_count = db.query(Item).join(EmployeeItem).filter(EmployeeItem.emp_id == Employee.emp_id, Employee.division_id == division_id).count()
-            
-            # Prepare items data
-            items_data = db.query(Item.name, func.count(EmployeeItem.id).label('count')) \
-                .join(EmployeeItem) \
-                .join(Employee) \
-                .filter(Employee.division_id == division_id) \
-                .group_by(Item.name) \
-                .all()
-            
-            # Format items data
-            items_list = [{"name": item.name, "count": item.count} for item in items_data]
-            
-            # Prepare the details to return
-            division_details = {
-                "division_id": division.division_id,
-                "name": division.name,
-                "employee_count": employee_count,
-                "item_count": item_count,
-                "items": items_list
-            }
-
+            division_details = load_division_counts(db, [division])[0]
             db.close()
-            
             return division_details
         else:
             db.close()
@@ -119,36 +176,7 @@ def get_all_divisions_with_counts():
         # Get all divisions
         divisions = db.query(Division).all()
         
-        division_details_list = []
-        
-        for division in divisions:
-            # Count employees in the division
-            employee_count = db.query(Employee).filter(Employee.division_id == division.division_id).count()
-            
-            # Count items owned by employees in the division
-            item_count = db.query(Item).join(EmployeeItem).filter(EmployeeItem.emp_id == Employee.emp_id, Employee.division_id == division.division_id).count()
-            
-            # Prepare items data
-            items_data = db.query(Item.name, Item.item_id, func.count(EmployeeItem.id).label('count')) \
-                .join(EmployeeItem) \
-                .join(Employee) \
-                .filter(Employee.division_id == division.division_id) \
-                .group_by(Item.name, Item.item_id) \
-                .all()
-            
-            # Format items data
-            items_list = [{"name": item.name, "count": item.count} for item in items_data]
-            
-            # Prepare the details for the division
-            division_details = {
-                "division_id": division.division_id,
-                "name": division.name,
-                "employee_count": employee_count,
-                "item_count": item_count,
-                "items": items_list
-            }
-            
-            division_details_list.append(division_details)
+        division_details_list = load_division_counts(db, divisions)
 
         db.close()
         
@@ -160,6 +188,8 @@ def update_dvision(division_id, name):
         if division:
             division.name = name
             db.commit()
+            bump_version("divisions")
+            publish_change("division_updated", division_ids=[division_id])
             db.close()
             return True
         return False
@@ -169,7 +199,10 @@ def delete_division(division_id: int):
         division = get_division(division_id)
         if division:
             db.delete(division)
+            delete_division_counter(db, division_id)
             db.commit()
+            bump_version("divisions")
+            publish_change("division_deleted", division_ids=[division_id])
         db.close()
         return division
 
@@ -179,8 +212,12 @@ def create_employee(emp_id: str, name: str, division_id: int):
         with session_scope() as db:
             employee = Employee(emp_id=emp_id, name=name, division_id=division_id)
             db.add(employee)
+            db.flush()
+            adjust_division_counter(db, division_id, employees=1)
             db.commit()
+            bump_version("employees")
             db.refresh(employee)
+            publish_change("employee_created", emp_ids=[emp_id])
             db.close()
             return employee
     except IntegrityError:
@@ -192,26 +229,139 @@ def get_employee(emp_id: str):
         db.close()
         return y
 
-def get_all_employees():
+def get_all_employees(division_id: int = None, limit: int = None, offset: int = 0):
+    """
+    List employees with their division name in a single joined query
+
+    Args:
+        division_id (int, optional): Only list employees of this division
+        limit (int, optional): Maximum number of employees to return
+        offset (int, optional): Number of employees to skip, for pagination
+
+    Returns:
+        List of employee dictionaries ordered by emp_id; employees without a
+        division get "Unassigned" as division name
+    """
     with session_scope() as db:
-        employees = db.query(Employee).all()
-        x = [
+        query = (
+            db.query(Employee.emp_id, Employee.name, Employee.division_id, Division.name)
+            .outerjoin(Division, Employee.division_id == Division.division_id)
+        )
+        if division_id is not None:
+            query = query.filter(Employee.division_id == division_id)
+        query = query.order_by(Employee.emp_id).offset(offset)
+        if limit is not None:
+            query = query.limit(limit)
+
+        return [
             {
-                'emp_id': emp.emp_id,
-                'name': emp.name,
-                'division_id': emp.division_id,
-                'division': str(get_division(emp.division_id).name)
-            } for emp in employees
+                'emp_id': emp_id,
+                'name': name,
+                'division_id': emp_division_id,
+                'division': division_name or "Unassigned"
+            } for emp_id, name, emp_division_id, division_name in query
         ]
-        db.close()
-        return x
 
+def get_all_employees_page(division_id: int = None, cursor: str = None, page_size: int = PAGE_SIZE):
+    """
+    Page through employees ordered by emp_id, see controllers.pagination.paginate
+
+    Args:
+        division_id (int, optional): Only list employees of this division
+        cursor (str, optional): next_cursor of the previous page
+        page_size (int, optional): Employees per page
+
+    Returns:
+        Page dictionary whose items are employee dictionaries as in get_all_employees
+    """
+    with session_scope() as db:
+        query = (
+            db.query(Employee.emp_id, Employee.name, Employee.division_id, Division.name.label("division"))
+            .outerjoin(Division, Employee.division_id == Division.division_id)
+        )
+        if division_id is not None:
+            query = query.filter(Employee.division_id == division_id)
+
+        return paginate(
+            query, [Employee.emp_id], cursor, page_size,
+            transform=lambda rows: [
+                {
+                    'emp_id': row.emp_id,
+                    'name': row.name,
+                    'division_id': row.division_id,
+                    'division': row.division or "Unassigned"
+                } for row in rows
+            ]
+        )
+
+@cached("employees")
 def get_all_employees_ids():
     with session_scope() as db:
         employees = db.query(Employee).all()
         x = [ i.emp_id for i in employees]
         return x
     
+def load_employee_items(db: Session, emp_ids=None):
+    """
+    Load item assignments and their attributes for many employees at once
+
+    Runs two queries no matter how many employees are requested: one for the
+    EmployeeItem rows joined with their Item, one for all of their attributes.
+
+    Args:
+        db (Session): Open database session
+        emp_ids (iterable, optional): Employee IDs to restrict the load to.
+                                      If None, assignments of every employee are loaded
+
+    Returns:
+        Dictionary of {emp_id: [item_data, ...]} in assignment order
+    """
+    assignments_query = (
+        db.query(
+            EmployeeItem.id,
+            EmployeeItem.emp_id,
+            EmployeeItem.unique_key,
+            EmployeeItem.date_assigned,
+            Item.item_id,
+            Item.name
+        )
+        .join(Item, EmployeeItem.item_id == Item.item_id)
+    )
+    attributes_query = (
+        db.query(
+            EmployeeItemAttribute.emp_item_id,
+            EmployeeItemAttribute.name,
+            EmployeeItemAttribute.value
+        )
+        .join(EmployeeItem, EmployeeItemAttribute.emp_item_id == EmployeeItem.id)
+    )
+
+    if emp_ids is not None:
+        emp_ids = list(emp_ids)
+        assignments_query = assignments_query.filter(EmployeeItem.emp_id.in_(emp_ids))
+        attributes_query = attributes_query.filter(EmployeeItem.emp_id.in_(emp_ids))
+
+    # Group attributes by the EmployeeItem they belong to
+    attributes_by_emp_item = {}
+    for emp_item_id, name, value in attributes_query.order_by(EmployeeItemAttribute.emp_attribute_id):
+        attributes_by_emp_item.setdefault(emp_item_id, []).append({
+            "name": name,
+            "value": value
+        })
+
+    # Group item data by employee
+    items_by_employee = {}
+    for assignment in assignments_query.order_by(EmployeeItem.id):
+        items_by_employee.setdefault(assignment.emp_id, []).append({
+            "item_id": assignment.item_id,
+            "name": assignment.name,
+            "unique_key": assignment.unique_key,
+            "date_assigned": assignment.date_assigned.strftime('%Y-%m-%d') if assignment.date_assigned else None,
+            "attributes": attributes_by_emp_item.get(assignment.id, [])
+        })
+
+    return items_by_employee
+
 def get_employee_details_with_items_one(emp_id: str):
     """
     Retrieve employee details along with their associated items
@@ -224,7 +374,7 @@ def get_employee_details_with_items_one(emp_id: str):
     """
     try:
         with session_scope() as db:
-            # Query employee with their items and division in a single query
+            # Query employee with their division in a single query
             employee = (
                 db.query(Employee)
                 .options(joinedload(Employee.division))  # Load division data
@@ -235,61 +385,14 @@ def get_employee_details_with_items_one(emp_id: str):
             if not employee:
                 raise ValueError(f"Employee with ID {emp_id} not found")
             
-            # Get items through EmployeeItem relationship
-            items_query = (
-                db.query(Item)
-                .join(EmployeeItem)
-                .filter(EmployeeItem.emp_id == emp_id)
-                .all()
-            )
+            items_by_employee = load_employee_items(db, [emp_id])
 
-            # Format items data
-            items_data = []
-            for item in items_query:
-                # Get all EmployeeItem records for the current item
-                emp_items = (
-                    db.query(EmployeeItem)
-                    .filter(
-                        EmployeeItem.emp_id == emp_id,
-                        EmployeeItem.item_id == item.item_id
-                    )
-                    .all()
-                )
-                
-                # Prepare item data for each EmployeeItem record
-                for emp_item in emp_items:
-                    # Get attribute details for the current EmployeeItem record
-                    attributes_query = (
-                        db.query(EmployeeItemAttribute)
-                        .filter(EmployeeItemAttribute.emp_item_id == emp_item.id)
-                        .all()
-                    )
-                    
-                    # Format attribute data
-                    attributes_data = []
-                    for attribute in attributes_query:
-                        attribute_data = {
-                            "name": attribute.name,
-                            "value": attribute.value
-                        }
-                        attributes_data.append(attribute_data)
-                    
-                    # Prepare item data
-                    item_data = {
-                        "item_id": item.item_id,
-                        "name": item.name,
-                        "unique_key": emp_item.unique_key,
-                        "date_assigned": emp_item.date_assigned.strftime('%Y-%m-%d') if emp_item.date_assigned else None,
-                        "attributes": attributes_data
-                    }
-                    items_data.append(item_data)
-            
             # Prepare employee data
             emp_data = {
                 "emp_id": employee.emp_id,
                 "name": employee.name,
                 "division": employee.division.name if employee.division else "Unassigned",
-                "items": items_data
+                "items": items_by_employee.get(employee.emp_id, [])
             }
 
             db.close()
@@ -303,81 +406,35 @@ def get_employee_details_with_items_one(emp_id: str):
 def get_employee_details_with_items():
     """
     Retrieve all employee details along with their associated items
+
+    Employees, assignments and attributes are each fetched with a single
+    query and grouped in Python, so the query count does not grow with
+    the number of employees.
     
     Returns:
         List of dictionaries containing employee and item information
     """
     try:
         with session_scope() as db:
-            # Query employees with their items and division in a single query
+            # Query employees with their division in a single query
             employees = (
                 db.query(Employee)
                 .options(joinedload(Employee.division))  # Load division data
                 .all()
             )
+
+            items_by_employee = load_employee_items(db)
             
             # Transform query results into desired format
-            employee_details = []
-            for emp in employees:
-                # Get items through EmployeeItem relationship
-                items_query = (
-                    db.query(Item)
-                    .join(EmployeeItem)
-                    .filter(EmployeeItem.emp_id == emp.emp_id)
-                    .all()
-                )
-
-                # Format items data
-                items_data = []
-                for item in items_query:
-                    # Get all EmployeeItem records for the current item
-                    emp_items = (
-                        db.query(EmployeeItem)
-                        .filter(
-                            EmployeeItem.emp_id == emp.emp_id,
-                            EmployeeItem.item_id == item.item_id
-                        )
-                        .all()
-                    )
-                    
-                    # Prepare item data for each EmployeeItem record
-                    for emp_item in emp_items:
-                        # Get attribute details for the current EmployeeItem record
-                        attributes_query = (
-                            db.query(EmployeeItemAttribute)
-                            .filter(EmployeeItemAttribute.emp_item_id == emp_item.id)
-                            .all()
-                        )
-                        
-                        # Format attribute data
-                        attributes_data = []
-                        for attribute in attributes_query:
-                            attribute_data = {
-                                "name": attribute.name,
-                                "value": attribute.value
-                            }
-                            attributes_data.append(attribute_data)
-                        
-                        # Prepare item data
-                        item_data = {
-                            "item_id": item.item_id,
-                            "name": item.name,
-                            "unique_key": emp_item.unique_key,
-                            "date_assigned": emp_item.date_assigned.strftime('%Y-%m-%d') if emp_item.date_assigned else None,
-                            "attributes": attributes_data
-                        }
-                        items_data.append(item_data)
-                
-                # Prepare employee data
-                emp_data = {
+            employee_details = [
+                {
                     "emp_id": emp.emp_id,
                     "name": emp.name,
                     "division": emp.division.name if emp.division else "Unassigned",
-                    "items": items_data
-                }
-                employee_details.append(emp_data)
+                    "items": items_by_employee.get(emp.emp_id, [])
+                } for emp in employees
+            ]
 
-  
             db.close()
             
             return employee_details
@@ -386,20 +443,109 @@ def get_employee_details_with_items():
         logger.error(f"Error retrieving employee details: {str(e)}")
         raise
 
+def get_employee_details_with_items_page(cursor: str = None, page_size: int = PAGE_SIZE):
+    """
+    Page through employees with their items, ordered by emp_id
+
+    Only the assignments of the employees on the page are loaded.
+
+    Args:
+        cursor (str, optional): next_cursor of the previous page
+        page_size (int, optional): Employees per page
+
+    Returns:
+        Page dictionary whose items are shaped as in get_employee_details_with_items
+    """
+    with session_scope() as db:
+        query = (
+            db.query(Employee.emp_id, Employee.name, Division.name.label("division"))
+            .outerjoin(Division, Employee.division_id == Division.division_id)
+        )
+
+        def transform(rows):
+            items_by_employee = load_employee_items(db, [row.emp_id for row in rows])
+            return [
+                {
+                    "emp_id": row.emp_id,
+                    "name": row.name,
+                    "division": row.division or "Unassigned",
+                    "items": items_by_employee.get(row.emp_id, [])
+                } for row in rows
+            ]
+
+        return paginate(query, [Employee.emp_id], cursor, page_size, transform=transform)
+
+def get_employee_details_with_items_many(emp_ids, chunk_size: int = 500):
+    """
+    Retrieve the details and items of the given employees
+
+    Runs the page queries per chunk of IDs, so a large change event stays
+    well under SQLite's bound variable limit.
+
+    Args:
+        emp_ids (iterable): Employee IDs
+        chunk_size (int, optional): IDs looked up per query
+
+    Returns:
+        Dictionary of {emp_id: details shaped as in get_employee_details_with_items},
+        employees that do not exist are left out
+    """
+    emp_ids = list(emp_ids)
+    details = {}
+    with session_scope() as db:
+        for start in range(0, len(emp_ids), chunk_size):
+            rows = (
+                db.query(Employee.emp_id, Employee.name, Division.name.label("division"))
+                .outerjoin(Division, Employee.division_id == Division.division_id)
+                .filter(Employee.emp_id.in_(emp_ids[start:start + chunk_size]))
+                .all()
+            )
+            items_by_employee = load_employee_items(db, [row.emp_id for row in rows])
+            for row in rows:
+                details[row.emp_id] = {
+                    "emp_id": row.emp_id,
+                    "name": row.name,
+                    "division": row.division or "Unassigned",
+                    "items": items_by_employee.get(row.emp_id, [])
+                }
+    return details
+
 def delete_employee(emp_id: str):
     with session_scope() as db:
         employee = get_employee(emp_id)
         if employee:
+            adjust_division_counter(
+                db, employee.division_id,
+                employees=-1,
+                items=-count_employee_assignments(db, emp_id)
+            )
+            # Keep transfer history but detach it, foreign keys are enforced
+            db.query(ItemTransferHistory).filter(ItemTransferHistory.from_emp_id == emp_id).update(
+                {ItemTransferHistory.from_emp_id: None}, synchronize_session=False
+            )
+            db.query(ItemTransferHistory).filter(ItemTransferHistory.to_emp_id == emp_id).update(
+                {ItemTransferHistory.to_emp_id: None}, synchronize_session=False
+            )
             db.delete(employee)
             db.commit()
+            bump_version("employees", "assignments", "transfers")
+            publish_change("employee_deleted", emp_ids=[emp_id])
         db.close()
         return employee
 
+def assignment_event_keys(db: Session, assignment_id: int):
+    """The emp_ids and item_ids keys of change events about one assignment"""
+    assignment = db.query(EmployeeItem.emp_id, EmployeeItem.item_id).filter(EmployeeItem.id == assignment_id).first()
+    if assignment is None:
+        return {"emp_ids": [], "item_ids": []}
+    return {"emp_ids": [assignment.emp_id], "item_ids": [assignment.item_id]}
+
 def add_item_attribute(item_id: int, name: str, value: str):
     with session_scope() as db:
         attribute = EmployeeItemAttribute(emp_item_id=item_id, name=name, value=value)
         db.add(attribute)
         db.commit()
+        publish_change("assignment_updated", **assignment_event_keys(db, item_id))
         db.close()
         return attribute
 
@@ -419,6 +565,7 @@ def update_item_attribute(item_id: int, name: str, new_value: str):
         if attribute:
             attribute.value = new_value
             db.commit()
+            publish_change("assignment_updated", **assignment_event_keys(db, item_id))
         db.close()
         return attribute
         
@@ -426,6 +573,7 @@ def delete_item_attributes(item_id: int):
     with session_scope() as db:
         db.query(EmployeeItemAttribute).filter(EmployeeItemAttribute.emp_item_id == item_id).delete()
         db.commit()
+        publish_change("assignment_updated", **assignment_event_keys(db, item_id))
         db.close()
 
 def delete_item_attribute(item_id: int, name: str):
@@ -435,6 +583,7 @@ def delete_item_attribute(item_id: int, name: str):
             EmployeeItemAttribute.name == name
         ).delete()
         db.commit()
+        publish_change("assignment_updated", **assignment_event_keys(db, item_id))
         db.close()
 
 
@@ -444,7 +593,10 @@ def create_item(name: str):
         item = Item(name=name)
         
         db.add(item)
+        db.flush()
+        create_item_counter(db, item.item_id)
         db.commit()
+        bump_version("items")
         db.refresh(item)
 
         # Add attributes if provided
@@ -455,6 +607,7 @@ def create_item(name: str):
         
         db.commit()
         x = item.item_id
+        publish_change("item_created", item_ids=[x])
         db.close()
         return x
     
@@ -476,16 +629,19 @@ def update_item_details(item_dict):
             if name is not None:
                 item.name = name
             
-            db.commit()
-            
-            # Refresh and return the updated item
-            db.refresh(item)
-            
             # Log the action
             log_action(
                 action_type="update_item", 
-                details=f"Updated item {item_id} details"
+                details=f"Updated item {item_id} details",
+                db=db
             )
+            
+            db.commit()
+            bump_version("items")
+            publish_change("item_updated", item_ids=[item_id])
+            
+            # Refresh and return the updated item
+            db.refresh(item)
             db.close()
             return item
     
@@ -512,12 +668,27 @@ def get_all_items():
     db.close()
     return items
 
+def get_all_items_page(cursor: str = None, page_size: int = PAGE_SIZE):
+    """
+    Page through items ordered by item_id
+
+    Returns:
+        Page dictionary whose items are {'item_id', 'name'} dictionaries
+    """
+    with session_scope() as db:
+        return paginate(
+            db.query(Item.item_id, Item.name), [Item.item_id], cursor, page_size,
+            transform=lambda rows: [{'item_id': row.item_id, 'name': row.name} for row in rows]
+        )
+
+@cached("items")
 def get_all_items_names_dict():
     with session_scope() as db:
         items = db.query(Item).all()
         db.close()
         return {item.name: item.item_id for item in items}
 
+@cached("items")
 def get_all_items_with_no_attrs():
     """
     Retrieve a list of all item names from the database
@@ -542,6 +713,7 @@ def get_all_items_with_no_attrs():
 
 # Alternative implementations:
 
+@cached("items")
 def get_all_items_names_set():
     """
     Retrieve unique item names as a set
@@ -563,21 +735,19 @@ def delete_item(item_id: int):
     with session_scope() as db:
         item = db.query(Item).filter(Item.item_id == item_id).first()
         if item:
+            # Keep transfer history but detach it, foreign keys are enforced
+            db.query(ItemTransferHistory).filter(ItemTransferHistory.item_id == item_id).update(
+                {ItemTransferHistory.item_id: None}, synchronize_session=False
+            )
             db.delete(item)
+            delete_item_counter(db, item_id)
             db.commit()
+            bump_version("items", "assignments", "transfers")
+            publish_change("item_deleted", item_ids=[item_id])
             db.close()
             return True
     return False
 
-# Log Action
-def log_action(action_type: str, details: str, user_id: int = None):
-    with session_scope() as db:
-        log_entry = Log(action_type=action_type, details=details, user_id=user_id, timestamp=datetime.utcnow())
-        db.add(log_entry)
-        db.commit()
-        db.close()
-        return log_entry
-
 def save_item_attribute(emp_id, item_id, name, value):
     with session_scope() as db:
         try:
@@ -604,6 +774,7 @@ def save_item_attribute(emp_id, item_id, name, value):
                 db.add(new_attribute)
 
             db.commit()
+            publish_change("assignment_updated", emp_ids=[emp_id], item_ids=[item_id])
             return True
         except Exception as e:
             db.rollback()
@@ -626,6 +797,7 @@ def remove_item_attribute(emp_id, item_id, name):
             if attribute:
                 db.delete(attribute)
                 db.commit()
+                publish_change("assignment_updated", emp_ids=[emp_id], item_ids=[item_id])
                 return True
             else:
                 raise ValueError("Attribute not found")
@@ -651,12 +823,13 @@ def assign_item_to_employee(emp_id: str, item_id: int, unique_key: str, attrs: d
             notes=notes
         )
         db.add(employee_item)
-        db.commit()
+        db.flush()  # Flush to get the employee_item.id
 
-        # Update item count and log assignment
+        # Update item count and counters in the same transaction
         employee = db.query(Employee).filter(Employee.emp_id == emp_id).first()
         employee.item_count += 1
-        db.commit()
+        adjust_division_counter(db, employee.division_id, items=1)
+        adjust_item_counter(db, item_id, assignments=1)
 
         # Add attribute details
         for name, value in attrs.items():
@@ -667,10 +840,113 @@ def assign_item_to_employee(emp_id: str, item_id: int, unique_key: str, attrs: d
             )
             db.add(attribute)
         db.commit()
+        bump_version("assignments")
+        publish_change("assignment_created", emp_ids=[emp_id], item_ids=[item_id])
 
         # Log the action
         db.close()
         return True
+
+def bulk_assign_items(assignments: list):
+    """
+    Assign many items in a single transaction
+
+    Item and employee IDs are validated with one query each, assignments and
+    attributes are inserted with executemany, and Employee.item_count is
+    updated with a single UPDATE before the one commit.
+
+    Args:
+        assignments (list): Dictionaries with keys emp_id, item_id, unique_key
+                            and optionally attrs (dict) and notes (str)
+
+    Returns:
+        List of per-row result dictionaries in input order, each with
+        emp_id, item_id, unique_key, success and error
+    """
+    results = [
+        {
+            "emp_id": row.get("emp_id"),
+            "item_id": row.get("item_id"),
+            "unique_key": row.get("unique_key"),
+            "success": False,
+            "error": None
+        } for row in assignments
+    ]
+    if not assignments:
+        return results
+
+    with session_scope() as db:
+        # Validate item and employee IDs with one query each
+        item_ids = {row.get("item_id") for row in assignments}
+        known_items = {
+            item_id for (item_id,) in db.query(Item.item_id).filter(Item.item_id.in_(item_ids))
+        }
+        emp_ids = {row.get("emp_id") for row in assignments}
+        employee_divisions = dict(
+            db.query(Employee.emp_id, Employee.division_id).filter(Employee.emp_id.in_(emp_ids)).all()
+        )
+
+        valid_rows = []
+        for index, row in enumerate(assignments):
+            if row.get("item_id") not in known_items:
+                results[index]["error"] = f"Item with ID {row.get('item_id')} not found"
+            elif row.get("emp_id") not in employee_divisions:
+                results[index]["error"] = f"Employee with ID {row.get('emp_id')} not found"
+            else:
+                valid_rows.append(index)
+
+        if not valid_rows:
+            return results
+
+        # Insert all assignments, getting their IDs back in input order
+        now = datetime.utcnow()
+        emp_item_ids = db.execute(
+            insert(EmployeeItem).returning(EmployeeItem.id, sort_by_parameter_order=True),
+            [
+                {
+                    "emp_id": assignments[index]["emp_id"],
+                    "item_id": assignments[index]["item_id"],
+                    "unique_key": assignments[index].get("unique_key"),
+                    "date_assigned": now,
+                    "notes": assignments[index].get("notes", "")
+                } for index in valid_rows
+            ]
+        ).scalars().all()
+
+        # Insert all attributes
+        attribute_rows = [
+            {"emp_item_id": emp_item_id, "name": name, "value": value}
+            for index, emp_item_id in zip(valid_rows, emp_item_ids)
+            for name, value in (assignments[index].get("attrs") or {}).items()
+        ]
+        if attribute_rows:
+            db.execute(insert(EmployeeItemAttribute), attribute_rows)
+
+        # Update item counts with a single statement
+        per_employee, per_division, per_item = Counter(), Counter(), Counter()
+        for index in valid_rows:
+            row = assignments[index]
+            per_employee[row["emp_id"]] += 1
+            per_division[employee_divisions[row["emp_id"]]] += 1
+            per_item[row["item_id"]] += 1
+
+        db.query(Employee).filter(Employee.emp_id.in_(per_employee.keys())).update(
+            {Employee.item_count: func.coalesce(Employee.item_count, 0) + case(per_employee, value=Employee.emp_id, else_=0)},
+            synchronize_session=False
+        )
+        for division_id, count in per_division.items():
+            adjust_division_counter(db, division_id, items=count)
+        for item_id, count in per_item.items():
+            adjust_item_counter(db, item_id, assignments=count)
+
+        db.commit()
+        bump_version("assignments")
+        publish_change("assignment_created", emp_ids=list(per_employee), item_ids=list(per_item))
+
+        for index in valid_rows:
+            results[index]["success"] = True
+
+        return results
       
 # Item Transfer
 def transfer_item(from_emp_id: str, to_emp_id: str, item_id: int, unique_key: str, notes: str = "") -> bool:
@@ -704,6 +980,7 @@ def transfer_item(from_emp_id: str, to_emp_id: str, item_id: int, unique_key: st
             from_employee = db.query(Employee).filter(Employee.emp_id == from_emp_id).first()
             if from_employee:
                 from_employee.item_count -= 1
+                adjust_division_counter(db, from_employee.division_id, items=-1)
 
             # Create a new assignment for the to_employee
             new_assignment = EmployeeItem(
@@ -729,9 +1006,10 @@ def transfer_item(from_emp_id: str, to_emp_id: str, item_id: int, unique_key: st
             to_employee = db.query(Employee).filter(Employee.emp_id == to_emp_id).first()
             if to_employee:
                 to_employee.item_count += 1
+                adjust_division_counter(db, to_employee.division_id, items=1)
 
             # Log the transfer
-            log_action(action_type="transfer_item", details=f"Transferred item {item_id} from {from_emp_id} to {to_emp_id}")
+            log_action(action_type="transfer_item", details=f"Transferred item {item_id} from {from_emp_id} to {to_emp_id}", db=db)
 
             # Add a record to ItemTransferHistory
             transfer_record = ItemTransferHistory(
@@ -749,6 +1027,8 @@ def transfer_item(from_emp_id: str, to_emp_id: str, item_id: int, unique_key: st
             
             # Commit the transaction
             db.commit()
+            bump_version("assignments", "transfers")
+            publish_change("assignment_transferred", emp_ids=[from_emp_id, to_emp_id], item_ids=[item_id])
             return True
 
         except Exception as e:
@@ -757,6 +1037,90 @@ def transfer_item(from_emp_id: str, to_emp_id: str, item_id: int, unique_key: st
             log_action(action_type="error", details=f"Error transferring item {item_id} from {from_emp_id} to {to_emp_id}: {str(e)}")
             return False
         
+def transfer_items_bulk(from_emp_id: str, to_emp_id: str, assignment_ids: list, notes: str = ""):
+    """
+    Move many assignments from one employee to another in one transaction
+
+    Assignments are moved in place by changing their emp_id, so their
+    attributes stay attached without copying. Transfer history rows are
+    inserted with one executemany, and the employee and division counts
+    are adjusted once for the whole batch.
+
+    Args:
+        from_emp_id (str): Employee currently holding the items
+        to_emp_id (str): Employee receiving the items
+        assignment_ids (list): EmployeeItem IDs to move
+        notes (str, optional): Stored on every transfer history row
+
+    Returns:
+        Dictionary with the number of transferred assignments
+
+    Raises:
+        ValueError: If an employee is missing or an assignment does not belong
+                    to from_emp_id; nothing is transferred in that case
+    """
+    assignment_ids = list(dict.fromkeys(assignment_ids))
+    if from_emp_id == to_emp_id:
+        raise ValueError("Source and destination employee must differ")
+    if not assignment_ids:
+        return {"transferred": 0}
+
+    with session_scope() as db:
+        employees = {
+            emp.emp_id: emp for emp in
+            db.query(Employee).filter(Employee.emp_id.in_([from_emp_id, to_emp_id])).all()
+        }
+        for emp_id in (from_emp_id, to_emp_id):
+            if emp_id not in employees:
+                raise ValueError(f"Employee {emp_id} not found")
+
+        assignments = (
+            db.query(EmployeeItem.id, EmployeeItem.item_id)
+            .filter(EmployeeItem.id.in_(assignment_ids), EmployeeItem.emp_id == from_emp_id)
+            .all()
+        )
+        missing = set(assignment_ids) - {assignment.id for assignment in assignments}
+        if missing:
+            raise ValueError(f"Assignments not held by {from_emp_id}: {', '.join(map(str, sorted(missing)))}")
+
+        now = datetime.utcnow()
+        db.query(EmployeeItem).filter(EmployeeItem.id.in_(assignment_ids)).update(
+            {EmployeeItem.emp_id: to_emp_id, EmployeeItem.date_assigned: now},
+            synchronize_session=False
+        )
+        db.execute(insert(ItemTransferHistory), [
+            {
+                "item_id": assignment.item_id,
+                "from_emp_id": from_emp_id,
+                "to_emp_id": to_emp_id,
+                "transfer_date": now,
+                "notes": notes
+            } for assignment in assignments
+        ])
+
+        # Item counters are unchanged, the assignments only change hands
+        count = len(assignments)
+        source, destination = employees[from_emp_id], employees[to_emp_id]
+        source.item_count = (source.item_count or 0) - count
+        destination.item_count = (destination.item_count or 0) + count
+        if source.division_id != destination.division_id:
+            adjust_division_counter(db, source.division_id, items=-count)
+            adjust_division_counter(db, destination.division_id, items=count)
+
+        log_action(
+            action_type="transfer_item",
+            details=f"Transferred {count} items from {from_emp_id} to {to_emp_id}",
+            db=db
+        )
+        db.commit()
+        bump_version("assignments", "transfers")
+        publish_change(
+            "assignment_transferred",
+            emp_ids=[from_emp_id, to_emp_id],
+            item_ids=list(dict.fromkeys(assignment.item_id for assignment in assignments))
+        )
+        return {"transferred": count}
+
 # Update Employee Info
 def update_employee(emp_id: str, new_name: str = None, new_division_id: int = None):
     with session_scope() as db:
@@ -764,11 +1128,17 @@ def update_employee(emp_id: str, new_name: str = None, new_division_id: int = No
         if employee:
             if new_name:
                 employee.name = new_name
-            if new_division_id:
+            if new_division_id and new_division_id != employee.division_id:
+                # Move the employee and their items between division counters
+                assigned = count_employee_assignments(db, emp_id)
+                adjust_division_counter(db, employee.division_id, employees=-1, items=-assigned)
+                adjust_division_counter(db, new_division_id, employees=1, items=assigned)
                 employee.division_id = new_division_id
+            log_action(action_type="update_employee", details=f"Updated employee {emp_id} details", db=db)
             db.commit()
+            bump_version("employees")
+            publish_change("employee_updated", emp_ids=[emp_id])
             db.refresh(employee)
-            log_action(action_type="update_employee", details=f"Updated employee {emp_id} details")
             db.close()
             return employee
     return None
@@ -783,18 +1153,41 @@ def update_employee_id(old_emp_id: str, new_emp_id: str):
                 logger.warning(f"Employee with ID {old_emp_id} not found")
                 return None
             
-            # Update the employee ID
-            employee.emp_id = new_emp_id
-            
-            # Commit the changes
-            db.commit()
-            db.refresh(employee)
+            # Foreign keys are enforced without ON UPDATE CASCADE, so the employee
+            # is copied under the new ID, its assignments and transfer history are
+            # re-pointed to the copy and the old row is removed, all in this
+            # transaction. Counts move with the employee and need no adjustment.
+            db.expunge(employee)
+            db.execute(insert(Employee), [{
+                "emp_id": new_emp_id,
+                "name": employee.name,
+                "division_id": employee.division_id,
+                "item_count": employee.item_count,
+                "date_joined": employee.date_joined
+            }])
+            db.query(EmployeeItem).filter(EmployeeItem.emp_id == old_emp_id).update(
+                {EmployeeItem.emp_id: new_emp_id}, synchronize_session=False
+            )
+            db.query(ItemTransferHistory).filter(ItemTransferHistory.from_emp_id == old_emp_id).update(
+                {ItemTransferHistory.from_emp_id: new_emp_id}, synchronize_session=False
+            )
+            db.query(ItemTransferHistory).filter(ItemTransferHistory.to_emp_id == old_emp_id).update(
+                {ItemTransferHistory.to_emp_id: new_emp_id}, synchronize_session=False
+            )
+            db.query(Employee).filter(Employee.emp_id == old_emp_id).delete(synchronize_session=False)
             
             # Log the action
             log_action(
                 action_type="update_employee_id", 
-                details=f"Changed employee ID from {old_emp_id} to {new_emp_id}"
+                details=f"Changed employee ID from {old_emp_id} to {new_emp_id}",
+                db=db
             )
+            
+            # Commit the changes
+            db.commit()
+            bump_version("employees", "assignments")
+            publish_change("employee_id_changed", emp_ids=[old_emp_id], new_emp_ids=[new_emp_id])
+            employee = db.query(Employee).filter(Employee.emp_id == new_emp_id).first()
             db.close()
             
             return employee
@@ -830,12 +1223,16 @@ def remove_item_from_employee(emp_id: str, item_id: int) -> bool:
                 employee = db.query(Employee).filter(Employee.emp_id == emp_id).first()
                 if employee:
                     employee.item_count -= 1
+                    adjust_division_counter(db, employee.division_id, items=-1)
+                adjust_item_counter(db, item_id, assignments=-1)
 
                 # Log the action
-                log_action(action_type="remove_item", details=f"Removed item {item_id} from employee {emp_id}")
+                log_action(action_type="remove_item", details=f"Removed item {item_id} from employee {emp_id}", db=db)
 
                 # Commit the transaction
                 db.commit()
+                bump_version("assignments")
+                publish_change("assignment_deleted", emp_ids=[emp_id], item_ids=[item_id])
                 return True
             else:
                 # If no assignment was found, return False
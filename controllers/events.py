@@ -0,0 +1,78 @@
+# controllers/events.py
+
+import threading
+from venv import logger
+
+# Change events published by the CRUD layer once a write has committed.
+# Keys are lists, so a bulk write publishes one event for the whole batch:
+#   division_created, division_updated, division_deleted         division_ids
+#   employee_created, employee_updated, employee_deleted         emp_ids
+#   employee_id_changed                                          emp_ids (old), new_emp_ids
+#   item_created, item_updated, item_deleted                     item_ids
+#   assignment_created, assignment_updated, assignment_deleted   emp_ids, item_ids
+#   assignment_transferred                                       emp_ids (source and destination), item_ids
+EVENT_TYPES = (
+    "division_created", "division_updated", "division_deleted",
+    "employee_created", "employee_updated", "employee_deleted", "employee_id_changed",
+    "item_created", "item_updated", "item_deleted",
+    "assignment_created", "assignment_updated", "assignment_deleted", "assignment_transferred"
+)
+ALL_EVENTS = "*"
+
+class ChangeBus:
+    """
+    In-process publish/subscribe for data changes.
+
+    Handlers run on the publishing thread, possibly while the writer's
+    session is still open, so they should only note the change; screens
+    queue it and read the database later (see gui.tasks.listen_for_changes).
+    A failing handler is logged and affects neither the write nor the
+    other handlers.
+    """
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.handlers = {}  # event type or ALL_EVENTS -> list of handlers
+
+    def subscribe(self, event_type: str, handler):
+        if event_type != ALL_EVENTS and event_type not in EVENT_TYPES:
+            raise ValueError(f"Unknown change event: {event_type}")
+        with self.lock:
+            self.handlers.setdefault(event_type, []).append(handler)
+        return handler
+
+    def unsubscribe(self, event_type: str, handler):
+        with self.lock:
+            handlers = self.handlers.get(event_type, [])
+            if handler in handlers:
+                handlers.remove(handler)
+
+    def publish(self, event_type: str, **keys):
+        """
+        Send an event to its subscribers and to those of ALL_EVENTS
+
+        Returns:
+            The event dictionary: {"type": event_type, **keys}
+        """
+        event = {"type": event_type, **keys}
+        with self.lock:
+            handlers = self.handlers.get(event_type, []) + self.handlers.get(ALL_EVENTS, [])
+        for handler in handlers:
+            try:
+                handler(event)
+            except Exception as e:
+                logger.error(f"Change handler for {event_type} failed: {str(e)}")
+        return event
+
+# Shared bus for the application
+change_bus = ChangeBus()
+
+def subscribe_changes(event_type: str, handler):
+    """Call handler(event) for every event_type event, or for all events with "*" """
+    return change_bus.subscribe(event_type, handler)
+
+def unsubscribe_changes(event_type: str, handler):
+    change_bus.unsubscribe(event_type, handler)
+
+def publish_change(event_type: str, **keys):
+    """Publish a change event, called by the CRUD layer after a write commits"""
+    return change_bus.publish(event_type, **keys)
@@ -0,0 +1,255 @@
+# controllers/instrumentation.py
+
+import atexit
+import heapq
+import itertools
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from functools import wraps
+from venv import logger
+from sqlalchemy import event
+from models.database import engine
+from config import QUERY_INSTRUMENTATION, QUERY_REPORT_TOP, QUERY_SLOWEST_KEPT
+
+# Call sites are the innermost frames of this project's own code. Modules that
+# hook engine events add themselves to CALL_STACK_IGNORED_FILES.
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CALL_STACK_IGNORED_FILES = {os.path.abspath(__file__), os.path.join(PROJECT_ROOT, "models", "database.py")}
+
+def find_call_stack(limit: int = None):
+    """
+    List the project frames of the current stack, innermost first
+
+    Frames of SQLAlchemy, the standard library, installed packages and the
+    session plumbing are skipped.
+
+    Returns:
+        List of "path:line function" strings, paths relative to the project
+    """
+    stack = []
+    frame = sys._getframe(1)
+    while frame is not None and (limit is None or len(stack) < limit):
+        filename = os.path.abspath(frame.f_code.co_filename)
+        if (filename.startswith(PROJECT_ROOT) and filename not in CALL_STACK_IGNORED_FILES
+                and "site-packages" not in filename):
+            stack.append(f"{os.path.relpath(filename, PROJECT_ROOT)}:{frame.f_lineno} {frame.f_code.co_name}")
+        frame = frame.f_back
+    return stack
+
+class QueryInstrumentation:
+    """
+    Aggregates the statements sent through an engine.
+
+    While enabled, every statement is timed between the before and after
+    cursor execute events and counted against the project line that issued
+    it. Statements also count towards every measurement scope open on the
+    thread that ran them, so a scope reports everything its screen or
+    controller call did, nested calls included.
+    """
+    def __init__(self, slowest_kept: int = QUERY_SLOWEST_KEPT):
+        self.slowest_kept = slowest_kept
+        self.lock = threading.Lock()
+        self.local = threading.local()
+        self.bind = None
+        self.reset()
+
+    @property
+    def enabled(self):
+        return self.bind is not None
+
+    def enable(self, bind=engine):
+        """Start listening to the engine's cursor events"""
+        with self.lock:
+            if self.bind is not None:
+                return
+            event.listen(bind, "before_cursor_execute", self._before_execute)
+            event.listen(bind, "after_cursor_execute", self._after_execute)
+            event.listen(bind, "handle_error", self._handle_error)
+            self.bind = bind
+
+    def disable(self):
+        """Stop listening; the collected statistics are kept"""
+        with self.lock:
+            if self.bind is None:
+                return
+            event.remove(self.bind, "before_cursor_execute", self._before_execute)
+            event.remove(self.bind, "after_cursor_execute", self._after_execute)
+            event.remove(self.bind, "handle_error", self._handle_error)
+            self.bind = None
+
+    def reset(self):
+        """Drop the collected statistics"""
+        with self.lock:
+            self.call_sites = {}  # "path:line function" -> totals
+            self.scopes = {}  # scope name -> totals
+            self.slowest = []  # min-heap of (elapsed_ms, sequence, record)
+            self.sequence = itertools.count()
+            self.statements = 0
+            self.total_ms = 0.0
+
+    def _before_execute(self, conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_start_times", []).append(time.perf_counter())
+
+    def _after_execute(self, conn, cursor, statement, parameters, context, executemany):
+        elapsed_ms = (time.perf_counter() - conn.info["query_start_times"].pop()) * 1000
+        self.record(statement, elapsed_ms, (find_call_stack(limit=1) or ["<unknown>"])[0])
+
+    def _handle_error(self, exception_context):
+        # A failed statement never reaches after_cursor_execute
+        if exception_context.connection is not None:
+            start_times = exception_context.connection.info.get("query_start_times")
+            if start_times:
+                start_times.pop()
+
+    def _open_scopes(self):
+        if not hasattr(self.local, "scopes"):
+            self.local.scopes = []
+        return self.local.scopes
+
+    def record(self, statement: str, elapsed_ms: float, call_site: str):
+        """Count one statement against its call site and the open scopes"""
+        scopes = self._open_scopes()
+        with self.lock:
+            self.statements += 1
+            self.total_ms += elapsed_ms
+
+            site = self.call_sites.setdefault(call_site, {"count": 0, "total_ms": 0.0, "max_ms": 0.0, "statement": statement})
+            site["count"] += 1
+            site["total_ms"] += elapsed_ms
+            if elapsed_ms >= site["max_ms"]:
+                site["max_ms"] = elapsed_ms
+                site["statement"] = statement
+
+            for scope in scopes:
+                scope["statements"] += 1
+                scope["query_ms"] += elapsed_ms
+
+            record = {
+                "elapsed_ms": elapsed_ms,
+                "call_site": call_site,
+                "scope": scopes[-1]["name"] if scopes else None,
+                "statement": statement
+            }
+            entry = (elapsed_ms, next(self.sequence), record)
+            if len(self.slowest) < self.slowest_kept:
+                heapq.heappush(self.slowest, entry)
+            elif elapsed_ms > self.slowest[0][0]:
+                heapq.heapreplace(self.slowest, entry)
+
+    @contextmanager
+    def measure(self, name: str):
+        """
+        Open a named measurement scope on the current thread
+
+        Yields:
+            Dictionary with the name and the running statements and query_ms
+            of this use of the scope
+        """
+        scope = {"name": name, "statements": 0, "query_ms": 0.0}
+        scopes = self._open_scopes()
+        scopes.append(scope)
+        started = time.perf_counter()
+        try:
+            yield scope
+        finally:
+            wall_ms = (time.perf_counter() - started) * 1000
+            scopes.pop()
+            if self.enabled:
+                self._add_scope_totals(scope, wall_ms)
+
+    def _add_scope_totals(self, scope: dict, wall_ms: float):
+        with self.lock:
+            totals = self.scopes.setdefault(scope["name"], {
+                "calls": 0, "statements": 0, "max_statements": 0, "query_ms": 0.0, "wall_ms": 0.0
+            })
+            totals["calls"] += 1
+            totals["statements"] += scope["statements"]
+            totals["max_statements"] = max(totals["max_statements"], scope["statements"])
+            totals["query_ms"] += scope["query_ms"]
+            totals["wall_ms"] += wall_ms
+
+    def report(self, top: int = QUERY_REPORT_TOP):
+        """
+        Summarize the worst offenders
+
+        Returns:
+            Dictionary with statements and total_ms overall, plus the top
+            call_sites by total time, scopes by query time and the slowest
+            statements, each a list of dictionaries
+        """
+        with self.lock:
+            call_sites = sorted(self.call_sites.items(), key=lambda item: item[1]["total_ms"], reverse=True)[:top]
+            scopes = sorted(self.scopes.items(), key=lambda item: item[1]["query_ms"], reverse=True)[:top]
+            slowest = sorted(self.slowest, reverse=True)[:top]
+            return {
+                "statements": self.statements,
+                "total_ms": self.total_ms,
+                "call_sites": [{"call_site": name, **totals} for name, totals in call_sites],
+                "scopes": [{"name": name, **totals} for name, totals in scopes],
+                "slowest": [dict(record) for _, _, record in slowest]
+            }
+
+def _one_line(statement: str, width: int = 160):
+    text = " ".join(statement.split())
+    return text if len(text) <= width else text[:width - 3] + "..."
+
+def format_query_report(report: dict = None):
+    """Render a report from get_query_report as plain text"""
+    report = report or get_query_report()
+    lines = [f"{report['statements']} statements, {report['total_ms']:.1f} ms in total", "", "Call sites by total time:"]
+    for site in report["call_sites"]:
+        lines.append(f"  {site['total_ms']:9.1f} ms  {site['count']:6d}x  max {site['max_ms']:7.1f} ms  {site['call_site']}")
+    lines += ["", "Scopes by query time:"]
+    for scope in report["scopes"]:
+        lines.append(
+            f"  {scope['query_ms']:9.1f} ms  {scope['calls']:6d} calls  "
+            f"{scope['statements'] / scope['calls']:7.1f} statements/call (max {scope['max_statements']})  {scope['name']}"
+        )
+    lines += ["", "Slowest statements:"]
+    for record in report["slowest"]:
+        lines.append(f"  {record['elapsed_ms']:9.1f} ms  {record['call_site']}  [{record['scope'] or '-'}]")
+        lines.append(f"      {_one_line(record['statement'])}")
+    return "\n".join(lines)
+
+# Shared instrumentation for the application engine
+query_instrumentation = QueryInstrumentation()
+
+def enable_instrumentation(bind=engine):
+    """Start collecting query statistics, see QueryInstrumentation"""
+    query_instrumentation.enable(bind)
+
+def disable_instrumentation():
+    query_instrumentation.disable()
+
+def measure(name: str):
+    """Context manager for a named measurement scope, e.g. with measure("Dashboard.display"): ..."""
+    return query_instrumentation.measure(name)
+
+def instrumented(name: str = None):
+    """Decorator that runs every call of a function inside a measurement scope named after it"""
+    def decorator(func):
+        scope_name = name or f"{func.__module__}.{func.__qualname__}"
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with query_instrumentation.measure(scope_name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+def get_query_report(top: int = QUERY_REPORT_TOP):
+    return query_instrumentation.report(top)
+
+def reset_query_stats():
+    query_instrumentation.reset()
+
+def log_query_report(top: int = QUERY_REPORT_TOP):
+    """Write the top offenders to the application log"""
+    logger.info("Query report\n" + format_query_report(get_query_report(top)))
+
+if QUERY_INSTRUMENTATION:
+    enable_instrumentation()
+    atexit.register(log_query_report)
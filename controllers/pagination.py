@@ -0,0 +1,112 @@
+# controllers/pagination.py
+
+import base64
+import json
+from datetime import date, datetime
+from sqlalchemy import func, tuple_
+from sqlalchemy.orm import Query
+from config import PAGE_SIZE, COUNT_ESTIMATE_LIMIT
+
+# Cursors are opaque strings holding the sort key of the last row of a page.
+# Dates are tagged so they decode back to the same type they were read as.
+def _encode_value(value):
+    if isinstance(value, datetime):
+        return {"$datetime": value.isoformat()}
+    if isinstance(value, date):
+        return {"$date": value.isoformat()}
+    raise TypeError(f"Cannot store {type(value).__name__} in a cursor")
+
+def _decode_value(value):
+    if "$datetime" in value:
+        return datetime.fromisoformat(value["$datetime"])
+    if "$date" in value:
+        return date.fromisoformat(value["$date"])
+    return value
+
+def encode_cursor(values) -> str:
+    data = json.dumps(list(values), default=_encode_value, separators=(",", ":"))
+    return base64.urlsafe_b64encode(data.encode()).decode()
+
+def decode_cursor(cursor: str) -> list:
+    try:
+        return json.loads(base64.urlsafe_b64decode(cursor.encode()), object_hook=_decode_value)
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"Invalid page cursor: {cursor!r}") from e
+
+def estimate_total(query: Query, limit: int = COUNT_ESTIMATE_LIMIT):
+    """
+    Count the rows of a query, stopping at limit so huge tables stay cheap
+
+    Returns:
+        Tuple of (count, exact); exact is False when the count stopped at the limit
+    """
+    bounded = query.order_by(None).limit(limit + 1).subquery()
+    count = query.session.query(func.count()).select_from(bounded).scalar()
+    if count > limit:
+        return limit, False
+    return count, True
+
+def paginate(query: Query, order_by: list, cursor: str = None, page_size: int = PAGE_SIZE,
+             descending: bool = False, key=None, transform=None):
+    """
+    Fetch one page of a query with keyset (cursor) pagination
+
+    Rows are ordered by the order_by columns, which must end with a unique
+    column so the order is stable. The next page starts right after the
+    last row's sort key, so every page costs the same however deep it is
+    and rows inserted meanwhile never shift or repeat entries.
+
+    Args:
+        query (Query): Filtered query without ORDER BY, LIMIT or OFFSET
+        order_by (list): Sort columns, the last one unique
+        cursor (str, optional): next_cursor of the previous page, None for the first page
+        page_size (int, optional): Maximum number of rows per page
+        descending (bool, optional): Sort all columns newest/highest first
+        key (callable, optional): Returns the sort values of a row, defaults to
+                                  reading the order_by column names from the row
+        transform (callable, optional): Converts the page rows into the returned items
+
+    Returns:
+        Dictionary with items, next_cursor (None on the last page), has_more,
+        page_size and, for the first page only, total and total_exact
+    """
+    if page_size < 1:
+        raise ValueError("page_size must be at least 1")
+    if key is None:
+        key = lambda row: [getattr(row, column.key) for column in order_by]
+
+    page = {"page_size": page_size}
+    if cursor is None:
+        page["total"], page["total_exact"] = estimate_total(query)
+    else:
+        after = decode_cursor(cursor)
+        if len(after) != len(order_by):
+            raise ValueError("Page cursor does not match the query ordering")
+        keys, values = tuple_(*order_by), tuple_(*after)
+        query = query.filter(keys < values if descending else keys > values)
+
+    query = query.order_by(*[column.desc() if descending else column.asc() for column in order_by])
+
+    # One extra row tells whether another page follows
+    rows = query.limit(page_size + 1).all()
+    page["has_more"] = len(rows) > page_size
+    rows = rows[:page_size]
+    page["next_cursor"] = encode_cursor(key(rows[-1])) if page["has_more"] else None
+    page["items"] = transform(rows) if transform else rows
+    return page
+
+def iter_pages(fetch_page, *args, **kwargs):
+    """
+    Yield every item of a paginated listing, fetching one page at a time
+
+    Args:
+        fetch_page (callable): Paginated function accepting a cursor keyword, e.g. search_logs_page
+        *args, **kwargs: Passed to fetch_page on every call
+    """
+    cursor = None
+    while True:
+        page = fetch_page(*args, cursor=cursor, **kwargs)
+        yield from page["items"]
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
@@ -0,0 +1,187 @@
+# controllers/retention.py
+
+import glob
+import gzip
+import json
+import os
+from collections import Counter
+from datetime import datetime, timedelta, date
+from sqlalchemy import func
+from sqlalchemy.dialects.sqlite import insert
+from models.models import Log, LogDailySummary
+from models.database import session_scope
+from controllers.audit import flush_audit_log
+from config import LOG_RETENTION_DAYS, LOG_ARCHIVE_DIR, LOG_RETENTION_BATCH_SIZE
+
+# Archived logs are appended to one gzip JSONL file per month, e.g.
+# log_archive/logs-2024-01.jsonl.gz, one JSON object per log entry.
+ARCHIVE_PATTERN = "logs-{month}.jsonl.gz"
+
+def _archive_path(archive_dir: str, day: datetime):
+    return os.path.join(archive_dir, ARCHIVE_PATTERN.format(month=day.strftime("%Y-%m")))
+
+def _write_archive(archive_dir: str, entries: list):
+    """Append entries to their monthly archive files and sync them to disk"""
+    os.makedirs(archive_dir, exist_ok=True)
+    by_file = {}
+    for entry in entries:
+        by_file.setdefault(_archive_path(archive_dir, entry.timestamp), []).append(entry)
+
+    for path, file_entries in by_file.items():
+        with open(path, "ab") as raw:
+            with gzip.GzipFile(fileobj=raw, mode="ab") as archive:
+                for entry in file_entries:
+                    record = {
+                        "log_id": entry.log_id,
+                        "action_type": entry.action_type,
+                        "details": entry.details,
+                        "user_id": entry.user_id,
+                        "timestamp": entry.timestamp.isoformat()
+                    }
+                    archive.write((json.dumps(record) + "\n").encode("utf-8"))
+            # The rows are deleted from the database right after, so the archive must be on disk first
+            raw.flush()
+            os.fsync(raw.fileno())
+
+def _add_daily_summaries(db, entries: list):
+    counts = Counter((entry.timestamp.date(), entry.action_type) for entry in entries)
+    for (day, action_type), count in counts.items():
+        stmt = insert(LogDailySummary).values(day=day, action_type=action_type, count=count)
+        db.execute(stmt.on_conflict_do_update(
+            index_elements=[LogDailySummary.day, LogDailySummary.action_type],
+            set_={"count": LogDailySummary.count + count}
+        ))
+
+def apply_log_retention(retain_days: int = LOG_RETENTION_DAYS, archive_dir: str = LOG_ARCHIVE_DIR,
+                        batch_size: int = LOG_RETENTION_BATCH_SIZE, max_batches: int = None, progress=None):
+    """
+    Move logs older than retain_days out of the logs table
+
+    Works oldest first in batches. Each batch is appended to the archive,
+    counted into LogDailySummary and deleted in one transaction, so the run
+    can stop at any point and the next run picks up where it left off.
+
+    Args:
+        retain_days (int, optional): Days of logs to keep in the logs table
+        archive_dir (str, optional): Directory of the monthly archive files
+        batch_size (int, optional): Log entries per batch
+        max_batches (int, optional): Stop after this many batches, e.g. to bound startup time
+        progress (callable, optional): Called with the running total of archived entries
+
+    Returns:
+        int: Number of log entries archived
+    """
+    flush_audit_log()
+    cutoff = datetime.utcnow() - timedelta(days=retain_days)
+    archived = batches = 0
+
+    while max_batches is None or batches < max_batches:
+        with session_scope() as db:
+            entries = (
+                db.query(Log)
+                .filter(Log.timestamp < cutoff)
+                .order_by(Log.timestamp, Log.log_id)
+                .limit(batch_size)
+                .all()
+            )
+            if not entries:
+                break
+
+            _write_archive(archive_dir, entries)
+            _add_daily_summaries(db, entries)
+            db.query(Log).filter(Log.log_id.in_([entry.log_id for entry in entries])).delete(synchronize_session=False)
+            db.commit()
+
+        archived += len(entries)
+        batches += 1
+        if progress:
+            progress(archived)
+
+    return archived
+
+def _archive_files(archive_dir: str, start_date: datetime = None, end_date: datetime = None):
+    """Archive files whose month overlaps the date range, newest first"""
+    first = start_date.strftime("%Y-%m") if start_date else None
+    last = end_date.strftime("%Y-%m") if end_date else None
+    paths = []
+    for path in glob.glob(os.path.join(archive_dir, ARCHIVE_PATTERN.format(month="*"))):
+        month = os.path.basename(path)[len("logs-"):-len(".jsonl.gz")]
+        if (first is None or month >= first) and (last is None or month <= last):
+            paths.append(path)
+    return sorted(paths, reverse=True)
+
+def search_log_archive(search_term: str = None, start_date: datetime = None, end_date: datetime = None,
+                       action_type: str = None, archive_dir: str = LOG_ARCHIVE_DIR):
+    """
+    Search archived logs with the same filters as search_logs
+
+    Only the monthly files overlapping the date range are read.
+
+    Returns:
+        List of detached Log objects, most recent first
+    """
+    term = search_term.lower() if search_term else None
+    seen = set()
+    results = []
+    for path in _archive_files(archive_dir, start_date, end_date):
+        with gzip.open(path, "rt", encoding="utf-8") as archive:
+            for line in archive:
+                record = json.loads(line)
+                # A batch interrupted between archiving and deleting is archived twice.
+                # log_id alone is not enough: SQLite reuses the ids of archived rows.
+                identity = (record["log_id"], record["timestamp"], record["action_type"])
+                if identity in seen:
+                    continue
+                timestamp = datetime.fromisoformat(record["timestamp"])
+                if start_date and timestamp < start_date:
+                    continue
+                if end_date and timestamp > end_date:
+                    continue
+                if action_type and record["action_type"] != action_type:
+                    continue
+                if term and term not in (record["details"] or "").lower() and term not in record["action_type"].lower():
+                    continue
+                seen.add(identity)
+                results.append(Log(
+                    log_id=record["log_id"],
+                    action_type=record["action_type"],
+                    details=record["details"],
+                    user_id=record["user_id"],
+                    timestamp=timestamp
+                ))
+
+    results.sort(key=lambda entry: (entry.timestamp, entry.log_id), reverse=True)
+    return results
+
+def get_log_summary(start_date: date = None, end_date: date = None, action_type: str = None):
+    """
+    Count log entries per day and action type, archived and current alike
+
+    Returns:
+        List of {"day", "action_type", "count"} ordered by day, then action type
+    """
+    flush_audit_log()
+    counts = Counter()
+    with session_scope() as db:
+        archived = db.query(LogDailySummary.day, LogDailySummary.action_type, LogDailySummary.count)
+        day = func.date(Log.timestamp)
+        current = db.query(day, Log.action_type, func.count(Log.log_id)).group_by(day, Log.action_type)
+        if start_date:
+            archived = archived.filter(LogDailySummary.day >= start_date)
+            current = current.filter(day >= start_date.isoformat())
+        if end_date:
+            archived = archived.filter(LogDailySummary.day <= end_date)
+            current = current.filter(day <= end_date.isoformat())
+        if action_type:
+            archived = archived.filter(LogDailySummary.action_type == action_type)
+            current = current.filter(Log.action_type == action_type)
+
+        for summary_day, summary_action, count in archived:
+            counts[(summary_day, summary_action)] += count
+        for log_day, log_action_type, count in current:
+            counts[(date.fromisoformat(log_day), log_action_type)] += count
+
+    return [
+        {"day": summary_day, "action_type": summary_action, "count": count}
+        for (summary_day, summary_action), count in sorted(counts.items())
+    ]
@@ -0,0 +1,182 @@
+# controllers/search_index.py
+
+import re
+from venv import logger
+from sqlalchemy import text, sql
+from sqlalchemy.exc import OperationalError
+from models.database import engine, session_scope
+
+# FTS5 table -> (content table, content rowid column, key column, indexed columns).
+# Tables without a content rowid column store their rows and the key
+# themselves: employees has a text primary key, and its implicit rowid can be
+# renumbered by VACUUM, which would desynchronise an external content index.
+# Their search rowids come from a {fts}_rowids key -> id table instead, so the
+# triggers delete by rowid rather than scanning the index for the key.
+SEARCH_INDEXES = {
+    "employee_fts": ("employees", None, "emp_id", ("emp_id", "name")),
+    "item_fts": ("items", "item_id", "item_id", ("name",)),
+    "employee_item_fts": ("employee_items", "id", "id", ("unique_key", "notes")),
+    "employee_item_attribute_fts": ("employee_item_attributes", "emp_attribute_id", "emp_attribute_id", ("name", "value")),
+}
+
+_fts5_available = None
+
+def search_index_available():
+    """Check once whether the SQLite build has the FTS5 extension"""
+    global _fts5_available
+    if _fts5_available is None:
+        try:
+            with engine.begin() as conn:
+                conn.execute(text("CREATE VIRTUAL TABLE IF NOT EXISTS temp.fts5_probe USING fts5(x)"))
+                conn.execute(text("DROP TABLE temp.fts5_probe"))
+            _fts5_available = True
+        except OperationalError:
+            logger.warning("SQLite FTS5 is not available, searches will use LIKE")
+            _fts5_available = False
+    return _fts5_available
+
+def _index_ddl(fts: str, table: str, rowid: str, key: str, columns: tuple):
+    cols = ", ".join(columns)
+    new_cols = ", ".join(f"new.{col}" for col in columns)
+    old_cols = ", ".join(f"old.{col}" for col in columns)
+    options = "tokenize='unicode61 remove_diacritics 2', prefix='2 3'"
+    if rowid is None:
+        rowids = f"{fts}_rowids"
+        old_rowid = f"(SELECT id FROM {rowids} WHERE {key} = old.{key})"
+        delete_old = f"DELETE FROM {fts} WHERE rowid = {old_rowid};"
+        insert_new = (
+            f"INSERT OR IGNORE INTO {rowids}({key}) VALUES (new.{key}); "
+            f"INSERT INTO {fts}(rowid, {cols}) SELECT id, {new_cols} FROM {rowids} WHERE {key} = new.{key};"
+        )
+        delete_key = f"DELETE FROM {rowids} WHERE {key} = old.{key};"
+        rename_key = f"UPDATE {rowids} SET {key} = new.{key} WHERE {key} = old.{key};"
+        create = [
+            f"CREATE TABLE IF NOT EXISTS {rowids} (id INTEGER PRIMARY KEY, {key} TEXT NOT NULL UNIQUE)",
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5({cols}, {options})",
+        ]
+    else:
+        delete_old = f"INSERT INTO {fts}({fts}, rowid, {cols}) VALUES ('delete', old.{rowid}, {old_cols});"
+        insert_new = f"INSERT INTO {fts}(rowid, {cols}) VALUES (new.{rowid}, {new_cols});"
+        delete_key = rename_key = ""
+        create = [
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5({cols}, content='{table}', content_rowid='{rowid}', {options})"
+        ]
+    # Triggers are recreated so databases with older definitions pick up changes.
+    # Updates only touch the index when an indexed column changes, not on e.g. item_count bumps.
+    return create + [
+        f"DROP TRIGGER IF EXISTS {fts}_ai",
+        f"DROP TRIGGER IF EXISTS {fts}_ad",
+        f"DROP TRIGGER IF EXISTS {fts}_au",
+        f"CREATE TRIGGER {fts}_ai AFTER INSERT ON {table} BEGIN {insert_new} END",
+        f"CREATE TRIGGER {fts}_ad AFTER DELETE ON {table} BEGIN {delete_old} {delete_key} END",
+        f"CREATE TRIGGER {fts}_au AFTER UPDATE OF {cols} ON {table} BEGIN {delete_old} {rename_key} {insert_new} END",
+    ]
+
+def _fill_index(conn, fts: str, table: str, rowid: str, key: str, columns: tuple):
+    if rowid is None:
+        rowids = f"{fts}_rowids"
+        cols = ", ".join(columns)
+        table_cols = ", ".join(f"t.{col}" for col in columns)
+        conn.execute(text(f"DELETE FROM {fts}"))
+        conn.execute(text(f"DELETE FROM {rowids}"))
+        conn.execute(text(f"INSERT INTO {rowids}({key}) SELECT {key} FROM {table}"))
+        conn.execute(text(
+            f"INSERT INTO {fts}(rowid, {cols}) SELECT r.id, {table_cols} FROM {table} t JOIN {rowids} r ON r.{key} = t.{key}"
+        ))
+    else:
+        conn.execute(text(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')"))
+
+def ensure_search_index():
+    """
+    Create the FTS5 search tables and their sync triggers if they are missing.
+    Newly created tables are filled from the existing rows.
+
+    Returns:
+        True if the search index is usable, False otherwise
+    """
+    if not search_index_available():
+        return False
+
+    with engine.begin() as conn:
+        existing = dict(
+            conn.execute(text("SELECT name, sql FROM sqlite_master WHERE type = 'table'")).fetchall()
+        )
+        for fts, (table, rowid, key, columns) in SEARCH_INDEXES.items():
+            # Drop search tables whose storage changed, e.g. an employee_fts from before it had rowids
+            if fts in existing and (
+                ("content=" in existing[fts]) != (rowid is not None)
+                or (rowid is None and f"{fts}_rowids" not in existing)
+            ):
+                conn.execute(text(f"DROP TABLE {fts}"))
+                del existing[fts]
+            for statement in _index_ddl(fts, table, rowid, key, columns):
+                conn.execute(text(statement))
+            if fts not in existing:
+                _fill_index(conn, fts, table, rowid, key, columns)
+    return True
+
+def rebuild_search_index():
+    """
+    Rebuild every search table from its content table
+
+    Returns:
+        List of the rebuilt search tables, empty if FTS5 is not available
+    """
+    if not ensure_search_index():
+        return []
+
+    with engine.begin() as conn:
+        for fts, (table, rowid, key, columns) in SEARCH_INDEXES.items():
+            _fill_index(conn, fts, table, rowid, key, columns)
+    return list(SEARCH_INDEXES)
+
+def build_match_query(query: str, column: str = None):
+    """
+    Turn user input into an FTS5 prefix query, e.g. 'dell lat' -> '"dell"* "lat"*'
+
+    Returns:
+        Match expression, or None if the input has no searchable terms
+    """
+    terms = re.findall(r"\w+", query or "")
+    if not terms:
+        return None
+    match = " ".join(f'"{term}"*' for term in terms)
+    return f"{column} : ({match})" if column else match
+
+def match_search_index(db, fts: str, query: str, column: str = None):
+    """
+    Build a subquery of the rows of a search table that match query
+
+    Callers join or IN (SELECT ...) it into their own statement and order by
+    its rank, so the matched keys never travel between SQLite and Python.
+
+    Args:
+        db (Session): Database session
+        fts (str): Search table name from SEARCH_INDEXES
+        query (str): User search input
+        column (str, optional): Restrict the match to one indexed column
+
+    Returns:
+        Subquery with key (content table key) and rank (lower is better)
+        columns, or None when the index cannot be used for this query and
+        the caller should fall back to LIKE
+    """
+    match = build_match_query(query, column)
+    if match is None or not search_index_available():
+        return None
+    exists = db.execute(
+        text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :fts"), {"fts": fts}
+    ).first()
+    if exists is None:
+        logger.warning(f"Search table {fts} is missing, falling back to LIKE")
+        return None
+
+    _, rowid, key, _ = SEARCH_INDEXES[fts]
+    # External content tables use the content key as their rowid
+    key_column = key if rowid is None else "rowid"
+    return (
+        text(f"SELECT {key_column} AS key, rank FROM {fts} WHERE {fts} MATCH :match")
+        .bindparams(sql.bindparam("match", match, unique=True))  # Unique, a statement may use several
+        .columns(sql.column("key"), sql.column("rank"))
+        .subquery(f"{fts}_match")
+    )
@@ -0,0 +1,239 @@
+# controllers/slow_query_log.py
+
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+import time
+from collections import Counter
+from datetime import datetime, date
+from logging.handlers import RotatingFileHandler
+from sqlalchemy import event
+from models.database import engine
+from controllers.instrumentation import find_call_stack, CALL_STACK_IGNORED_FILES
+from config import (
+    SLOW_QUERY_THRESHOLD_MS,
+    SLOW_QUERY_LOG_PATH,
+    SLOW_QUERY_LOG_MAX_BYTES,
+    SLOW_QUERY_LOG_BACKUPS,
+    SLOW_QUERY_STACK_DEPTH
+)
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"(?<![\w.])\d+(?:\.\d+)?\b")
+_IN_LIST = re.compile(r"\bIN\s*\(\s*\?(?:\s*,\s*\?)*\s*\)", re.IGNORECASE)
+
+CALL_STACK_IGNORED_FILES.add(os.path.abspath(__file__))
+
+# Statements SQLite can EXPLAIN QUERY PLAN usefully
+_EXPLAINABLE = ("SELECT", "WITH", "UPDATE", "DELETE")
+
+def normalize_statement(statement: str):
+    """
+    Reduce a statement to its shape: literals become ?, IN lists become
+    IN (...) whatever their length, and whitespace is collapsed
+    """
+    text = " ".join(statement.split())
+    text = _STRING_LITERAL.sub("?", text)
+    text = _NUMBER_LITERAL.sub("?", text)
+    return _IN_LIST.sub("IN (...)", text)
+
+def statement_fingerprint(statement: str):
+    """Stable id of a statement's shape, equal for statements that only differ in values"""
+    return hashlib.sha1(normalize_statement(statement).encode("utf-8")).hexdigest()[:16]
+
+def _redact_value(value):
+    if value is None:
+        return None
+    if isinstance(value, (str, bytes)):
+        return f"<{type(value).__name__}:{len(value)}>"
+    return f"<{type(value).__name__}>"
+
+def redact_parameters(parameters, executemany: bool = False):
+    """Replace parameter values with their type (and length for text), keeping the layout"""
+    if executemany:
+        rows = list(parameters or [])
+        return {"rows": len(rows), "first": redact_parameters(rows[0]) if rows else None}
+    if isinstance(parameters, dict):
+        return {name: _redact_value(value) for name, value in parameters.items()}
+    return [_redact_value(value) for value in (parameters or ())]
+
+class SlowQueryLog:
+    """
+    Appends statements slower than a threshold to a rotating JSON lines file.
+
+    Each record holds the normalized statement and its fingerprint, the
+    parameters with their values redacted, the project call stack and the
+    EXPLAIN QUERY PLAN output. Plans are looked up once per fingerprint.
+    """
+    def __init__(self, threshold_ms: float = SLOW_QUERY_THRESHOLD_MS, path: str = SLOW_QUERY_LOG_PATH,
+                 max_bytes: int = SLOW_QUERY_LOG_MAX_BYTES, backups: int = SLOW_QUERY_LOG_BACKUPS,
+                 stack_depth: int = SLOW_QUERY_STACK_DEPTH):
+        self.threshold_ms = threshold_ms
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self.stack_depth = stack_depth
+        self.lock = threading.Lock()
+        self.plans = {}  # fingerprint -> plan lines
+        self.bind = None
+        self.writer = None
+
+    @property
+    def enabled(self):
+        return self.bind is not None
+
+    def enable(self, bind=engine):
+        """Start timing statements on the engine; does nothing if the threshold is 0"""
+        with self.lock:
+            if self.bind is not None or self.threshold_ms <= 0:
+                return self.bind is not None
+            if self.writer is None:
+                self.writer = logging.getLogger(f"inman.slow_queries.{id(self)}")
+                self.writer.propagate = False
+                self.writer.setLevel(logging.INFO)
+                # delay: the file is only created when the first slow statement is written
+                handler = RotatingFileHandler(
+                    self.path, maxBytes=self.max_bytes, backupCount=self.backups, encoding="utf-8", delay=True
+                )
+                handler.setFormatter(logging.Formatter("%(message)s"))
+                self.writer.addHandler(handler)
+            event.listen(bind, "before_cursor_execute", self._before_execute)
+            event.listen(bind, "after_cursor_execute", self._after_execute)
+            event.listen(bind, "handle_error", self._handle_error)
+            self.bind = bind
+            return True
+
+    def disable(self):
+        with self.lock:
+            if self.bind is None:
+                return
+            event.remove(self.bind, "before_cursor_execute", self._before_execute)
+            event.remove(self.bind, "after_cursor_execute", self._after_execute)
+            event.remove(self.bind, "handle_error", self._handle_error)
+            self.bind = None
+
+    def _before_execute(self, conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("slow_query_start_times", []).append(time.perf_counter())
+
+    def _after_execute(self, conn, cursor, statement, parameters, context, executemany):
+        elapsed_ms = (time.perf_counter() - conn.info["slow_query_start_times"].pop()) * 1000
+        if elapsed_ms >= self.threshold_ms:
+            self.record(conn, statement, parameters, executemany, elapsed_ms)
+
+    def _handle_error(self, exception_context):
+        # A failed statement never reaches after_cursor_execute
+        if exception_context.connection is not None:
+            start_times = exception_context.connection.info.get("slow_query_start_times")
+            if start_times:
+                start_times.pop()
+
+    def _explain(self, conn, statement: str, parameters, executemany: bool, fingerprint: str):
+        with self.lock:
+            if fingerprint in self.plans:
+                return self.plans[fingerprint]
+        if executemany or not statement.lstrip().upper().startswith(_EXPLAINABLE):
+            plan = []
+        else:
+            # A separate DBAPI cursor: runs in the same transaction and bypasses the engine events
+            cursor = conn.connection.cursor()
+            try:
+                cursor.execute(f"EXPLAIN QUERY PLAN {statement}", parameters)
+                plan = [row[-1] for row in cursor.fetchall()]
+            except Exception as e:
+                plan = [f"EXPLAIN failed: {str(e)}"]
+            finally:
+                cursor.close()
+        with self.lock:
+            self.plans[fingerprint] = plan
+        return plan
+
+    def record(self, conn, statement: str, parameters, executemany: bool, elapsed_ms: float):
+        fingerprint = statement_fingerprint(statement)
+        entry = {
+            "timestamp": datetime.utcnow().isoformat(timespec="milliseconds"),
+            "elapsed_ms": round(elapsed_ms, 3),
+            "fingerprint": fingerprint,
+            "statement": normalize_statement(statement),
+            "parameters": redact_parameters(parameters, executemany),
+            "stack": find_call_stack(limit=self.stack_depth),
+            "plan": self._explain(conn, statement, parameters, executemany, fingerprint),
+            "thread": threading.current_thread().name
+        }
+        self.writer.info(json.dumps(entry))
+
+# Shared slow query log of the application engine
+slow_query_log = SlowQueryLog()
+
+def enable_slow_query_log(bind=engine):
+    """
+    Start the slow query log configured in config.py
+
+    Returns:
+        True if the log is active, False if it is turned off (threshold 0)
+    """
+    return slow_query_log.enable(bind)
+
+def disable_slow_query_log():
+    slow_query_log.disable()
+
+def read_slow_query_log(path: str = SLOW_QUERY_LOG_PATH, since: date = None):
+    """
+    Read slow query records from the log and its rotated files, oldest first
+
+    Args:
+        path (str, optional): Log file, rotated files are path.1, path.2, ...
+        since (date, optional): Skip records from before this day
+
+    Returns:
+        List of record dictionaries
+    """
+    paths = [f"{path}.{number}" for number in range(SLOW_QUERY_LOG_BACKUPS, 0, -1)] + [path]
+    records = []
+    for log_path in paths:
+        if not os.path.exists(log_path):
+            continue
+        with open(log_path, encoding="utf-8") as file:
+            for line in file:
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                if since and datetime.fromisoformat(record["timestamp"]).date() < since:
+                    continue
+                records.append(record)
+    return records
+
+def summarize_slow_queries(records: list, top: int = 10):
+    """
+    Group slow query records by fingerprint
+
+    Returns:
+        Up to `top` dictionaries ordered by total time, each with fingerprint,
+        statement, count, total_ms, max_ms, call_sites (the most frequent
+        innermost frames with their counts) and the plan of the slowest run
+    """
+    groups = {}
+    for record in records:
+        group = groups.setdefault(record["fingerprint"], {
+            "fingerprint": record["fingerprint"],
+            "statement": record["statement"],
+            "count": 0,
+            "total_ms": 0.0,
+            "max_ms": 0.0,
+            "call_sites": Counter(),
+            "plan": record["plan"]
+        })
+        group["count"] += 1
+        group["total_ms"] += record["elapsed_ms"]
+        if record["elapsed_ms"] >= group["max_ms"]:
+            group["max_ms"] = record["elapsed_ms"]
+            group["plan"] = record["plan"]
+        group["call_sites"][(record["stack"] or ["<unknown>"])[0]] += 1
+
+    summary = sorted(groups.values(), key=lambda group: group["total_ms"], reverse=True)[:top]
+    for group in summary:
+        group["total_ms"] = round(group["total_ms"], 3)
+        group["call_sites"] = group["call_sites"].most_common(3)
+    return summary
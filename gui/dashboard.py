@@ -1,19 +1,25 @@
 # 
 import customtkinter as ctk
 from config import COLORS
-from controllers import (
-    get_all_employees,
-    get_all_items,
-    get_all_divisions,
-    get_division_details_with_counts
-)
-from controllers.crud import get_all_divisions_with_counts
+from utils.summary import get_dashboard_versions, get_dashboard_stats
+from gui.tasks import run_in_background, show_loading
 import webbrowser
 
+TRANSFER_DAYS = 30
+
 class Dashboard:
+    """
+    Overview of the inventory built once and kept while other screens are
+    shown. Each display() compares the section versions with the ones that
+    were rendered and reloads only the stale sections, in one background
+    snapshot, so showing an unchanged dashboard runs no queries.
+    """
     def __init__(self, main_frame, inventory):
         self.main_frame = main_frame
         self.inventory = inventory
+        self.scrollable_frame = None
+        self.section_frames = {}  # section name -> frame its cards are rendered into
+        self.versions = {}  # section name -> version of the rendered data
         
     def create_header(self):
         header_frame = ctk.CTkFrame(self.main_frame, fg_color="transparent")
@@ -181,15 +187,20 @@ class Dashboard:
         overview_frame = ctk.CTkFrame(self.main_frame, fg_color="transparent")
         overview_frame.pack(fill="x", padx=20, pady=10)
         
+        show_loading(overview_frame, "Loading statistics...")
+        self.section_frames["overview"] = overview_frame
+
+    def render_overview(self, overview_frame, stats):
+        for widget in overview_frame.winfo_children():
+            widget.destroy()
+
         # Configure grid for responsive layout
         overview_frame.grid_columnconfigure((0, 1, 2, 3), weight=1)
-        
-        # Fetch data
-        total_employees = len(get_all_employees())
-        total_items = len(get_all_items())
-        all_divisions = get_all_divisions()
-        total_divisions = len(all_divisions)
-        active_items = sum(1 for item in get_all_items())
+
+        total_employees = stats["total_employees"]
+        total_items = stats["total_items"]
+        total_divisions = stats["total_divisions"]
+        total_assignments = stats["total_assignments"]
         
         # Create stat cards
         self.create_stat_card(
@@ -212,6 +223,13 @@ class Dashboard:
             total_divisions,
             "🏢"
         ).grid(row=0, column=2, padx=5, pady=5, sticky="nsew")
+
+        self.create_stat_card(
+            overview_frame,
+            "Assigned Items",
+            total_assignments,
+            "🏷"
+        ).grid(row=0, column=3, padx=5, pady=5, sticky="nsew")
         
 
     def create_divisions_section(self):
@@ -230,12 +248,16 @@ class Dashboard:
         divisions_frame = ctk.CTkFrame(self.main_frame, fg_color="transparent")
         divisions_frame.pack(fill="x", padx=20, pady=10)
         
+        show_loading(divisions_frame, "Loading divisions...")
+        self.section_frames["divisions"] = divisions_frame
+
+    def render_divisions(self, divisions_frame, divisions):
+        for widget in divisions_frame.winfo_children():
+            widget.destroy()
+
         # Configure grid for responsive layout
         divisions_frame.grid_columnconfigure((0, 1), weight=1)
         
-        # Get division details
-        divisions = get_all_divisions_with_counts()
-        
         # Create division cards in a 2-column grid
         for i, division in enumerate(divisions):
             self.create_division_card(
@@ -243,9 +265,134 @@ class Dashboard:
                 division
             ).grid(row=i//2, column=i%2, padx=5, pady=5, sticky="nsew")
     
+    def create_transfers_section(self):
+        # Section title
+        section_header = ctk.CTkFrame(self.main_frame, fg_color="transparent")
+        section_header.pack(fill="x", padx=20, pady=(20, 10))
+        
+        ctk.CTkLabel(
+            section_header,
+            text=f"Transfer Activity (Last {TRANSFER_DAYS} Days)",
+            font=ctk.CTkFont(size=18, weight="bold"),
+            text_color=COLORS["white"]
+        ).pack(side="left")
+        
+        transfers_frame = ctk.CTkFrame(self.main_frame, fg_color="transparent")
+        transfers_frame.pack(fill="x", padx=20, pady=10)
+        
+        show_loading(transfers_frame, "Loading transfers...")
+        self.section_frames["transfers"] = transfers_frame
+
+    def create_daily_chart(self, parent, daily):
+        card = ctk.CTkFrame(
+            parent,
+            fg_color=COLORS["secondary_bg"],
+            corner_radius=10,
+            border_width=1,
+            border_color=COLORS["ash"]
+        )
+        
+        ctk.CTkLabel(
+            card,
+            text="Transfers per Day",
+            font=ctk.CTkFont(size=12),
+            text_color=COLORS["ash"]
+        ).pack(anchor="w", padx=15, pady=(15, 5))
+        
+        # One bar per day, scaled to the busiest day
+        chart = ctk.CTkFrame(card, fg_color="transparent", height=100)
+        chart.pack(fill="x", padx=15, pady=(0, 5))
+        busiest = max((day["count"] for day in daily), default=0)
+        for index, day in enumerate(daily):
+            chart.grid_columnconfigure(index, weight=1, uniform="day")
+            bar = ctk.CTkFrame(
+                chart,
+                fg_color=COLORS["pink"] if day["count"] else COLORS["black"],
+                corner_radius=2,
+                width=8,
+                height=max(2, int(90 * day["count"] / (busiest or 1)))
+            )
+            bar.grid(row=0, column=index, sticky="s", padx=1)
+        chart.grid_rowconfigure(0, minsize=100)
+        
+        ctk.CTkLabel(
+            card,
+            text=f"{daily[0]['date']:%d %b} - {daily[-1]['date']:%d %b}   (busiest day: {busiest})",
+            font=ctk.CTkFont(size=12),
+            text_color=COLORS["ash"]
+        ).pack(anchor="w", padx=15, pady=(0, 15))
+        return card
+
+    def create_ranking_card(self, parent, title, entries, label_key):
+        card = ctk.CTkFrame(
+            parent,
+            fg_color=COLORS["secondary_bg"],
+            corner_radius=10,
+            border_width=1,
+            border_color=COLORS["ash"]
+        )
+        
+        ctk.CTkLabel(
+            card,
+            text=title,
+            font=ctk.CTkFont(size=14, weight="bold"),
+            text_color=COLORS["white"]
+        ).pack(anchor="w", padx=15, pady=(15, 5))
+        
+        rows = ctk.CTkFrame(card, fg_color="transparent")
+        rows.pack(fill="both", padx=15, pady=(0, 15))
+        rows.grid_columnconfigure(0, weight=1)
+        
+        if not entries:
+            ctk.CTkLabel(rows, text="No transfers", font=ctk.CTkFont(size=14), text_color=COLORS["ash"]).grid(row=0, column=0, sticky="w", padx=5, pady=2)
+        for index, entry in enumerate(entries):
+            label = entry["name"] if label_key is None else f"{entry['name']} ({entry[label_key]})"
+            ctk.CTkLabel(rows, text=label, font=ctk.CTkFont(size=14), text_color=COLORS["ash"]).grid(row=index, column=0, sticky="w", padx=5, pady=2)
+            ctk.CTkLabel(rows, text=str(entry["count"]), font=ctk.CTkFont(size=14), text_color=COLORS["white"]).grid(row=index, column=1, sticky="e", padx=5, pady=2)
+        return card
+
+    def render_transfers(self, transfers_frame, summary):
+        for widget in transfers_frame.winfo_children():
+            widget.destroy()
+
+        transfers_frame.grid_columnconfigure((0, 1, 2), weight=1)
+
+        self.create_stat_card(
+            transfers_frame,
+            "Transfers",
+            summary["total_transfers"],
+            "🔁",
+            f"since {summary['start_date']:%d %b %Y}"
+        ).grid(row=0, column=0, padx=5, pady=5, sticky="nsew")
+
+        self.create_daily_chart(
+            transfers_frame,
+            summary["daily"]
+        ).grid(row=0, column=1, columnspan=2, padx=5, pady=5, sticky="nsew")
+
+        self.create_ranking_card(
+            transfers_frame, "Most Transferred Items", summary["top_transferred_items"], None
+        ).grid(row=1, column=0, padx=5, pady=5, sticky="nsew")
+
+        self.create_ranking_card(
+            transfers_frame, "Top Senders", summary["top_source_employees"], "emp_id"
+        ).grid(row=1, column=1, padx=5, pady=5, sticky="nsew")
+
+        self.create_ranking_card(
+            transfers_frame, "Top Receivers", summary["top_destination_employees"], "emp_id"
+        ).grid(row=1, column=2, padx=5, pady=5, sticky="nsew")
+
     def display(self):
+        # Build the sections once, later calls only refresh them
+        if self.scrollable_frame is None or not self.scrollable_frame.winfo_exists():
+            self.build()
+        self.refresh()
+
+    def build(self):
         # Clear existing content
         self.clear_main_frame()
+        self.section_frames = {}
+        self.versions = {}
 
         # Create a scrollable frame
         scrollable_frame = ctk.CTkScrollableFrame(
@@ -255,6 +402,7 @@ class Dashboard:
             scrollbar_button_hover_color=COLORS["darker_pink"]
         )
         scrollable_frame.pack(fill="both", expand=True, padx=0, pady=0)
+        self.scrollable_frame = scrollable_frame
 
         # Temporarily change main_frame to scrollable_frame for creating content
         original_main_frame = self.main_frame
@@ -263,11 +411,37 @@ class Dashboard:
         # Create dashboard sections
         self.create_header()
         self.create_overview_section()
+        self.create_transfers_section()
         self.create_divisions_section()
 
         # Restore original main_frame
         self.main_frame = original_main_frame
 
+    def refresh(self):
+        # Versions are in memory: nothing is queried unless a section changed
+        versions = get_dashboard_versions(TRANSFER_DAYS)
+        stale = [section for section, version in versions.items() if self.versions.get(section) != version]
+        if not stale:
+            return
+        run_in_background(
+            self.scrollable_frame,
+            get_dashboard_stats,
+            stale,
+            TRANSFER_DAYS,
+            on_done=self.render_snapshot,
+            key="dashboard"
+        )
+
+    def render_snapshot(self, snapshot):
+        renderers = {
+            "overview": self.render_overview,
+            "transfers": self.render_transfers,
+            "divisions": self.render_divisions
+        }
+        for section, data in snapshot["sections"].items():
+            renderers[section](self.section_frames[section], data)
+        self.versions.update(snapshot["versions"])
+
     def clear_main_frame(self):
         for widget in self.main_frame.winfo_children():
             widget.destroy()
\ No newline at end of file
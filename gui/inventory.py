@@ -11,6 +11,8 @@ from controllers import (get_all_employees, get_all_items, get_all_divisions,
 from controllers.crud import get_all_division_names, get_division
 from models.database import SessionLocal
 from utils.search import search_divisions, search_employee_items, search_employees, search_items, search_unique_key
+from gui.tasks import run_in_background, show_loading
+from gui.virtual_table import VirtualTable
 
 class InventoryDisplay:
     def __init__(self, main_frame, inv):
@@ -202,6 +204,8 @@ class InventoryDisplay:
             border_color=COLORS["white"]
         )
         container.pack(fill="both", expand=True, padx=20, pady=10)
+        self.results_container = container
+        self.results_table = None
         
         # Scrollable frame for results
         self.results_frame = ctk.CTkScrollableFrame(
@@ -299,26 +303,19 @@ class InventoryDisplay:
         search_type = self.search_type.get()
         query = self.search_entry.get()
         
-        # Clear existing results in the results frame
-        for widget in self.results_frame.winfo_children():
-            widget.destroy()
-        
         if search_type == "Employees":
             division_filter = getattr(self, 'division_filter', None)
             division_name = division_filter.get() if division_filter and division_filter.get() != "All Divisions" else None
-            results = search_employees(query, division_name, items_need=True)
-            self.search_results["Employees"] = results
-            self.display_search_results()
-            self.display_employee_results(results)
+            search = lambda: search_employees(query, division_name, items_need=True)
+            render = self.display_employee_results
+            recreate_view = True
 
         elif search_type == "Employee Items":
-            print("HIITTTT THE BUTTON")
             attr_name = self.attr_name_filter.get() if hasattr(self, 'attr_name_filter') else None
             attr_value = self.attr_value_filter.get() if hasattr(self, 'attr_value_filter') else None
-
-            results = search_employee_items(query, attr_name, attr_value)
-            self.search_results["Employee Items"] = results
-            self.display_employee_item_results(results)
+            search = lambda: search_employee_items(query, attr_name, attr_value)
+            render = self.display_employee_item_results
+            recreate_view = False
 
         elif search_type == "Items":
             status_filter = self.status_filter.get() if hasattr(self, 'status_filter') else None
@@ -330,27 +327,46 @@ class InventoryDisplay:
             elif is_common_filter == "Not Common":
                 is_common = 0
             status = None if status_filter == "All Status" else status_filter
-            self.display_search_results()
-            results = search_items(
+            search = lambda: search_items(
                 query, 
                 status=status, 
                 is_common=is_common
             )
-            self.search_results["Items"] = results
-            
-            self.display_item_results(results)
+            render = self.display_item_results
+            recreate_view = True
 
         elif search_type == "Divisions":
-            self.display_search_results()
-            results = search_divisions(query)
-            self.search_results["Divisions"] = results
-            self.display_division_results(results)
+            search = lambda: search_divisions(query)
+            render = self.display_division_results
+            recreate_view = True
 
         elif search_type == "Unique Key":
+            search = lambda: search_unique_key(query)
+            render = self.display_unique_key_results
+            recreate_view = True
+
+        else:
+            return
+
+        # Run the query off the Tk thread; a newer search supersedes this one
+        self.clear_results_table()
+        show_loading(self.results_frame, "Searching...")
+        run_in_background(
+            self.results_frame,
+            search,
+            on_done=lambda results: self.show_search_results(search_type, results, render, recreate_view),
+            key="inventory-search"
+        )
+
+    def show_search_results(self, search_type, results, render, recreate_view):
+        self.search_results[search_type] = results
+        if recreate_view:
             self.display_search_results()
-            results = search_unique_key(query)
-            self.search_results["Unique Key"] = results
-            self.display_unique_key_results(results)
+        else:
+            self.clear_results_table()
+            for widget in self.results_frame.winfo_children():
+                widget.destroy()
+        render(results)
 
     def export_to_excel(self):
         """
@@ -671,163 +687,40 @@ class InventoryDisplay:
             label = ctk.CTkLabel(self.results_frame, text=header)
             label.pack(side="top", padx=5, pady=5)
 
-    def display_employee_results(self, results):
-        # Configure grid columns
-        self.results_frame.grid_columnconfigure(0, weight=0, minsize=100)  # ID
-        self.results_frame.grid_columnconfigure(1, weight=1, minsize=200)  # Name
-        self.results_frame.grid_columnconfigure(2, weight=0, minsize=150)  # Division
+    def show_results_table(self, columns, results):
+        """Show results in a virtualized table in place of the scrollable results frame"""
+        self.clear_results_table()
+        self.results_frame.pack_forget()
+        self.results_table = VirtualTable(self.results_container, columns, results)
+        self.results_table.pack(fill="both", expand=True, padx=5, pady=5)
 
-        # Create headers
-        headers = ["Employee ID", "Name", "Division"]
-        for col, header in enumerate(headers):
-            header_frame = ctk.CTkFrame(self.results_frame, fg_color=COLORS["black"])
-            header_frame.grid(row=0, column=col, padx=2, pady=2, sticky="nsew")
-            
-            ctk.CTkLabel(
-                header_frame,
-                text=header,
-                font=ctk.CTkFont(size=14, weight="bold"),
-                text_color=COLORS["white"]
-            ).pack(padx=10, pady=8)
+    def clear_results_table(self):
+        table = getattr(self, 'results_table', None)
+        if table is not None and table.winfo_exists():
+            table.destroy()
+            self.results_frame.pack(fill="both", expand=True, padx=5, pady=5)
+        self.results_table = None
 
-        # Add employee rows
-        for idx, employee in enumerate(results, 1):
-            # ID Cell
-            id_frame = ctk.CTkFrame(self.results_frame, fg_color=COLORS["black"])
-            id_frame.grid(row=idx, column=0, padx=2, pady=2, sticky="nsew")
-            ctk.CTkLabel(
-                id_frame,
-                text=employee['emp_id'],
-                font=ctk.CTkFont(size=13)
-            ).pack(padx=10, pady=8)
-            
-            # Name Cell
-            name_frame = ctk.CTkFrame(self.results_frame, fg_color=COLORS["black"])
-            name_frame.grid(row=idx, column=1, padx=2, pady=2, sticky="nsew")
-            ctk.CTkLabel(
-                name_frame,
-                text=employee['name'],
-                font=ctk.CTkFont(size=13)
-            ).pack(padx=10, pady=8)
-            
-            # Division Cell
-            div_frame = ctk.CTkFrame(self.results_frame, fg_color=COLORS["black"])
-            div_frame.grid(row=idx, column=2, padx=2, pady=2, sticky="nsew")
-            
-            div_tag = ctk.CTkFrame(
-                div_frame,
-                fg_color=COLORS["pink"],
-                corner_radius=6
-            )
-            div_tag.pack(padx=10, pady=8)
-            ctk.CTkLabel(
-                div_tag,
-                text=employee['division'],
-                font=ctk.CTkFont(size=12, weight="bold"),
-                text_color=COLORS["white"]
-            ).pack(padx=8, pady=2)
+    def display_employee_results(self, results):
+        self.show_results_table([
+            {"title": "Employee ID", "key": "emp_id", "width": 100},
+            {"title": "Name", "key": "name", "width": 200},
+            {"title": "Division", "key": "division", "kind": "tag", "width": 150},
+        ], results)
 
     def display_item_results(self, results):
-        # Configure grid columns
-        self.results_frame.grid_columnconfigure(0, weight=1, minsize=200)  # Name
-
-        # Create headers
-        headers = ["Name"]
-        for col, header in enumerate(headers):
-            header_frame = ctk.CTkFrame(self.results_frame, fg_color=COLORS["black"])
-            header_frame.grid(row=0, column=col, padx=2, pady=2, sticky="nsew")
-            
-            ctk.CTkLabel(
-                header_frame,
-                text=header,
-                font=ctk.CTkFont(size=14, weight="bold"),
-                text_color=COLORS["white"]
-            ).pack(padx=10, pady=8)
-
-        # Add item rows
-        for idx, item in enumerate(results, 1):
-            # Name Cell
-            name_frame = ctk.CTkFrame(self.results_frame, fg_color=COLORS["black"])
-            name_frame.grid(row=idx, column=0, padx=2, pady=2, sticky="nsew")
-            ctk.CTkLabel(
-                name_frame,
-                text=item['name'],
-                font=ctk.CTkFont(size=13),
-                wraplength=300
-            ).pack(padx=10, pady=8)
-
+        self.show_results_table([
+            {"title": "Name", "key": "name", "width": 200},
+        ], results)
 
     def display_employee_item_results(self, results):
-            # Configure grid columns
-            self.results_frame.grid_columnconfigure(0, weight=0, minsize=100)  # Emp Id
-            self.results_frame.grid_columnconfigure(1, weight=1, minsize=200)  # Emp Name
-            self.results_frame.grid_columnconfigure(2, weight=1, minsize=200)  # Item Name
-            self.results_frame.grid_columnconfigure(3, weight=1, minsize=200)  # Unique Key
-            self.results_frame.grid_columnconfigure(4, weight=1, minsize=300)  # Attributes
-
-            # Create headers
-            headers = ["Emp Id", "Emp Name", "Item Name", "Unique Key", "Attributes"]
-            for col, header in enumerate(headers):
-                header_frame = ctk.CTkFrame(self.results_frame, fg_color=COLORS["black"])
-                header_frame.grid(row=0, column=col, padx=2, pady=2, sticky="nsew")
-                
-                ctk.CTkLabel(
-                    header_frame,
-                    text=header,
-                    font=ctk.CTkFont(size=14, weight="bold"),
-                    text_color=COLORS["white"]
-                ).pack(padx=10, pady=8)
-
-            # Add employee item rows
-            for idx, result in enumerate(results, 1):
-                # Emp Id Cell
-                emp_id_frame = ctk.CTkFrame(self.results_frame, fg_color=COLORS["black"])
-                emp_id_frame.grid(row=idx, column=0, padx=2, pady=2, sticky="nsew")
-                ctk.CTkLabel (emp_id_frame,
-                    text=result['emp_id'],
-                    font=ctk.CTkFont(size=13),
-                    wraplength=300
-                ).pack(padx=10, pady=8)
-
-                # Emp Name Cell
-                emp_name_frame = ctk.CTkFrame(self.results_frame, fg_color=COLORS["black"])
-                emp_name_frame.grid(row=idx, column=1, padx=2, pady=2, sticky="nsew")
-                ctk.CTkLabel(
-                    emp_name_frame,
-                    text=result['emp_name'],
-                    font=ctk.CTkFont(size=13),
-                    wraplength=300
-                ).pack(padx=10, pady=8)
-
-                # Item Name Cell
-                item_name_frame = ctk.CTkFrame(self.results_frame, fg_color=COLORS["black"])
-                item_name_frame.grid(row=idx, column=2, padx=2, pady=2, sticky="nsew")
-                ctk.CTkLabel(
-                    item_name_frame,
-                    text=result['item_name'],
-                    font=ctk.CTkFont(size=13),
-                    wraplength=300
-                ).pack(padx=10, pady=8)
-
-                # Unique Key Cell
-                unique_key_frame = ctk.CTkFrame(self.results_frame, fg_color=COLORS["black"])
-                unique_key_frame.grid(row=idx, column=3, padx=2, pady=2, sticky="nsew")
-                ctk.CTkLabel(
-                    unique_key_frame,
-                    text=result['unique_key'],
-                    font=ctk.CTkFont(size=13),
-                    wraplength=300
-                ).pack(padx=10, pady=8)
-
-                # Attributes Cell
-                attributes_frame = ctk.CTkFrame(self.results_frame, fg_color=COLORS["black"])
-                attributes_frame.grid(row=idx, column=4, padx=2, pady=2, sticky="nsew")
-                ctk.CTkLabel(
-                    attributes_frame,
-                    text=result['attributes'],
-                    font=ctk.CTkFont(size=13),
-                    wraplength=300
-                ).pack(padx=10, pady=8)
+        self.show_results_table([
+            {"title": "Emp Id", "key": "emp_id", "width": 100},
+            {"title": "Emp Name", "key": "emp_name", "width": 200},
+            {"title": "Item Name", "key": "item_name", "width": 200},
+            {"title": "Unique Key", "key": "unique_key", "width": 200},
+            {"title": "Attributes", "key": "attributes", "width": 300},
+        ], results)
 
     def display_division_results(self, results):
         # Configure grid columns
@@ -1170,78 +1063,9 @@ class InventoryDisplay:
             ).pack(padx=10, pady=8)
 
     def display_unique_key_results(self, results):
-        # Configure grid columns
-        self.results_frame.grid_columnconfigure(0, weight=0, minsize=100)  # Employee ID
-        self.results_frame.grid_columnconfigure(1, weight=1, minsize=200)  # Employee Name
-        self.results_frame.grid_columnconfigure(2, weight=1, minsize=200)  # Item Name
-        self.results_frame.grid_columnconfigure(3, weight=1, minsize=200)  # Unique Key
-
-        # Create headers
-        headers = ["Employee ID", "Employee Name", "Item Name", "Unique Key"]
-        for col, header in enumerate(headers):
-            header_frame = ctk.CTkFrame(self.results_frame, fg_color=COLORS["black"])
-            header_frame.grid(row=0, column=col, padx=2, pady=2, sticky="nsew")
-            
-            ctk.CTkLabel(
-                header_frame,
-                text=header,
-                font=ctk.CTkFont(size=14, weight="bold"),
-                text_color=COLORS["white"]
-            ).pack(padx=10, pady=8)
-
-        # Add rows
-        for idx, result in enumerate(results, 1):
-            # Employee ID Cell
-            emp_id_frame = ctk.CTkFrame(self.results_frame, fg_color=COLORS["black"])
-            emp_id_frame.grid(row=idx, column=0, padx=2, pady=2, sticky="nsew")
-            ctk.CTkLabel(
-                emp_id_frame,
-                text=result['emp_id'],
-                font=ctk.CTkFont(size=13)
-            ).pack(padx=10, pady=8)
-            
-            # Employee Name Cell
-            emp_name_frame = ctk.CTkFrame(self.results_frame, fg_color=COLORS["black"])
-            emp_name_frame.grid(row=idx, column=1, padx=2, pady=2, sticky="nsew")
-            ctk.CTkLabel(
-                emp_name_frame,
-                text=result['employee_name'],
-                font=ctk.CTkFont(size=13)
-            ).pack(padx=10, pady=8)
-            
-            # Item Name Cell
-            item_name_frame = ctk.CTkFrame(self.results_frame, fg_color=COLORS["black"])
-            item_name_frame.grid(row=idx, column=2, padx=2, pady=2, sticky="nsew")
-            ctk.CTkLabel(
-                item_name_frame,
-                text=result['item_name'],
-                font=ctk.CTkFont(size=13)
-            ).pack(padx=10, pady=8)
-            
-            # Unique Key Cell
-            unique_key_frame = ctk.CTkFrame(self.results_frame, fg_color=COLORS["black"])
-            unique_key_frame.grid(row=idx, column=3, padx=2, pady=2, sticky="nsew")
-            
-            unique_key_tag = ctk.CTkFrame(
-                unique_key_frame,
-                fg_color=COLORS["pink"],
-                corner_radius=6
-            )
-            unique_key_tag.pack(padx=10, pady=8)
-            ctk.CTkLabel(
-                unique_key_tag,
-                text=result['unique_key'],
-                font=ctk.CTkFont(size=12, weight="bold"),
-                text_color=COLORS["white"]
-            ).pack(padx=8, pady=2)
-
-        # Optional: No results message
-        if not results:
-            no_results_frame = ctk.CTkFrame(self.results_frame, fg_color=COLORS["black"])
-            no_results_frame.grid(row=1, column=0, columnspan=4, padx=2, pady=(10, 2), sticky="nsew")
-            ctk.CTkLabel(
-                no_results_frame,
-                text="No results found.",
-                font=ctk.CTkFont(size=14, weight="bold"),
-                text_color=COLORS["white"]
-            ).pack(padx=10, pady=8)
\ No newline at end of file
+        self.show_results_table([
+            {"title": "Employee ID", "key": "emp_id", "width": 100},
+            {"title": "Employee Name", "key": "employee_name", "width": 200},
+            {"title": "Item Name", "key": "item_name", "width": 200},
+            {"title": "Unique Key", "key": "unique_key", "kind": "tag", "width": 200},
+        ], results)
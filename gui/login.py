@@ -128,8 +128,9 @@ class LoginPage:
         print(f"Login attempt with username: {username}")
         user = authenticate_user( username, password)
         if not user:
-            self.main_frame.master.winfo_children()[0].winfo_children()[2].configure(text="Manger Tools")
-            self.main_frame.master.winfo_children()[0].winfo_children()[2].configure(command=self.show_manager_tools)
+            sidebar = self.main_frame.winfo_toplevel().winfo_children()[0]
+            sidebar.winfo_children()[2].configure(text="Manger Tools")
+            sidebar.winfo_children()[2].configure(command=self.show_manager_tools)
             self.clear_main_frame()
             self.show_manager_tools()
         else:
@@ -139,6 +140,8 @@ class LoginPage:
 
 
     def show_manager_tools(self):
+        # The sidebar button also works while the dashboard is in front
+        self.main_frame.tkraise()
         self.clear_main_frame()
         ManagerTools(self.main_frame, self.app).display()
               
@@ -0,0 +1,89 @@
+# gui/query_report.py
+
+import customtkinter as ctk
+from config import COLORS
+from controllers.instrumentation import (
+    query_instrumentation,
+    enable_instrumentation,
+    get_query_report,
+    format_query_report,
+    reset_query_stats
+)
+
+class QueryReportWindow:
+    """
+    Debug window listing the call sites, screens and statements that cost
+    the most database time. Opening it starts the instrumentation if it is
+    not running yet; the report refreshes while the window is open.
+    """
+    def __init__(self, parent, refresh_interval: int = 2000):
+        self.parent = parent
+        self.refresh_interval = refresh_interval
+        self.window = None
+        self.after_id = None
+
+    def toggle(self, event=None):
+        if self.window is not None and self.window.winfo_exists():
+            self.close()
+        else:
+            self.open()
+
+    def open(self):
+        enable_instrumentation()
+
+        self.window = ctk.CTkToplevel(self.parent)
+        self.window.title("Query Report")
+        self.window.geometry("1000x600")
+        self.window.configure(fg_color=COLORS["secondary_bg"])
+        self.window.protocol("WM_DELETE_WINDOW", self.close)
+
+        button_frame = ctk.CTkFrame(self.window, fg_color="transparent")
+        button_frame.pack(fill="x", padx=10, pady=(10, 0))
+
+        self.status_label = ctk.CTkLabel(button_frame, text="", text_color=COLORS["ash"])
+        self.status_label.pack(side="left")
+
+        for text, command in (("Reset", self.reset), ("Refresh", self.refresh)):
+            ctk.CTkButton(
+                button_frame,
+                text=text,
+                command=command,
+                fg_color=COLORS["pink"],
+                hover_color=COLORS["darker_pink"],
+                width=100
+            ).pack(side="right", padx=(10, 0))
+
+        self.textbox = ctk.CTkTextbox(
+            self.window,
+            font=ctk.CTkFont(family="Courier", size=12),
+            fg_color=COLORS["black"],
+            text_color=COLORS["white"],
+            wrap="none"
+        )
+        self.textbox.pack(fill="both", expand=True, padx=10, pady=10)
+
+        self.refresh()
+
+    def refresh(self):
+        if self.window is None or not self.window.winfo_exists():
+            return
+        if self.after_id is not None:
+            self.window.after_cancel(self.after_id)
+        report = get_query_report()
+        self.textbox.configure(state="normal")
+        self.textbox.delete("1.0", "end")
+        self.textbox.insert("1.0", format_query_report(report))
+        self.textbox.configure(state="disabled")
+        status = "collecting" if query_instrumentation.enabled else "stopped"
+        self.status_label.configure(text=f"Instrumentation {status}, refreshes every {self.refresh_interval // 1000}s")
+        self.after_id = self.window.after(self.refresh_interval, self.refresh)
+
+    def reset(self):
+        reset_query_stats()
+        self.refresh()
+
+    def close(self):
+        if self.window is not None and self.window.winfo_exists():
+            self.window.destroy()
+        self.window = None
+        self.after_id = None
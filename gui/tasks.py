@@ -0,0 +1,189 @@
+# gui/tasks.py
+
+import queue
+import itertools
+from concurrent.futures import ThreadPoolExecutor
+import customtkinter as ctk
+from tkinter import messagebox
+from controllers.instrumentation import measure
+from controllers.events import subscribe_changes, unsubscribe_changes, ALL_EVENTS
+from config import COLORS
+
+class TaskRunner:
+    """
+    Shared thread pool for blocking work started from the GUI.
+
+    Workers never touch Tk: results are queued and handed to the completion
+    callback on the Tk thread by an after() poll. Tasks submitted with a key
+    supersede earlier tasks with the same key, whose results are dropped.
+    """
+    def __init__(self, max_workers: int = 4, poll_interval: int = 30):
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="inman-task")
+        self.poll_interval = poll_interval
+        self.results = queue.Queue()
+        self.latest = {}  # key -> ticket of the newest task
+        self.futures = {}  # ticket -> Future
+        self.tickets = itertools.count(1)
+        self.polling = False
+
+    def submit(self, widget, func, *args, on_done=None, on_error=None, key=None, **kwargs):
+        """
+        Run func(*args, **kwargs) in the background
+
+        Args:
+            widget: Tk widget that owns the result; callbacks are skipped if it was destroyed
+            func: Callable to run off the Tk thread
+            on_done: Called with the result on the Tk thread
+            on_error: Called with the exception on the Tk thread, defaults to an error dialog
+            key (str, optional): Tasks with the same key cancel each other, only the newest reports back.
+                                 Also names the task's query measurement scope, which defaults to func's name
+
+        Returns:
+            int: Ticket that can be passed to cancel()
+        """
+        ticket = next(self.tickets)
+        if key is not None:
+            self.cancel(self.latest.get(key))
+            self.latest[key] = ticket
+
+        def run():
+            try:
+                with measure(key or func.__name__):
+                    result = func(*args, **kwargs)
+                self.results.put((ticket, key, widget, on_done, result, None, on_error))
+            except Exception as e:
+                self.results.put((ticket, key, widget, on_done, None, e, on_error))
+
+        self.futures[ticket] = self.executor.submit(run)
+        if not self.polling:
+            # Poll on the root window, which outlives the screens that submit work
+            self.polling = True
+            root = widget.nametowidget(".")
+            root.after(self.poll_interval, lambda: self._poll(root))
+        return ticket
+
+    def cancel(self, ticket):
+        """Drop a pending task; it is not started if still queued and its result is ignored"""
+        future = self.futures.pop(ticket, None)
+        if future is not None:
+            future.cancel()
+
+    def cancel_key(self, key):
+        self.cancel(self.latest.pop(key, None))
+
+    def _poll(self, root):
+        while True:
+            try:
+                ticket, key, owner, on_done, result, error, on_error = self.results.get_nowait()
+            except queue.Empty:
+                break
+
+            # Cancelled and superseded tasks were already removed from self.futures
+            stale = self.futures.pop(ticket, None) is None
+            if key is not None and self.latest.get(key) == ticket:
+                del self.latest[key]
+            if stale or not self._exists(owner):
+                continue
+
+            if error is not None:
+                (on_error or self._show_error)(error)
+            elif on_done is not None:
+                on_done(result)
+
+        if self.futures and self._exists(root):
+            root.after(self.poll_interval, lambda: self._poll(root))
+        else:
+            self.polling = False
+
+    @staticmethod
+    def _exists(widget):
+        try:
+            return bool(widget.winfo_exists())
+        except Exception:
+            return False
+
+    @staticmethod
+    def _show_error(error):
+        messagebox.showerror("Error", f"An error occurred: {str(error)}")
+
+# Shared runner for all screens
+task_runner = TaskRunner()
+
+def run_in_background(widget, func, *args, on_done=None, on_error=None, key=None, **kwargs):
+    """Submit work to the shared TaskRunner, see TaskRunner.submit"""
+    return task_runner.submit(widget, func, *args, on_done=on_done, on_error=on_error, key=key, **kwargs)
+
+class ChangeListeners:
+    """
+    Hands change bus events to the screens on the Tk thread.
+
+    The bus calls back on the writing thread, possibly inside the writer's
+    session, so events are only queued there. An after() poll hands them
+    to the screens once the write has returned; a screen's handlers are
+    dropped when the widget it listens with is destroyed.
+    """
+    def __init__(self, poll_interval: int = 100):
+        self.poll_interval = poll_interval
+        self.events = queue.Queue()
+        self.listeners = []  # (widget, {event type: handler})
+        self.root = None
+
+    def listen(self, widget, handlers: dict):
+        """
+        Call handlers[event["type"]](event) for change events until widget is destroyed
+
+        Args:
+            widget: Tk widget of the screen, usually its header or container
+            handlers (dict): Event type to handler, see controllers.events.EVENT_TYPES
+        """
+        if not self.listeners:
+            subscribe_changes(ALL_EVENTS, self.events.put)
+        self.listeners.append((widget, handlers))
+        if self.root is None:
+            # Poll on the root window, which outlives the screens that listen
+            self.root = widget.nametowidget(".")
+            self.root.after(self.poll_interval, self._poll)
+
+    def _poll(self):
+        while True:
+            try:
+                event = self.events.get_nowait()
+            except queue.Empty:
+                break
+
+            for widget, handlers in list(self.listeners):
+                handler = handlers.get(event["type"])
+                if handler is None or not TaskRunner._exists(widget):
+                    continue
+                try:
+                    handler(event)
+                except Exception as e:
+                    TaskRunner._show_error(e)
+
+        self.listeners = [(widget, handlers) for widget, handlers in self.listeners if TaskRunner._exists(widget)]
+        if self.listeners and TaskRunner._exists(self.root):
+            self.root.after(self.poll_interval, self._poll)
+        else:
+            unsubscribe_changes(ALL_EVENTS, self.events.put)
+            self.listeners = []
+            self.root = None
+
+# Shared change listeners for all screens
+change_listeners = ChangeListeners()
+
+def listen_for_changes(widget, handlers: dict):
+    """Patch a screen from change bus events, see ChangeListeners.listen"""
+    change_listeners.listen(widget, handlers)
+
+def show_loading(parent, text="Loading..."):
+    """Clear parent and show a loading placeholder until the results arrive"""
+    for widget in parent.winfo_children():
+        widget.destroy()
+    label = ctk.CTkLabel(
+        parent,
+        text=text,
+        font=ctk.CTkFont(size=14),
+        text_color=COLORS["ash"]
+    )
+    label.pack(pady=20)
+    return label
@@ -5,10 +5,12 @@ from controllers import (
     get_all_items_with_no_attrs, 
     get_all_employees, 
     assign_item_to_employee, 
+    bulk_assign_items,
     get_all_items_names_dict,
     get_employee_details_with_items
 )
 from controllers.crud import get_employee_details_with_items_one
+from gui.virtual_table import VirtualTable
 
 class AssignItemsToEmployees:
     def __init__(self, main_frame, return_to_manager):
@@ -87,68 +89,19 @@ class AssignItemsToEmployees:
         )
         self.container.pack(fill="both", expand=True, padx=20, pady=10)
         
-        # Scrollable frame for employees
-        self.employees_scroll = ctk.CTkScrollableFrame(
+        # Virtualized employee table
+        self.employees_table = VirtualTable(
             self.container,
-            fg_color="transparent",
-            scrollbar_button_color=COLORS["pink"],
-            scrollbar_button_hover_color=COLORS["darker_pink"]
+            [
+                {"title": "Employee ID", "key": "emp_id", "width": 150},
+                {"title": "Name", "key": "name", "width": 250},
+                {"title": "Division", "key": "division", "width": 150},
+                {"title": "Action", "kind": "button", "text": "Assign Items", "width": 150,
+                 "command": self.open_assign_items_window},
+            ],
+            self.filtered_employees
         )
-        self.employees_scroll.pack(fill="both", expand=True, padx=5, pady=5)
-
-        # Configure grid columns
-        for i in range(4):  # 4 columns
-            self.employees_scroll.grid_columnconfigure(i, weight=1)
-
-        # Headers
-        headers = ["Employee ID", "Name", "Division", "Action"]
-        for col, header in enumerate(headers):
-            header_frame = ctk.CTkFrame(self.employees_scroll, fg_color=COLORS["black"])
-            header_frame.grid(row=0, column=col, padx=2, pady=2, sticky="nsew")
-            
-            ctk.CTkLabel(
-                header_frame,
-                text=header,
-                font=ctk.CTkFont(size=14, weight="bold"),
-                text_color=COLORS["white"]
-            ).pack(padx=10, pady=8)
-        
-        # Add Employees
-        for idx, employee in enumerate(self.filtered_employees, 1):
-            self.create_employee_row(idx, employee)
-
-    def create_employee_row(self, row_idx, employee):
-        # Employee Details Cells
-        details = [
-            ("emp_id", 150),
-            ("name", 250),
-            ("division", 150)
-        ]
-
-        for col, (key, width) in enumerate(details):
-            cell_frame = ctk.CTkFrame(self.employees_scroll, fg_color=COLORS["black"])
-            cell_frame.grid(row=row_idx, column=col, padx=2, pady=2, sticky="nsew")
-            
-            ctk.CTkLabel(
-                cell_frame,
-                text=str(employee.get(key, "N/A")),
-                font=ctk.CTkFont(size=13),
-                wraplength=width-20
-            ).pack(padx=10, pady=8)
-        
-        # Action Cell
-        action_frame = ctk.CTkFrame(self.employees_scroll, fg_color=COLORS["black"])
-        action_frame.grid(row=row_idx, column=3, padx=2, pady=2, sticky="nsew")
-        
-        assign_button = ctk.CTkButton(
-            action_frame,
-            text="Assign Items",
-            command=lambda e=employee: self.open_assign_items_window(e),
-            fg_color=COLORS["pink"],
-            hover_color=COLORS["darker_pink"],
-            width=100
-        )
-        assign_button.pack(padx=10, pady=8)
+        self.employees_table.pack(fill="both", expand=True, padx=5, pady=5)
 
     def open_assign_items_window(self, employee):
         # Create a larger, more comprehensive assign window
@@ -461,6 +414,7 @@ class AssignItemsToEmployees:
             self.item_rows = [row for row in self.item_rows if row['frame'] != frame]
 
     def save_assigned_items(self, employee, assign_window):
+        assignments = []
         for row in self.item_rows:
             item_dropdown = row['dropdown']
             serial_entry = row['serial_entry']
@@ -471,21 +425,37 @@ class AssignItemsToEmployees:
             if item_name == "Select Item" or not serial_key:
                 continue  # Skip if no valid item or serial key
 
-            item_id = self.items_names_dict[item_name]
-            try:
-                attribute_details = {}
-                for attribute in row['attributes']:
-                    key = attribute['key_entry'].get()
-                    value = attribute['value_entry'].get()
-                    if key and value:
-                        attribute_details[key] = value
-                assign_item_to_employee(employee["emp_id"], item_id, serial_key, attribute_details)
-            except Exception as e:
-                print(e)
-                messagebox.showerror("Error", f"Failed to assign {item_name}: {str(e)}")
-                return
-
-        messagebox.showinfo("Success", "Items assigned successfully!")
+            attribute_details = {}
+            for attribute in row['attributes']:
+                key = attribute['key_entry'].get()
+                value = attribute['value_entry'].get()
+                if key and value:
+                    attribute_details[key] = value
+
+            assignments.append({
+                "emp_id": employee["emp_id"],
+                "item_id": self.items_names_dict[item_name],
+                "unique_key": serial_key,
+                "attrs": attribute_details
+            })
+
+        # Save every row in one transaction
+        try:
+            results = bulk_assign_items(assignments)
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to assign items: {str(e)}")
+            return
+
+        # Rows that passed validation are already saved, so close the window either way
+        failed = [result for result in results if not result["success"]]
+        if failed:
+            messagebox.showwarning(
+                "Partial Success",
+                f"Assigned {len(results) - len(failed)} item(s).\n"
+                "Failed to assign:\n" + "\n".join(f"{result['unique_key']}: {result['error']}" for result in failed)
+            )
+        else:
+            messagebox.showinfo("Success", "Items assigned successfully!")
         assign_window.destroy()
 
     def perform_search(self):
@@ -500,13 +470,7 @@ class AssignItemsToEmployees:
         if not hasattr(self, 'container'):
             self.create_employees_view()
         else:
-            # Clear existing rows, keeping headers
-            for widget in self.employees_scroll.winfo_children()[4:]:
-                widget.destroy()
-            
-            # Repopulate with filtered employees
-            for idx, employee in enumerate(self.filtered_employees, 1):
-                self.create_employee_row(idx, employee)
+            self.employees_table.set_rows(self.filtered_employees)
 
     def display(self):
         self.clear_main_frame()
@@ -1,20 +1,19 @@
 # gui/tools/bulk_employee_import.py
 
 import customtkinter as ctk
-import pandas as pd
 from tkinter import filedialog, messagebox
 from config import COLORS
-from controllers.crud import create_employee, get_all_divisions
+from controllers.crud import get_division_id_from_name
+from controllers.bulk_import import import_employees_bulk, read_employee_rows, validate_employee_row
 
 class BulkEmployeeImport:
     def __init__(self, main_frame, return_to_manager):
         self.main_frame = main_frame
         self.return_to_manager = return_to_manager
-        self.row_frames = []
-        self.default_division = "Not Assigned"  # Default value for division
-        self.current_rows = 0
-        self.division_dict = {div['name']: div['division_id'] for div in get_all_divisions()}
-        self.divisions = [div['name'] for div in get_all_divisions()]
+        self.file_path = None
+        self.rows = []
+        self.page = 0
+        self.page_size = 50
 
     def create_header(self):
         header_frame = ctk.CTkFrame(self.main_frame, fg_color="transparent")
@@ -54,7 +53,7 @@ class BulkEmployeeImport:
         # Create Import Button
         import_button = ctk.CTkButton(
             outer_frame,
-            text="Import Employees from Excel",
+            text="Load Employees from Excel",
             command=self.import_employees,
             fg_color=COLORS["pink"],
             hover_color=COLORS["darker_pink"],
@@ -74,7 +73,32 @@ class BulkEmployeeImport:
         self.scrollable_frame.pack(fill="both", expand=True, padx=5, pady=5)
 
         # Configure grid columns for the scrollable frame
-        self.scrollable_frame.grid_columnconfigure((0, 1, 2), weight=1)
+        self.scrollable_frame.grid_columnconfigure((1, 2, 3, 4), weight=1)
+
+        # Paging controls for the preview
+        paging_frame = ctk.CTkFrame(outer_frame, fg_color="transparent")
+        paging_frame.pack(fill="x", padx=5)
+
+        ctk.CTkButton(
+            paging_frame,
+            text="< Prev",
+            command=lambda: self.change_page(-1),
+            fg_color=COLORS["pink"],
+            hover_color=COLORS["darker_pink"],
+            width=80
+        ).pack(side="left", padx=5)
+
+        self.page_label = ctk.CTkLabel(paging_frame, text="No file loaded", text_color=COLORS["white"])
+        self.page_label.pack(side="left", expand=True)
+
+        ctk.CTkButton(
+            paging_frame,
+            text="Next >",
+            command=lambda: self.change_page(1),
+            fg_color=COLORS["pink"],
+            hover_color=COLORS["darker_pink"],
+            width=80
+        ).pack(side="right", padx=5)
 
         # Add a Submit button
         submit_button = ctk.CTkButton(
@@ -90,96 +114,86 @@ class BulkEmployeeImport:
         submit_button.pack(pady=10)
 
     def import_employees(self):
-        file_path = filedialog.askopenfilename(filetypes=[("Excel files", "*.xlsx;*.xls")])
+        file_path = filedialog.askopenfilename(filetypes=[("Spreadsheets", "*.xlsx;*.csv")])
         if not file_path:
             return  # User cancelled the file dialog
 
         try:
-            # Read the Excel file
-            df = pd.read_excel(file_path)
-
-            # Clear previous rows
-            self.row_frames.clear()
-            for widget in self.scrollable_frame.winfo_children():
-                widget.destroy()
-
-            # Populate the rows with data
-            for index, row in df.iterrows():
-                emp_id = row.get("EMP_ID", "")
-                name = row.get("Name", "")
-                division = row.get("Division", self.default_division)
-
-                #if not division or division == self.default_division:
-                #    messagebox.showerror("Error", f"Division is not specified for employee '{name}' (ID: {emp_id}). PLEASE SELECT AN DIVISION FROM THE DROPDOWN, IT WIL BE LABALLED AS 'NaN'.")
-                #if division not in self.divisions:
-                #    messagebox.showerror("Error", f"Division: {division} is not found in the database. Please select an available division from the dropdown for the employee : {emp_id} - {name}" )
-                self.add_row(emp_id, name, division)
-
+            # Rows are light tuples; widgets are only built for the visible page
+            division_ids = get_division_id_from_name() or {}
+            self.rows = [
+                (row_number, emp_id, name, division,
+                 validate_employee_row(emp_id, name, division, division_ids) or "OK")
+                for row_number, emp_id, name, division in read_employee_rows(file_path)
+            ]
+            self.file_path = file_path
+            self.page = 0
+            self.show_page()
         except Exception as e:
             messagebox.showerror("Error", f"Failed to load spreadsheet: {str(e)}")
 
-    def add_row(self, emp_id="", name="", division=""):
-        # Employee ID Entry
-        emp_id_entry = ctk.CTkEntry(
-            self.scrollable_frame,
-            height=35,
-            font=ctk.CTkFont(size=14),
-            fg_color=COLORS["black"],
-            border_color=COLORS["ash"],
-            border_width=2,
-            placeholder_text=""
-        )
-        emp_id_entry.grid(row=self.current_rows, column=0, padx=5, pady=5, sticky="ew")
-        emp_id_entry.insert( 0, emp_id)  # Set the value instead of placeholder
-        
-        # Name Entry
-        name_entry = ctk.CTkEntry(
-            self.scrollable_frame,
-            height=35,
-            font=ctk.CTkFont(size=14),
-            fg_color=COLORS["black"],
-            border_color=COLORS["ash"],
-            border_width=2,
-            placeholder_text=""
+    def show_page(self):
+        for widget in self.scrollable_frame.winfo_children():
+            widget.destroy()
+
+        headers = ("Row", "Employee ID", "Name", "Division", "Status")
+        for column, text in enumerate(headers):
+            ctk.CTkLabel(
+                self.scrollable_frame,
+                text=text,
+                font=ctk.CTkFont(size=14, weight="bold"),
+                text_color=COLORS["pink"]
+            ).grid(row=0, column=column, padx=5, pady=5, sticky="w")
+
+        start = self.page * self.page_size
+        for index, row in enumerate(self.rows[start:start + self.page_size], 1):
+            status = row[-1]
+            for column, value in enumerate(row):
+                ctk.CTkLabel(
+                    self.scrollable_frame,
+                    text=str(value),
+                    font=ctk.CTkFont(size=14),
+                    text_color=COLORS["white"] if status == "OK" or column < 4 else COLORS["pink"]
+                ).grid(row=index, column=column, padx=5, pady=2, sticky="w")
+
+        pages = max(1, -(-len(self.rows) // self.page_size))
+        invalid = sum(1 for row in self.rows if row[-1] != "OK")
+        self.page_label.configure(
+            text=f"Page {self.page + 1} of {pages}  |  {len(self.rows)} rows, {invalid} with errors"
         )
-        name_entry.grid(row=self.current_rows, column=1, padx=5, pady=5, sticky="ew")
-        name_entry.insert(0, name)  # Set the value instead of placeholder
-        
-        # Division Dropdown
-        division_entry = ctk.CTkComboBox(
-            self.scrollable_frame,
-            height=35,
-            font=ctk.CTkFont(size=14),
-            fg_color=COLORS["black"],
-            border_color=COLORS["ash"],
-            button_color=COLORS["pink"],
-            button_hover_color=COLORS["darker_pink"],
-            dropdown_fg_color=COLORS["black"],
-            values=self.divisions,
-            state="readonly"
-        )
-        division_entry.grid(row=self.current_rows, column=2, padx=5, pady=5, sticky="ew")
-        division_entry.set(division)  # Set the division if provided
-        
-        # Store the row's widgets for later access
-        self.row_frames.append((emp_id_entry, name_entry, division_entry))
-        self.current_rows += 1  # Increment the row count
+
+    def change_page(self, step):
+        pages = max(1, -(-len(self.rows) // self.page_size))
+        page = self.page + step
+        if 0 <= page < pages:
+            self.page = page
+            self.show_page()
 
     def submit_employees(self):
-        x = []
-        for emp_id_entry, name_entry, division_entry in self.row_frames:
-            emp_id = emp_id_entry.get()
-            name = name_entry.get()
-            division = division_entry.get()
-            if emp_id and name:
-                c = create_employee(emp_id, name, self.division_dict[division])
-                x.append(c)
-        
-        if False not in x:
-            messagebox.showinfo("Employee Create", "Employees created successfully.")
-        else:
-            messagebox.showerror("Employee Create", "There were some errors!")
-        
+        if not self.file_path:
+            messagebox.showerror("Employee Create", "Please import a spreadsheet first.")
+            return
+
+        try:
+            report = import_employees_bulk(self.file_path)
+        except Exception as e:
+            messagebox.showerror("Employee Create", f"Import failed: {str(e)}")
+            return
+
+        summary = f"Created: {report['created']}, Updated: {report['updated']}"
+        if not report["errors"]:
+            messagebox.showinfo("Employee Create", f"Employees imported successfully.\n{summary}")
+            return
+
+        details = "\n".join(
+            f"Row {error['row']} ({error['emp_id']}): {error['error']}" for error in report["errors"][:20]
+        )
+        if len(report["errors"]) > 20:
+            details += f"\n... and {len(report['errors']) - 20} more"
+        messagebox.showwarning(
+            "Employee Create",
+            f"{summary}\n{len(report['errors'])} row(s) were skipped:\n\n{details}"
+        )
 
     def display(self):
         self.clear_main_frame()
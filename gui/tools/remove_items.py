@@ -4,6 +4,8 @@ import customtkinter as ctk
 from config import COLORS
 import tkinter.messagebox as messagebox
 from controllers import get_all_items, delete_item
+from gui.virtual_table import VirtualTable
+from gui.tasks import listen_for_changes
 
 class RemoveItem:
     def __init__(self, main_frame, return_to_manager):
@@ -90,93 +92,22 @@ class RemoveItem:
         )
         container.pack(fill="both", expand=True, padx=20, pady=10)
         
-        # Scrollable Frame
-        self.items_scroll = ctk.CTkScrollableFrame(
+        # Virtualized item table
+        self.items_table = VirtualTable(
             container,
-            fg_color="transparent",
-            scrollbar_button_color=COLORS["pink"],
-            scrollbar_button_hover_color=COLORS["darker_pink"]
+            [
+                {"title": "Select", "kind": "check", "width": 80,
+                 "selected": lambda item: item.item_id in self.selected_items,
+                 "command": self.toggle_item_selection, "header_command": self.toggle_select_all},
+                {"title": "Item ID", "key": "item_id", "width": 100},
+                {"title": "Item Name", "key": "name", "width": 200},
+                {"title": "Action", "kind": "button", "text": "Remove", "width": 120,
+                 "command": self.confirm_remove_item},
+            ],
+            self.filtered_items
         )
-        self.items_scroll.pack(fill="both", expand=True, padx=5, pady=5)
-                
-        # Create Headers
-        self.headers = ["Select", "Item ID", "Item Name",  "Action"]
-        self.item_params = ["item_id", "name"]
-
-        # Configure grid weights to make it more responsive
-        for i in range(len(self.headers)):  # Dynamically based on headers
-            self.items_scroll.grid_columnconfigure(i, weight=1)
-
-        for col, header in enumerate(self.headers):
-            header_frame = ctk.CTkFrame(self.items_scroll, fg_color=COLORS["black"])
-            header_frame.grid(row=0, column=col, padx=2, pady=2, sticky="nsew")
-
-            if header == "Select":
-                # Select All Checkbox
-                self.select_all_checkbox = ctk.CTkCheckBox(
-                    header_frame,
-                    text="",
-                    command=self.toggle_select_all,
-                    fg_color=COLORS["pink"],
-                    hover_color=COLORS["darker_pink"],
-                    checkmark_color=COLORS["white"]
-                )
-                self.select_all_checkbox.pack(padx=10, pady=8)
-            else:
-                ctk.CTkLabel(
-                    header_frame,
-                    text=header,
-                    font=ctk.CTkFont(size=14, weight="bold"),
-                    text_color=COLORS["white"]
-                ).pack(padx=10, pady=8)
-        
-        # Add Items with proper row indexing
-        for idx, item in enumerate(self.filtered_items, 1):
-            self.create_item_row(idx, item)
-
-    def create_item_row(self, row_idx, item):
-        # Select Checkbox Cell
-        select_frame = ctk.CTkFrame(self.items_scroll, fg_color=COLORS["black"])
-        select_frame.grid(row=row_idx, column=0, padx=2, pady=2, sticky="nsew")
-
-        checkbox = ctk.CTkCheckBox(
-            select_frame,
-            text="",
-            command=lambda i=item: self.toggle_item_selection(i),
-            fg_color=COLORS["pink"],
-            hover_color=COLORS["darker_pink"],
-            checkmark_color=COLORS["white"]
-        )
-        if item.item_id in self.selected_items:
-            checkbox.select()
-        checkbox.pack(padx=10, pady=8)
-
-        # Create item cells dynamically based on params
-        for col, param in enumerate(self.item_params, 1):  # Start from column 1
-            cell_frame = ctk.CTkFrame(self.items_scroll, fg_color=COLORS["black"])
-            cell_frame.grid(row=row_idx, column=col, padx=2, pady=2, sticky="nsew")
-
-            # Accessing the item attributes directly
-            ctk.CTkLabel(
-                cell_frame,
-                text=str(getattr(item, param)),  # Use the retrieved value
-                font=ctk.CTkFont(size=13),
-                wraplength=100  # Adjust wraplength as needed
-            ).pack(padx=10, pady=8)
-
-        # Action Cell
-        action_frame = ctk.CTkFrame(self.items_scroll, fg_color=COLORS["black"])
-        action_frame.grid(row=row_idx, column=len(self.headers) - 1, padx=2, pady=2, sticky="nsew")  # Column index for Action
-
-        remove_button = ctk.CTkButton(
-            action_frame,
-            text="Remove",
-            command=lambda i=item: self.confirm_remove_item(i),
-            fg_color=COLORS["pink"],
-            hover_color=COLORS["darker_pink"],
-            width=100
-        )
-        remove_button.pack(padx=10, pady=8)
+        self.items_table.pack(fill="both", expand=True, padx=5, pady=5)
+        self.select_all_checkbox = self.items_table.header_widgets[0]
 
     def perform_search(self):
         search_term = self.search_entry.get().lower()
@@ -187,39 +118,9 @@ class RemoveItem:
                 )
         ]
         
-        # Clear previous items
-        for widget in self.items_scroll.winfo_children():
-            widget.destroy()
-        
-        # Recreate headers
-        for col, header in enumerate(self.headers):
-            header_frame = ctk.CTkFrame(self.items_scroll, fg_color=COLORS["black"])
-            header_frame.grid(row=0, column=col, padx=2, pady=2, sticky="nsew")
-
-            if header == "Select":
-                # Select All Checkbox
-                self.select_all_checkbox = ctk.CTkCheckBox(
-                    header_frame,
-                    text="",
-                    command=self.toggle_select_all,
-                    fg_color=COLORS["pink"],
-                    hover_color=COLORS["darker_pink"],
-                    checkmark_color=COLORS["white"]
-                )
-                self.select_all_checkbox.pack(padx=10, pady=8)
-            else:
-                ctk.CTkLabel(
-                    header_frame,
-                    text=header,
-                    font=ctk.CTkFont(size=14, weight="bold"),
-                    text_color=COLORS["white"]
-                ).pack(padx=10, pady=8)
-        
-        # Add filtered items
-        for idx, item in enumerate(self.filtered_items, 1):
-            self.create_item_row(idx, item)
+        self.items_table.set_rows(self.filtered_items)
 
-        # Update UI state after recreating the view
+        # Update UI state after refreshing the list
         self.update_select_all_checkbox()
         self.update_bulk_remove_button()
 
@@ -234,13 +135,19 @@ class RemoveItem:
             self.remove_item(item)
 
     def remove_item(self, item):
-        # Remove item from data source
-        q = delete_item(item.item_id)
-        self.items_data = get_all_items()
-        self.filtered_items = self.items_data.copy()
-                
-        self.display()
-        
+        # The item_deleted event removes it from the table
+        delete_item(item.item_id)
+
+    def on_items_deleted(self, event):
+        # Drop the deleted items locally instead of reloading every item
+        deleted = set(event["item_ids"])
+        self.items_data = [item for item in self.items_data if item.item_id not in deleted]
+        self.filtered_items = [item for item in self.filtered_items if item.item_id not in deleted]
+        self.selected_items -= deleted
+
+        self.items_table.set_rows(self.filtered_items)
+        self.update_select_all_checkbox()
+        self.update_bulk_remove_button()
 
     def display(self):
         self.clear_main_frame()
@@ -248,6 +155,7 @@ class RemoveItem:
         self.create_items_view()
         self.update_select_all_checkbox()
         self.update_bulk_remove_button()
+        listen_for_changes(self.items_table, {"item_deleted": self.on_items_deleted})
 
     def toggle_select_all(self):
         if self.select_all_checkbox.get():
@@ -257,7 +165,7 @@ class RemoveItem:
             # Deselect all
             self.selected_items.clear()
 
-        self.display()  # Refresh the view to show checkbox states
+        self.items_table.refresh()  # Redraw the visible checkboxes
         self.update_select_all_checkbox()
         self.update_bulk_remove_button()
 
@@ -310,14 +218,9 @@ class RemoveItem:
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to remove item {item_id}: {str(e)}")
 
-        # Clear selections
+        # Removed items leave the table through their item_deleted events
         self.selected_items.clear()
-
-        # Refresh data and display
-        self.items_data = get_all_items()
-        self.filtered_items = self.items_data.copy()
         self.update_bulk_remove_button()
-        self.display()
 
         # Show success message
         if removed_count > 0:
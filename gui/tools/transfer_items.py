@@ -4,7 +4,8 @@ from tkinter import messagebox
 import customtkinter as ctk
 from config import COLORS
 import tkinter as tk
-from controllers.crud import transfer_item
+from controllers.crud import transfer_items_bulk
+from gui.tasks import run_in_background
 from utils import search_employees, get_employee_items
 from models.database import  SessionLocal
 
@@ -225,43 +226,19 @@ class TransferItemBetweenEmployees:
                 messagebox.showwarning("No Items Selected", "Please select at least one item to transfer.")
                 return
 
-            # Perform transfers
-            successful_transfers = 0
-            failed_transfers = 0
-            failed_items = []
-
-            for item in self.selected_items_to_transfer:
-                try:
-                    # Use the transfer_item function from CRUD
-                    transfer_item(
-                        from_emp_id=self.selected_source_user['emp_id'], 
-                        to_emp_id=self.selected_destination_user['emp_id'], 
-                        item_id=item['id'],
-                        unique_key=item['unique_key'],
-                        notes=f"Transferred between employees"
-                    )
-                    successful_transfers += 1
-
-                except Exception as e:
-                    messagebox.showerror("Transfer Error", 
-                        f"Failed to transfer item '{item['name']}': {str(e)}")
-                    failed_transfers += 1
-                    failed_items.append(item['name'])
-
-            # Provide transfer summary
-            if successful_transfers > 0 and failed_transfers == 0:
-                messagebox.showinfo("Success", 
-                    f"Successfully transferred {successful_transfers} item(s).")
-            elif successful_transfers > 0 and failed_transfers > 0:
-                messagebox.showwarning("Partial Success", 
-                    f"Transferred {successful_transfers} item(s).\n"
-                    f"Failed to transfer {failed_transfers} item(s): {', '.join(failed_items)}")
-            elif failed_transfers > 0:
-                messagebox.showerror("Transfer Failed", 
-                    f"Failed to transfer {failed_transfers} item(s): {', '.join(failed_items)}")
-
-            # Clear selection and refresh view
-            self.clear_selection()
+            # Move all selected assignments in one transaction
+            source = self.selected_source_user
+            destination = self.selected_destination_user
+            run_in_background(
+                self.main_frame,
+                transfer_items_bulk,
+                from_emp_id=source['emp_id'],
+                to_emp_id=destination['emp_id'],
+                assignment_ids=[item['assignment_id'] for item in self.selected_items_to_transfer],
+                notes="Transferred between employees",
+                on_done=self.on_transfer_done,
+                on_error=self.on_transfer_error
+            )
 
         ok_button = ctk.CTkButton(
             button_frame,
@@ -287,6 +264,18 @@ class TransferItemBetweenEmployees:
         )
         cancel_button.pack(side="right", padx=10)
 
+    def on_transfer_done(self, result):
+        messagebox.showinfo("Success", 
+            f"Successfully transferred {result['transferred']} item(s).")
+
+        # Clear selection and refresh view
+        self.clear_selection()
+
+    def on_transfer_error(self, error):
+        # The transfer is atomic, so no item was moved
+        messagebox.showerror("Transfer Failed", 
+            f"No items were transferred: {str(error)}")
+
     def get_user_items(self, user_emp_id):
         # Create a database session
         db = SessionLocal()
@@ -301,6 +290,7 @@ class TransferItemBetweenEmployees:
                 {
                     'name': emp_item.item.name,
                     'id': emp_item.item.item_id,
+                    'assignment_id': emp_item.id,
                     'unique_key': emp_item.unique_key
 
                 } 
@@ -406,6 +396,17 @@ class TransferItemBetweenEmployees:
 
         print(f"Selected {'Source' if is_source else 'Destination'} User: {user['name']}")
 
+    def clear_selection(self):
+        # Reset both selections so the next transfer starts fresh
+        for button in (self.source_selected_button, self.destination_selected_button):
+            if button is not None and button.winfo_exists():
+                button.configure(fg_color=COLORS["pink"], text="Select", state="normal")
+        self.selected_source_user = None
+        self.selected_destination_user = None
+        self.source_selected_button = None
+        self.destination_selected_button = None
+        self.selected_items_to_transfer = []
+
     def bind_search_events(self):
         self.source_search_input.bind("<Return>", lambda event: self.search_user(self.source_search_input.get(), is_source=True))
         self.destination_search_input.bind("<Return>", lambda event: self.search_user(self.destination_search_input.get(), is_source=False))
@@ -3,7 +3,8 @@
 import customtkinter as ctk
 import tkinter.messagebox as messagebox
 from config import COLORS
-from controllers.crud import get_all_division_names, get_all_divisions, get_division_id_from_name, get_employee_details_with_items, remove_item_attribute, remove_item_from_employee, save_item_attribute, update_employee, update_employee_id
+from controllers.crud import get_all_division_names, get_all_divisions, get_division_id_from_name, get_employee_details_with_items, get_employee_details_with_items_many, remove_item_attribute, remove_item_from_employee, save_item_attribute, update_employee, update_employee_id
+from gui.tasks import listen_for_changes, run_in_background
 
 class UpdateEmployeeDetail:
     def __init__(self, main_frame, return_to_manager):
@@ -11,6 +12,12 @@ class UpdateEmployeeDetail:
         self.return_to_manager = return_to_manager
         self.employees = []
         self.filtered_employees = []
+        self.search_term = ""
+        self.row_widgets = {}  # emp_id -> (value labels, update button) of the shown rows
+        self.update_window = None
+        self.dialog_emp_id = None
+        self.pending_emp_ids = set()  # Named by change events, waiting to be reloaded
+        self.loading_changes = False
         self.divisions = get_all_division_names()
         self.load_employees()
 
@@ -25,9 +32,108 @@ class UpdateEmployeeDetail:
         } for emp in employee_details]
         self.filtered_employees = self.employees.copy()
 
+    def replace_employees(self, changes):
+        """Swap employees in the local lists and the table, {emp_id: employee or None to remove}"""
+        positions = {emp["emp_id"]: i for i, emp in enumerate(self.employees)}
+        for emp_id, employee in changes.items():
+            if emp_id in positions:
+                self.employees[positions[emp_id]] = employee
+            elif employee is not None:
+                self.employees.append(employee)
+        self.employees = [emp for emp in self.employees if emp is not None]
+
+        positions = {emp["emp_id"]: i for i, emp in enumerate(self.filtered_employees)}
+        updated_rows = []
+        rebuild = False
+        for emp_id, employee in changes.items():
+            if emp_id in positions:
+                self.filtered_employees[positions[emp_id]] = employee
+                if employee is not None and employee["emp_id"] == emp_id and emp_id in self.row_widgets:
+                    updated_rows.append(employee)
+                else:
+                    rebuild = True
+            elif employee is not None and self.matches_search(employee):
+                # New employees are shown if there is no search or they match it
+                self.filtered_employees.append(employee)
+                rebuild = True
+        self.filtered_employees = [emp for emp in self.filtered_employees if emp is not None]
+
+        # Rebuild the table at most once, however many employees changed
+        if rebuild:
+            self.create_employees_view()
+        else:
+            for employee in updated_rows:
+                self.update_employee_row(employee)
+
+    def reopen_update_dialog(self, emp_id, employee):
+        # Show the changed data if the dialog of this employee is open
+        if self.dialog_emp_id != emp_id or self.update_window is None or not self.update_window.winfo_exists():
+            return
+        self.update_window.destroy()
+        if employee is not None:
+            self.open_update_dialog(employee)
+
+    def on_employees_changed(self, event):
+        # Reload only the employees the event names, in one background load per burst of events
+        self.pending_emp_ids.update(event["emp_ids"])
+        if not self.loading_changes:
+            self.load_changed_employees()
+
+    def load_changed_employees(self):
+        emp_ids = self.pending_emp_ids
+        self.pending_emp_ids = set()
+        self.loading_changes = True
+        run_in_background(
+            self.header_frame,
+            get_employee_details_with_items_many,
+            emp_ids,
+            on_done=lambda employees: self.on_changed_employees_loaded(emp_ids, employees),
+            on_error=self.on_changed_employees_error
+        )
+
+    def on_changed_employees_loaded(self, emp_ids, employees):
+        self.loading_changes = False
+        self.replace_employees({emp_id: employees.get(emp_id) for emp_id in emp_ids})
+        for emp_id in emp_ids:
+            self.reopen_update_dialog(emp_id, employees.get(emp_id))
+        if self.pending_emp_ids:
+            self.load_changed_employees()
+
+    def on_changed_employees_error(self, error):
+        self.loading_changes = False
+        self.show_reload_error(error)
+
+    def show_reload_error(self, error):
+        messagebox.showerror("Error", f"Could not reload changed employees: {str(error)}")
+
+    def on_employees_deleted(self, event):
+        self.replace_employees({emp_id: None for emp_id in event["emp_ids"]})
+        for emp_id in event["emp_ids"]:
+            self.reopen_update_dialog(emp_id, None)
+
+    def on_employee_id_changed(self, event):
+        renames = dict(zip(event["emp_ids"], event["new_emp_ids"]))
+        run_in_background(
+            self.header_frame,
+            get_employee_details_with_items_many,
+            list(renames.values()),
+            on_done=lambda employees: self.on_renamed_employees_loaded(renames, employees),
+            on_error=self.show_reload_error
+        )
+
+    def on_renamed_employees_loaded(self, renames, employees):
+        self.replace_employees({old_id: employees.get(new_id) for old_id, new_id in renames.items()})
+        for old_id in renames:
+            self.reopen_update_dialog(old_id, None)
+
+    def on_divisions_changed(self, event):
+        # Division names are a cached lookup, kept for the dialog's dropdown
+        self.divisions = get_all_division_names()
+
     def create_header(self):
         header_frame = ctk.CTkFrame(self.main_frame, fg_color="transparent")
         header_frame.pack(fill="x", padx=20, pady=(20, 10))
+        self.header_frame = header_frame
         
         # Back Button
         back_button = ctk.CTkButton(
@@ -89,6 +195,7 @@ class UpdateEmployeeDetail:
             border_color=COLORS["white"]
         )
         self.container.pack(fill="both", expand=True, padx=20, pady=10)
+        self.row_widgets = {}
         
         self.employees_scroll = ctk.CTkScrollableFrame(
             self.container,
@@ -126,6 +233,7 @@ class UpdateEmployeeDetail:
             ("items", 100, lambda e: str(len(e.get("items", []))))
         ]
 
+        labels = []
         for col, (key, width, *transform) in enumerate(details):
             cell_frame = ctk.CTkFrame(self.employees_scroll, fg_color=COLORS["black"])
             cell_frame.grid(row=row_idx, column=col, padx=2, pady=2, sticky="nsew")
@@ -134,12 +242,14 @@ class UpdateEmployeeDetail:
             if transform:
                 value = transform[0](employee)
                 
-            ctk.CTkLabel(
+            label = ctk.CTkLabel(
                 cell_frame,
                 text=str(value),
                 font=ctk.CTkFont(size=13),
                 wraplength=width-20
-            ).pack(padx=10, pady=8)
+            )
+            label.pack(padx=10, pady=8)
+            labels.append(label)
         
         # Action Cell
         action_frame = ctk.CTkFrame(self.employees_scroll, fg_color=COLORS["black"])
@@ -154,8 +264,17 @@ class UpdateEmployeeDetail:
             width=100
         )
         update_button.pack(padx=10, pady=8)
+        self.row_widgets[employee["emp_id"]] = (labels, update_button)
+
+    def update_employee_row(self, employee):
+        labels, update_button = self.row_widgets[employee["emp_id"]]
+        values = [employee["emp_id"], employee["name"], employee["division"], len(employee.get("items", []))]
+        for label, value in zip(labels, values):
+            label.configure(text=str(value))
+        update_button.configure(command=lambda e=employee: self.open_update_dialog(e))
 
     def open_update_dialog(self, employee):
+        self.dialog_emp_id = employee['emp_id']
         self.update_window = ctk.CTkToplevel(self.main_frame)
         self.update_window.title(f"Update Employee: {employee['emp_id']}")
         self.update_window.geometry("700x650")
@@ -373,13 +492,8 @@ class UpdateEmployeeDetail:
 
         result = save_item_attribute(emp_id, item_id, name, value)
         if result:
+            # The assignment_updated event refreshes this employee and the dialog
             window.destroy()
-            self.load_employees()  # Refresh the employee data
-            self.update_window.destroy()
-            employee = next((emp for emp in self.employees if emp['emp_id'] == emp_id), None)
-            if employee:
-                self.open_update_dialog(employee)
-            self.create_employees_view()
             messagebox.showinfo("Success", f"Attribute '{name}: {value}' added successfully.")
 
         else:
@@ -388,12 +502,6 @@ class UpdateEmployeeDetail:
     def remove_attribute(self, emp_id, item_id, name):
         result = remove_item_attribute(emp_id, item_id, name)
         if result:
-            self.update_window.destroy()
-            self.load_employees()  # Refresh the employee data
-            employee = next((emp for emp in self.employees if emp['emp_id'] == emp_id), None)
-            if employee:
-                self.open_update_dialog(employee)
-            self.create_employees_view()
             messagebox.showinfo(
                 "Attribute Removed", 
                 f"Attribute '{name}' removed successfully from item {item_id}"
@@ -467,8 +575,6 @@ class UpdateEmployeeDetail:
                 messagebox.showinfo("Succe+++ss", f"Employee ID updated from {old_id} to {new_id}")
                 window.destroy()
                 self.update_window.destroy()
-                self.load_employees()
-                self.create_employees_view()
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to update employee ID: {str(e)}")
 
@@ -479,8 +585,6 @@ class UpdateEmployeeDetail:
             
             messagebox.showinfo("Success", f"Employee {emp_id} details updated successfully")
             self.update_window.destroy()
-            self.load_employees()
-            self.create_employees_view()
         except Exception as e:
             messagebox.showerror("Error", f"Failed to update employee details: {str(e)}")
 
@@ -490,24 +594,10 @@ class UpdateEmployeeDetail:
             result = remove_item_from_employee(emp_id, item_id)
             
             if result:
-                # Remove the item frame from the GUI
-                self.load_employees()
+                # Remove the item frame from the GUI, the assignment_deleted
+                # event then refreshes this employee and the dialog
                 item_frame.destroy()
                 
-                # Fully refresh the update dialog
-                self.update_window.destroy()  # Close current update window
-                
-                # Find the specific employee again
-                employee = next((emp for emp in self.employees if emp['emp_id'] == emp_id), None)
-                
-                if employee:
-                    # Reopen the update dialog with refreshed data
-                    self.open_update_dialog(employee)
-                
-                # Optionally refresh the main employees view
-                
-                self.create_employees_view()
-                
                 # Show success message
                 messagebox.showinfo(
                     "Item Removed", 
@@ -525,14 +615,14 @@ class UpdateEmployeeDetail:
                 f"An error occurred while removing the item: {str(e)}"
             )
 
+    def matches_search(self, employee):
+        return (self.search_term in employee["emp_id"].lower() or 
+                self.search_term in employee["name"].lower() or 
+                self.search_term in employee["division"].lower())
+
     def perform_search(self):
-        search_term = self.search_entry.get().lower()
-        self.filtered_employees = [
-            emp for emp in self.employees 
-            if (search_term in emp["emp_id"].lower() or 
-                search_term in emp["name"].lower() or 
-                search_term in emp["division"].lower())
-        ]
+        self.search_term = self.search_entry.get().lower()
+        self.filtered_employees = [emp for emp in self.employees if self.matches_search(emp)]
         
         # Refresh the employee view
         self.create_employees_view()
@@ -541,6 +631,19 @@ class UpdateEmployeeDetail:
         self.clear_main_frame()
         self.create_header()
         self.create_employees_view()
+        listen_for_changes(self.header_frame, {
+            "employee_created": self.on_employees_changed,
+            "employee_updated": self.on_employees_changed,
+            "employee_deleted": self.on_employees_deleted,
+            "employee_id_changed": self.on_employee_id_changed,
+            "assignment_created": self.on_employees_changed,
+            "assignment_updated": self.on_employees_changed,
+            "assignment_deleted": self.on_employees_changed,
+            "assignment_transferred": self.on_employees_changed,
+            "division_created": self.on_divisions_changed,
+            "division_updated": self.on_divisions_changed,
+            "division_deleted": self.on_divisions_changed
+        })
 
     def clear_main_frame(self):
         for widget in self.main_frame.winfo_children():
@@ -3,13 +3,15 @@
 import customtkinter as ctk
 from config import COLORS
 from tkinter import ttk
-from models.database import SessionLocal
-from utils.search import search_logs
+from utils.search import search_logs_page
+from gui.tasks import run_in_background
 
 class ViewAssetAssignment:
     def __init__(self, main_frame, return_to_manager):
         self.main_frame = main_frame
         self.return_to_manager = return_to_manager
+        self.search_term = ""
+        self.next_cursor = None
 
     def create_header(self):
         header_frame = ctk.CTkFrame(self.main_frame, fg_color="transparent")
@@ -70,16 +72,15 @@ class ViewAssetAssignment:
         # Create Treeview
         self.logs_tree = ttk.Treeview(
             self.logs_frame, 
-            columns=("Employee Name", "Employee ID", "Item Name", "Item Unique Key", "Timestamp"), 
+            columns=("Timestamp", "Action", "Details"), 
             show='headings'
         )
         
         # Configure column headings
-        self.logs_tree.heading("Employee Name", text="Employee Name")
-        self.logs_tree.heading("Employee ID", text="Employee ID")
-        self.logs_tree.heading("Item Name", text="Item Name")
-        self.logs_tree.heading("Item Unique Key", text="Item Unique Key")
         self.logs_tree.heading("Timestamp", text="Timestamp")
+        self.logs_tree.heading("Action", text="Action")
+        self.logs_tree.heading("Details", text="Details")
+        self.logs_tree.column("Details", width=500)
 
         # Add scrollbar
         scrollbar = ttk.Scrollbar(self.logs_frame, orient="vertical", command=self.logs_tree.yview)
@@ -88,6 +89,18 @@ class ViewAssetAssignment:
 
         self.logs_tree.pack(fill="both", expand=True)
 
+        # Logs are fetched one page at a time
+        self.load_more_button = ctk.CTkButton(
+            main_container,
+            text="Load More",
+            command=self.load_more,
+            fg_color=COLORS["pink"],
+            hover_color=COLORS["darker_pink"],
+            state="disabled",
+            height=35
+        )
+        self.load_more_button.pack(pady=(0, 10))
+
         # Bind search event
         self.bind_search_events()
 
@@ -99,31 +112,37 @@ class ViewAssetAssignment:
         for item in self.logs_tree.get_children():
             self.logs_tree.delete(item)
 
-        search_term = self.search_input.get()
-        
-        # Create a database session
-        db = SessionLocal()
-        
-        try:
-            # Use search_logs function to find matching logs
-            matching_logs = search_logs(db, search_term, action_type="assign_item")
-            
-            # Insert logs into treeview
-            for log in matching_logs:
-                self.logs_tree.insert("", "end", values=(
-                    log.employee_name, 
-                    log.employee_id, 
-                    log.item_name, 
-                    log.unique_key, 
-                    log.timestamp
-                ))
-        
-        except Exception as e:
-            print(f"Error searching logs: {e}")
-        
-        finally:
-            # Always close the database session
-            db.close()
+        self.search_term = self.search_input.get()
+        self.next_cursor = None
+        self.fetch_page()
+
+    def load_more(self):
+        if self.next_cursor:
+            self.fetch_page()
+
+    def fetch_page(self):
+        self.load_more_button.configure(state="disabled")
+        run_in_background(
+            self.logs_tree,
+            search_logs_page,
+            self.search_term,
+            action_type="assign_item",
+            cursor=self.next_cursor,
+            on_done=self.show_page,
+            key="asset_assignment_logs"
+        )
+
+    def show_page(self, page):
+        # Insert logs into treeview
+        for log in page["items"]:
+            self.logs_tree.insert("", "end", values=(
+                log.timestamp,
+                log.action_type,
+                log.details
+            ))
+
+        self.next_cursor = page["next_cursor"]
+        self.load_more_button.configure(state="normal" if self.next_cursor else "disabled")
 
     def export_logs(self):
         # Placeholder for export functionality
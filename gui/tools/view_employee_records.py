@@ -4,15 +4,17 @@ import customtkinter as ctk
 import tkinter.messagebox as messagebox
 from config import COLORS
 from controllers import get_employee_details_with_items
+from gui.tasks import run_in_background
+from gui.virtual_table import VirtualTable
 
 class ViewEmployeeRecords:
     def __init__(self, main_frame, return_to_manager):
         self.main_frame = main_frame
         self.return_to_manager = return_to_manager
         
-        # Placeholder for employee data - you'll replace this with actual database query
-        self.employees = get_employee_details_with_items()
-        self.filtered_employees = self.employees.copy()
+        # Employee data is loaded in the background the first time the view is shown
+        self.employees = None
+        self.filtered_employees = []
 
     def create_header(self):
         header_frame = ctk.CTkFrame(self.main_frame, fg_color="transparent")
@@ -100,18 +102,28 @@ class ViewEmployeeRecords:
         )
         employees_title.pack(pady=(0,10))
 
-        # Scrollable Employees List
-        self.employees_scroll = ctk.CTkScrollableFrame(
+        # Virtualized Employees List
+        self.employees_table = VirtualTable(
             self.employees_list_frame,
-            fg_color="transparent",
-            scrollbar_button_color=COLORS["pink"],
-            scrollbar_button_hover_color=COLORS["darker_pink"]
+            [
+                {"title": "Employee", "key": lambda emp: f"{emp['emp_id']} - {emp['name']}", "width": 200},
+                {"title": "Division", "key": "division", "width": 120},
+            ],
+            on_row_click=self.show_employee_items
         )
-        self.employees_scroll.pack(fill="both", expand=True)
+        self.employees_table.pack(fill="both", expand=True)
 
         # Populate Employees
-        for employee in self.filtered_employees:
-            self.create_employee_row(employee)
+        if self.employees is None:
+            self.employees_table.show_message("Loading employees...")
+            run_in_background(
+                self.employees_table,
+                get_employee_details_with_items,
+                on_done=self.on_employees_loaded,
+                key="employee-records"
+            )
+        else:
+            self.employees_table.set_rows(self.filtered_employees)
 
         # Items Details Section
         items_title = ctk.CTkLabel(
@@ -131,37 +143,10 @@ class ViewEmployeeRecords:
         )
         self.items_scroll.pack(fill="both", expand=True)
 
-    def create_employee_row(self, employee):
-        employee_frame = ctk.CTkFrame(
-            self.employees_scroll, 
-            fg_color=COLORS["black"],
-            corner_radius=10
-        )
-        employee_frame.pack(fill="x", pady=5)
-
-        # Employee Info
-        info_frame = ctk.CTkFrame(employee_frame, fg_color="transparent")
-        info_frame.pack(padx=10, pady=10, fill="x")
-
-        ctk.CTkLabel(
-            info_frame, 
-            text=f"{employee['emp_id']} - {employee['name']}",
-            font=ctk.CTkFont(size=14, weight="bold")
-        ).pack(side="left")
-
-        ctk.CTkLabel(
-            info_frame, 
-            text=employee['division'],
-            font=ctk.CTkFont(size=12)
-        ).pack(side="right")
-
-        # Bind click event to show employee items
-        employee_frame.bind("<Button-1>", lambda e, emp=employee: self.show_employee_items(emp))
-        info_frame.bind("<Button-1>", lambda e, emp=employee: self.show_employee_items(emp))  # Added this line
-        employee_frame.bind("<Enter>", lambda e: employee_frame.configure(fg_color=COLORS["pink"]))
-        employee_frame.bind("<Leave>", lambda e: employee_frame.configure(fg_color=COLORS["black"]))
-        info_frame.bind("<Enter>", lambda e: employee_frame.configure(fg_color=COLORS["pink"]))
-        info_frame.bind("<Leave>", lambda e: employee_frame.configure(fg_color=COLORS["black"]))
+    def on_employees_loaded(self, employees):
+        self.employees = employees
+        self.filtered_employees = employees.copy()
+        self.employees_table.set_rows(self.filtered_employees)
 
     def show_employee_items(self, employee):
         # Clear previous items
@@ -337,16 +322,19 @@ class ViewEmployeeRecords:
         self.details_window.geometry(f"{window_width}x{window_height}+{x}+{y}")
 
     def perform_search(self):
+        if self.employees is None:
+            return  # Still loading
+
         search_term = self.search_entry.get().lower()
         self.filtered_employees = [
-            emp for emp in self.employees 
+            emp for emp in self.employees
             if (search_term in emp["emp_id"].lower() or 
                 search_term in emp["name"].lower() or 
                 search_term in emp["division"].lower())
         ]
         
-        # Refresh the employee view
-        self.display()
+        # Refresh the employee list
+        self.employees_table.set_rows(self.filtered_employees)
 
     def display(self):
         self.clear_main_frame()
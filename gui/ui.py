@@ -4,6 +4,7 @@ from .sidebar import create_sidebar
 from .inventory import InventoryDisplay
 from .dashboard import Dashboard
 from .login import LoginPage
+from .query_report import QueryReportWindow
 from .utils import load_inventory, save_inventory
 from config import  COLORS
 
@@ -42,30 +43,49 @@ class InventoryApp():
         # Initialize sidebar and main content area
         create_sidebar(self.window, self)
         self.create_main_frame()
+
+        # Ctrl+Shift+Q opens the query report
+        self.query_report = QueryReportWindow(self.window)
+        self.window.bind("<Control-Q>", self.query_report.toggle)
         
     def create_main_frame(self):
         self.main_frame = ctk.CTkFrame(self.window)
         self.main_frame.grid(row=0, column=1, padx=20, pady=20, sticky="nsew")
+
+        # The dashboard keeps its widgets while the other screens are shown in
+        # screen_frame, stacked in the same cell, so going back to it only
+        # reloads what changed
+        self.main_frame.grid_rowconfigure(0, weight=1)
+        self.main_frame.grid_columnconfigure(0, weight=1)
+        self.dashboard_frame = ctk.CTkFrame(self.main_frame, fg_color="transparent")
+        self.screen_frame = ctk.CTkFrame(self.main_frame, fg_color="transparent")
+        for frame in (self.screen_frame, self.dashboard_frame):
+            frame.grid(row=0, column=0, sticky="nsew")
+        self.dashboard = Dashboard(self.dashboard_frame, self.inventory)
         
         # Initially show dashboard
         self.show_dashboard()
     
     def show_dashboard(self):
         self.clear_main_frame()
-        Dashboard(self.main_frame, self.inventory).display()
+        self.dashboard_frame.tkraise()
+        self.dashboard.display()
 
     def show_login(self):
         self.clear_main_frame()
-        LoginPage(self.main_frame, self.inventory).display()
+        self.screen_frame.tkraise()
+        LoginPage(self.screen_frame, self.inventory).display()
 
     def show_inventory(self):
         self.clear_main_frame()
-        InventoryDisplay(self.main_frame, self.inventory).display()
+        self.screen_frame.tkraise()
+        InventoryDisplay(self.screen_frame, self.inventory).display()
 
     def run(self):
         self.window.mainloop()
 
     def clear_main_frame(self):
-        for widget in self.main_frame.winfo_children():
+        # Screens other than the dashboard are rebuilt every time they are shown
+        for widget in self.screen_frame.winfo_children():
             widget.destroy()
 
@@ -0,0 +1,260 @@
+# gui/virtual_table.py
+
+import customtkinter as ctk
+from config import COLORS
+
+class VirtualTable(ctk.CTkFrame):
+    """
+    Table that only builds widgets for the rows that fit on screen and
+    reuses them while scrolling, so large result sets render instantly.
+
+    Columns are dictionaries:
+        title:   header text
+        key:     dict key, attribute name or callable(row) giving the cell value
+        kind:    "label" (default), "tag", "check" or "button"
+        width:   relative column width (default 120), columns share the table width in proportion
+        color:   background of "tag" cells
+        text:    caption of "button" cells
+        command: callable(row) for "check" and "button" cells
+        selected: callable(row) -> bool for "check" cells
+        header_command: makes the header of a "check" column a select-all checkbox
+    """
+    def __init__(self, master, columns, rows=None, row_height=44, on_row_click=None,
+                 empty_text="No results found.", **kwargs):
+        super().__init__(master, fg_color="transparent", **kwargs)
+        self.columns = columns
+        self.rows = []
+        self.row_height = row_height
+        self.on_row_click = on_row_click
+        self.empty_text = empty_text
+        self.first = 0
+        self.slots = []
+        self.header_widgets = {}
+
+        # Cells are placed at fixed fractions of the row so every row lines up with the header
+        widths = [column.get("width", 120) for column in columns]
+        total = sum(widths)
+        offsets = [sum(widths[:col]) for col in range(len(widths))]
+        self.spans = [(offset / total, width / total) for offset, width in zip(offsets, widths)]
+
+        self.grid_columnconfigure(0, weight=1)
+        self.grid_rowconfigure(1, weight=1)
+
+        self.create_header()
+
+        self.body = ctk.CTkFrame(self, fg_color="transparent")
+        self.body.grid(row=1, column=0, sticky="nsew")
+        self.body.grid_propagate(False)
+        self.body.grid_columnconfigure(0, weight=1)
+        self.body.bind("<Configure>", self.on_resize)
+
+        self.scrollbar = ctk.CTkScrollbar(
+            self,
+            command=self.on_scrollbar,
+            button_color=COLORS["pink"],
+            button_hover_color=COLORS["darker_pink"]
+        )
+        self.scrollbar.grid(row=1, column=1, sticky="ns")
+
+        self.message = ctk.CTkLabel(
+            self.body,
+            text="",
+            font=ctk.CTkFont(size=14, weight="bold"),
+            text_color=COLORS["white"]
+        )
+        self.bind_scroll(self.body)
+
+        self.set_rows(rows or [])
+
+    def place_cell(self, cell, col):
+        relx, relwidth = self.spans[col]
+        cell.place(relx=relx, x=2, y=2, relwidth=relwidth, width=-4, relheight=1, height=-4)
+
+    def create_header(self):
+        header = ctk.CTkFrame(self, fg_color="transparent", height=self.row_height)
+        header.grid(row=0, column=0, sticky="ew")
+
+        for col, column in enumerate(self.columns):
+            cell = ctk.CTkFrame(header, fg_color=COLORS["black"])
+            self.place_cell(cell, col)
+
+            if column.get("kind") == "check" and column.get("header_command"):
+                widget = ctk.CTkCheckBox(
+                    cell,
+                    text="",
+                    command=column["header_command"],
+                    fg_color=COLORS["pink"],
+                    hover_color=COLORS["darker_pink"],
+                    checkmark_color=COLORS["white"]
+                )
+            else:
+                widget = ctk.CTkLabel(
+                    cell,
+                    text=column.get("title", ""),
+                    font=ctk.CTkFont(size=14, weight="bold"),
+                    text_color=COLORS["white"]
+                )
+            widget.place(relx=0.5, rely=0.5, anchor="center")
+            self.header_widgets[col] = widget
+
+    def create_slot(self, index):
+        """Build the widgets for one visible row; they are reused for whichever row scrolls into place"""
+        row_frame = ctk.CTkFrame(self.body, fg_color="transparent", height=self.row_height)
+
+        cells = []
+        cell_frames = []
+        for col, column in enumerate(self.columns):
+            cell = ctk.CTkFrame(row_frame, fg_color=COLORS["black"])
+            self.place_cell(cell, col)
+            cell_frames.append(cell)
+            kind = column.get("kind", "label")
+
+            if kind == "check":
+                widget = ctk.CTkCheckBox(
+                    cell,
+                    text="",
+                    command=lambda i=index, c=column: c["command"](self.row_at(i)),
+                    fg_color=COLORS["pink"],
+                    hover_color=COLORS["darker_pink"],
+                    checkmark_color=COLORS["white"]
+                )
+                widget.place(relx=0.5, rely=0.5, anchor="center")
+            elif kind == "button":
+                widget = ctk.CTkButton(
+                    cell,
+                    text=column.get("text", ""),
+                    command=lambda i=index, c=column: c["command"](self.row_at(i)),
+                    fg_color=COLORS["pink"],
+                    hover_color=COLORS["darker_pink"],
+                    width=100,
+                    height=28
+                )
+                widget.place(relx=0.5, rely=0.5, anchor="center")
+            elif kind == "tag":
+                tag = ctk.CTkFrame(cell, fg_color=column.get("color", COLORS["pink"]), corner_radius=6)
+                tag.place(relx=0.5, rely=0.5, anchor="center")
+                widget = ctk.CTkLabel(
+                    tag,
+                    text="",
+                    font=ctk.CTkFont(size=12, weight="bold"),
+                    text_color=COLORS["white"]
+                )
+                widget.pack(padx=8, pady=2)
+                self.bind_row(tag, index, cell_frames)
+            else:
+                widget = ctk.CTkLabel(cell, text="", font=ctk.CTkFont(size=13))
+                widget.place(relx=0.5, rely=0.5, anchor="center")
+                self.bind_row(widget, index, cell_frames)
+
+            self.bind_row(cell, index, cell_frames)
+            cells.append(widget)
+
+        self.bind_row(row_frame, index, cell_frames)
+        return row_frame, cells
+
+    def bind_row(self, widget, index, cell_frames):
+        self.bind_scroll(widget)
+        if self.on_row_click:
+            def highlight(color):
+                for cell in cell_frames:
+                    cell.configure(fg_color=color)
+            widget.bind("<Button-1>", lambda e: self.on_row_click(self.row_at(index)))
+            widget.bind("<Enter>", lambda e: highlight(COLORS["pink"]))
+            widget.bind("<Leave>", lambda e: highlight(COLORS["black"]))
+
+    def bind_scroll(self, widget):
+        widget.bind("<MouseWheel>", self.on_mousewheel)
+        widget.bind("<Button-4>", lambda e: self.scroll_by(-3))
+        widget.bind("<Button-5>", lambda e: self.scroll_by(3))
+
+    def row_at(self, index):
+        return self.rows[self.first + index]
+
+    @staticmethod
+    def cell_value(row, key):
+        if callable(key):
+            return key(row)
+        if isinstance(row, dict):
+            return row.get(key, "")
+        return getattr(row, key, "")
+
+    # Scrolling
+    def visible_rows(self):
+        return max(1, self.body.winfo_height() // self.row_height)
+
+    def scroll_to(self, first):
+        first = max(0, min(int(first), len(self.rows) - self.visible_rows()))
+        if first != self.first:
+            self.first = first
+            self.refresh()
+        else:
+            self.update_scrollbar()
+
+    def scroll_by(self, count):
+        self.scroll_to(self.first + count)
+
+    def on_mousewheel(self, event):
+        self.scroll_by(-3 if event.delta > 0 else 3)
+
+    def on_scrollbar(self, action, amount, unit=None):
+        if action == "moveto":
+            self.scroll_to(float(amount) * len(self.rows))
+        elif action == "scroll":
+            self.scroll_by(int(float(amount)) * (self.visible_rows() if unit == "pages" else 1))
+
+    def update_scrollbar(self):
+        if not self.rows:
+            self.scrollbar.set(0, 1)
+            return
+        total = len(self.rows)
+        self.scrollbar.set(self.first / total, min(1, (self.first + self.visible_rows()) / total))
+
+    def on_resize(self, event=None):
+        # One extra slot shows the partially visible row at the bottom
+        needed = self.visible_rows() + 1
+        while len(self.slots) < needed:
+            self.slots.append(self.create_slot(len(self.slots)))
+        self.scroll_to(self.first)
+        self.refresh()
+
+    # Data
+    def set_rows(self, rows):
+        """Replace the table contents and scroll back to the top"""
+        self.rows = list(rows)
+        self.first = 0
+        self.message.configure(text=self.empty_text)
+        self.refresh()
+
+    def show_message(self, text):
+        """Show a message such as a loading placeholder instead of the rows"""
+        self.rows = []
+        self.first = 0
+        self.message.configure(text=text)
+        self.refresh()
+
+    def refresh(self):
+        """Redraw the visible rows, e.g. after the selection changed"""
+        for index, (row_frame, cells) in enumerate(self.slots):
+            position = self.first + index
+            if position >= len(self.rows):
+                row_frame.grid_remove()
+                continue
+
+            row = self.rows[position]
+            for column, widget in zip(self.columns, cells):
+                kind = column.get("kind", "label")
+                if kind == "check":
+                    if column["selected"](row):
+                        widget.select()
+                    else:
+                        widget.deselect()
+                elif kind != "button":
+                    value = self.cell_value(row, column.get("key"))
+                    widget.configure(text="" if value is None else str(value))
+            row_frame.grid(row=index, column=0, sticky="ew")
+
+        if self.rows:
+            self.message.place_forget()
+        else:
+            self.message.place(relx=0.5, y=20, anchor="n")
+        self.update_scrollbar()
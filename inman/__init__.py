@@ -0,0 +1,2 @@
+# inman/__init__.py
+# Headless entry point: python -m inman --help
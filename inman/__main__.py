@@ -0,0 +1,5 @@
+# inman/__main__.py
+
+from inman.cli import main
+
+raise SystemExit(main())
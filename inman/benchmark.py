@@ -0,0 +1,401 @@
+# inman/benchmark.py
+
+import inspect
+import os
+import platform
+import sqlite3
+import statistics
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, date, timedelta
+import sqlalchemy
+from sqlalchemy import func
+from models.database import session_scope
+from models.models import Division, Employee, Item, EmployeeItem, EmployeeItemAttribute, Log, ItemTransferHistory
+from controllers.cache import clear_cache
+from controllers.audit import flush_audit_log
+from controllers.instrumentation import query_instrumentation, enable_instrumentation, disable_instrumentation, measure
+from controllers import crud
+from utils import search
+from utils.export import REPORTS, EXPORT_FORMATS, export_report
+from config import PAGE_SIZE
+
+# Fixture rows the write benchmarks work on, so the generated data is left as it was
+BENCH_FROM = "BENCH-0001"
+BENCH_TO = "BENCH-0002"
+BENCH_TEMP = "BENCH-0003"
+BENCH_RENAMED = "BENCH-0004"
+FIXTURE_ASSIGNMENTS = 20
+BULK_ASSIGNMENTS = 50
+
+# A case is slower than its baseline when its median grows by more than the
+# threshold and by more than the noise floor
+REGRESSION_THRESHOLD = 0.2
+NOISE_FLOOR_MS = 0.5
+
+def _sample_values():
+    """Pick existing keys from the generated data for the read benchmarks"""
+    with session_scope() as db:
+        assignment = (
+            db.query(EmployeeItem)
+            .join(EmployeeItemAttribute, EmployeeItemAttribute.emp_item_id == EmployeeItem.id)
+            .filter(~EmployeeItem.emp_id.like("BENCH-%"))
+            .first()
+        ) or db.query(EmployeeItem).first()
+        if assignment is None:
+            raise ValueError("The database has no assignments, run generate-synthetic-data first")
+        attribute = db.query(EmployeeItemAttribute).filter(EmployeeItemAttribute.emp_item_id == assignment.id).first()
+        employee = db.query(Employee).filter(Employee.emp_id == assignment.emp_id).first()
+        division = db.query(Division).filter(Division.division_id == employee.division_id).first()
+        other_division = db.query(Division.division_id).filter(Division.division_id != division.division_id).limit(1).scalar()
+        return {
+            "emp_id": employee.emp_id,
+            "employee_name": employee.name.split()[0],
+            "division_id": division.division_id,
+            "division_name": division.name,
+            "other_division_id": other_division or division.division_id,
+            "item_id": assignment.item_id,
+            "item_name": db.query(Item.name).filter(Item.item_id == assignment.item_id).scalar(),
+            "unique_key": assignment.unique_key or "",
+            "attr_name": attribute.name if attribute else "",
+            "attr_value": attribute.value if attribute else "",
+            "action_type": db.query(Log.action_type).limit(1).scalar() or "",
+            "page_emp_ids": [emp_id for (emp_id,) in db.query(Employee.emp_id).order_by(Employee.emp_id).limit(PAGE_SIZE)],
+        }
+
+def _create_fixtures(sample):
+    """Create the benchmark employees and give BENCH_FROM some assignments to move around"""
+    crud.create_employee(BENCH_FROM, "Benchmark From", sample["division_id"])
+    crud.create_employee(BENCH_TO, "Benchmark To", sample["other_division_id"])
+    crud.bulk_assign_items([
+        {"emp_id": BENCH_FROM, "item_id": sample["item_id"], "unique_key": f"BENCH-SN{number:04d}",
+         "attrs": {"Serial": f"BENCH{number:04d}"}}
+        for number in range(FIXTURE_ASSIGNMENTS)
+    ])
+    with session_scope() as db:
+        fixture = db.query(EmployeeItem).filter(EmployeeItem.emp_id == BENCH_FROM).order_by(EmployeeItem.id).first()
+        sample["fixture_assignment_id"] = fixture.id
+        sample["fixture_unique_key"] = fixture.unique_key
+
+def _remove_assignments(emp_id):
+    with session_scope() as db:
+        item_ids = [item_id for (item_id,) in db.query(EmployeeItem.item_id).filter(EmployeeItem.emp_id == emp_id)]
+    for item_id in item_ids:
+        crud.remove_item_from_employee(emp_id, item_id)
+
+def _remove_fixtures():
+    for emp_id in (BENCH_FROM, BENCH_TO, BENCH_TEMP, BENCH_RENAMED):
+        if crud.get_employee(emp_id):
+            _remove_assignments(emp_id)
+            crud.delete_employee(emp_id)
+    # Divisions and items left behind by an interrupted run
+    with session_scope() as db:
+        division_ids = [division_id for (division_id,) in db.query(Division.division_id).filter(Division.name.like("Benchmark%"))]
+        item_ids = [item_id for (item_id,) in db.query(Item.item_id).filter(Item.name.like("Benchmark%"))]
+    for division_id in division_ids:
+        crud.delete_division(division_id)
+    for item_id in item_ids:
+        crud.delete_item(item_id)
+
+def _fixture_assignment_ids(emp_id):
+    with session_scope() as db:
+        return [assignment_id for (assignment_id,) in db.query(EmployeeItem.id).filter(EmployeeItem.emp_id == emp_id)]
+
+def _with_session(run):
+    def call(state):
+        with session_scope() as db:
+            return run(db, state)
+    return call
+
+def _create_division(state):
+    state["division_id"] = crud.create_division("Benchmark Division").division_id
+
+def _create_item(state):
+    state["new_item_id"] = crud.create_item("Benchmark Item")
+
+def _assign_temp(state):
+    crud.assign_item_to_employee(BENCH_TO, state["item_id"], "BENCH-TEMP", {"Serial": "BENCH", "RAM": "8GB"})
+    with session_scope() as db:
+        state["temp_assignment_id"] = db.query(EmployeeItem.id).filter(
+            EmployeeItem.emp_id == BENCH_TO, EmployeeItem.unique_key == "BENCH-TEMP"
+        ).scalar()
+
+def _remove_temp(state):
+    crud.remove_item_from_employee(BENCH_TO, state["item_id"])
+
+def _write_case(name, run, setup=None, teardown=None):
+    return (name, "write", run, setup, teardown)
+
+def _read_case(name, run, group="read"):
+    return (name, group, run, None, None)
+
+# (name, group, run(state), setup(state), teardown(state)). state starts as a
+# copy of the sample values; setup and teardown are not measured.
+BENCHMARK_CASES = [
+    # Divisions
+    _read_case("get_division", lambda s: crud.get_division(s["division_id"])),
+    _read_case("get_division_id_from_name", lambda s: crud.get_division_id_from_name(s["division_name"])),
+    _read_case("get_all_divisions", lambda s: crud.get_all_divisions()),
+    _read_case("get_all_division_names", lambda s: crud.get_all_division_names()),
+    _read_case("load_division_counts", _with_session(lambda db, s: crud.load_division_counts(db, db.query(Division).all()))),
+    _read_case("get_division_details_with_counts", lambda s: crud.get_division_details_with_counts(s["division_id"])),
+    _read_case("get_all_divisions_with_counts", lambda s: crud.get_all_divisions_with_counts()),
+    _write_case("create_division", _create_division,
+                teardown=lambda s: crud.delete_division(s["division_id"])),
+    _write_case("update_dvision", lambda s: crud.update_dvision(s["division_id"], "Benchmark Renamed"),
+                setup=_create_division, teardown=lambda s: crud.delete_division(s["division_id"])),
+    _write_case("delete_division", lambda s: crud.delete_division(s["division_id"]), setup=_create_division),
+
+    # Employees
+    _read_case("get_employee", lambda s: crud.get_employee(s["emp_id"])),
+    _read_case("get_all_employees", lambda s: crud.get_all_employees()),
+    _read_case("get_all_employees(division_id)", lambda s: crud.get_all_employees(division_id=s["division_id"])),
+    _read_case("get_all_employees_page", lambda s: crud.get_all_employees_page()),
+    _read_case("get_all_employees_ids", lambda s: crud.get_all_employees_ids()),
+    _read_case("load_employee_items", _with_session(lambda db, s: crud.load_employee_items(db, s["page_emp_ids"]))),
+    _read_case("get_employee_details_with_items_one", lambda s: crud.get_employee_details_with_items_one(s["emp_id"])),
+    _read_case("get_employee_details_with_items", lambda s: crud.get_employee_details_with_items()),
+    _read_case("get_employee_details_with_items_page", lambda s: crud.get_employee_details_with_items_page()),
+    _write_case("create_employee", lambda s: crud.create_employee(BENCH_TEMP, "Benchmark Temp", s["division_id"]),
+                teardown=lambda s: crud.delete_employee(BENCH_TEMP)),
+    _write_case("delete_employee", lambda s: crud.delete_employee(BENCH_TEMP),
+                setup=lambda s: crud.create_employee(BENCH_TEMP, "Benchmark Temp", s["division_id"])),
+    _write_case("update_employee",
+                lambda s: crud.update_employee(BENCH_FROM, new_name="Benchmark Renamed", new_division_id=s["other_division_id"]),
+                teardown=lambda s: crud.update_employee(BENCH_FROM, new_name="Benchmark From", new_division_id=s["division_id"])),
+    _write_case("update_employee_id", lambda s: crud.update_employee_id(BENCH_TEMP, BENCH_RENAMED),
+                setup=lambda s: crud.create_employee(BENCH_TEMP, "Benchmark Temp", s["division_id"]),
+                teardown=lambda s: crud.delete_employee(BENCH_RENAMED)),
+
+    # Items
+    _read_case("get_item", lambda s: crud.get_item(s["item_id"])),
+    _read_case("get_all_items", lambda s: crud.get_all_items()),
+    _read_case("get_all_items_page", lambda s: crud.get_all_items_page()),
+    _read_case("get_all_items_names_dict", lambda s: crud.get_all_items_names_dict()),
+    _read_case("get_all_items_with_no_attrs", lambda s: crud.get_all_items_with_no_attrs()),
+    _read_case("get_all_items_names_set", lambda s: crud.get_all_items_names_set()),
+    _write_case("create_item", _create_item, teardown=lambda s: crud.delete_item(s["new_item_id"])),
+    _write_case("update_item_details",
+                lambda s: crud.update_item_details({"item_id": s["new_item_id"], "name": "Benchmark Item Renamed"}),
+                setup=_create_item, teardown=lambda s: crud.delete_item(s["new_item_id"])),
+    _write_case("delete_item", lambda s: crud.delete_item(s["new_item_id"]), setup=_create_item),
+
+    # Assignment attributes, keyed by the assignment id
+    _read_case("get_item_attributes", lambda s: crud.get_item_attributes(s["fixture_assignment_id"])),
+    _write_case("add_item_attribute", lambda s: crud.add_item_attribute(s["fixture_assignment_id"], "Benchmark", "1"),
+                teardown=lambda s: crud.delete_item_attribute(s["fixture_assignment_id"], "Benchmark")),
+    _write_case("update_item_attribute", lambda s: crud.update_item_attribute(s["fixture_assignment_id"], "Benchmark", "2"),
+                setup=lambda s: crud.add_item_attribute(s["fixture_assignment_id"], "Benchmark", "1"),
+                teardown=lambda s: crud.delete_item_attribute(s["fixture_assignment_id"], "Benchmark")),
+    _write_case("delete_item_attribute", lambda s: crud.delete_item_attribute(s["fixture_assignment_id"], "Benchmark"),
+                setup=lambda s: crud.add_item_attribute(s["fixture_assignment_id"], "Benchmark", "1")),
+    _write_case("delete_item_attributes", lambda s: crud.delete_item_attributes(s["temp_assignment_id"]),
+                setup=_assign_temp, teardown=_remove_temp),
+    _write_case("save_item_attribute", lambda s: crud.save_item_attribute(BENCH_FROM, s["item_id"], "Benchmark", "1"),
+                teardown=lambda s: crud.remove_item_attribute(BENCH_FROM, s["item_id"], "Benchmark")),
+    _write_case("remove_item_attribute", lambda s: crud.remove_item_attribute(BENCH_FROM, s["item_id"], "Benchmark"),
+                setup=lambda s: crud.save_item_attribute(BENCH_FROM, s["item_id"], "Benchmark", "1")),
+
+    # Assignments and transfers
+    _write_case("assign_item_to_employee", _assign_temp, teardown=_remove_temp),
+    _write_case("remove_item_from_employee", _remove_temp, setup=_assign_temp),
+    _write_case("bulk_assign_items",
+                lambda s: crud.bulk_assign_items([
+                    {"emp_id": BENCH_TO, "item_id": s["item_id"], "unique_key": f"BENCH-BULK{number:04d}",
+                     "attrs": {"Serial": f"BULK{number:04d}"}}
+                    for number in range(BULK_ASSIGNMENTS)
+                ]),
+                teardown=lambda s: _remove_assignments(BENCH_TO)),
+    _write_case("transfer_item",
+                lambda s: crud.transfer_item(BENCH_FROM, BENCH_TO, s["item_id"], s["fixture_unique_key"]),
+                teardown=lambda s: crud.transfer_item(BENCH_TO, BENCH_FROM, s["item_id"], s["fixture_unique_key"])),
+    _write_case("transfer_items_bulk",
+                lambda s: crud.transfer_items_bulk(BENCH_FROM, BENCH_TO, s["assignment_ids"]),
+                setup=lambda s: s.update(assignment_ids=_fixture_assignment_ids(BENCH_FROM)),
+                teardown=lambda s: crud.transfer_items_bulk(BENCH_TO, BENCH_FROM, s["assignment_ids"])),
+
+    # Searches
+    _read_case("search_employees", lambda s: search.search_employees(s["employee_name"]), "search"),
+    _read_case("search_employees_page", lambda s: search.search_employees_page(s["employee_name"]), "search"),
+    _read_case("search_employee_items", lambda s: search.search_employee_items(s["item_name"], attr_name=s["attr_name"]), "search"),
+    _read_case("search_items", lambda s: search.search_items(s["item_name"]), "search"),
+    _read_case("search_unique_key", lambda s: search.search_unique_key(s["unique_key"]), "search"),
+    _read_case("search_divisions", lambda s: search.search_divisions(s["division_name"]), "search"),
+    _read_case("get_item_by_key", _with_session(lambda db, s: search.get_item_by_key(db, s["unique_key"])), "search"),
+    _read_case("search_items_by_attribute",
+               _with_session(lambda db, s: search.search_items_by_attribute(db, s["attr_name"], s["attr_value"])), "search"),
+    _read_case("search_employees_by_item_attribute",
+               _with_session(lambda db, s: search.search_employees_by_item_attribute(db, s["attr_name"], s["attr_value"])), "search"),
+    _read_case("search_employees_by_item_name",
+               _with_session(lambda db, s: search.search_employees_by_item_name(db, s["item_name"])), "search"),
+    _read_case("convert_items_to_dict", _with_session(lambda db, s: search.convert_items_to_dict(db.query(Item).all())), "search"),
+    _read_case("convert_employees_to_dict",
+               _with_session(lambda db, s: search.convert_employees_to_dict(
+                   db.query(Employee).filter(Employee.emp_id.in_(s["page_emp_ids"])).all())), "search"),
+    _read_case("search_logs", lambda s: search.search_logs(s["action_type"]), "search"),
+    _read_case("search_logs_page", lambda s: search.search_logs_page(action_type=s["action_type"]), "search"),
+    _read_case("search_item_transfer_history",
+               lambda s: search.search_item_transfer_history(start_date=date.today() - timedelta(days=30)), "search"),
+    _read_case("search_item_transfer_history_page", lambda s: search.search_item_transfer_history_page(), "search"),
+    _read_case("get_recent_logs", lambda s: search.get_recent_logs(), "search"),
+    _read_case("get_transfer_history_summary", lambda s: search.get_transfer_history_summary(), "search"),
+]
+
+def _export_cases(out_dir):
+    return [
+        _read_case(f"export {report} ({file_format})",
+                   lambda s, report=report, file_format=file_format:
+                       export_report(report, os.path.join(out_dir, f"{report}.{file_format}"), file_format),
+                   "export")
+        for report in REPORTS for file_format in EXPORT_FORMATS
+    ]
+
+def find_uncovered_functions(cases=None):
+    """List the public functions of controllers/crud.py and utils/search.py that no case measures"""
+    covered = {name.split("(")[0] for name, *_ in (cases or BENCHMARK_CASES)}
+    uncovered = []
+    for module in (crud, search):
+        for name, function in inspect.getmembers(module, inspect.isfunction):
+            if function.__module__ == module.__name__ and not name.startswith("_") and name not in covered:
+                uncovered.append(f"{module.__name__}.{name}")
+    return uncovered
+
+def _measure(name, run, setup, teardown, state, repeat: int):
+    """Run a case once traced for statements and peak memory, then `repeat` times for latency"""
+    timings = []
+    statements = peak = None
+    for attempt in range(repeat + 1):
+        if setup:
+            setup(state)
+        # Measure the uncached path, and keep buffered audit writes out of the timing
+        clear_cache()
+        flush_audit_log()
+        try:
+            if attempt == 0:
+                # Instrumentation stays off for the timed runs unless it was already on
+                instrumented = query_instrumentation.enabled
+                enable_instrumentation()
+                tracemalloc.start()
+                try:
+                    with measure(f"benchmark {name}") as scope:
+                        run(state)
+                finally:
+                    if not instrumented:
+                        disable_instrumentation()
+                peak = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+                statements = scope["statements"]
+            else:
+                started = time.perf_counter()
+                run(state)
+                timings.append((time.perf_counter() - started) * 1000)
+        finally:
+            if tracemalloc.is_tracing():
+                tracemalloc.stop()
+            flush_audit_log()
+            if teardown:
+                teardown(state)
+    return statements, peak, timings
+
+def _dataset_counts():
+    with session_scope() as db:
+        return {
+            model.__tablename__: db.query(func.count()).select_from(model).scalar()
+            for model in (Division, Employee, Item, EmployeeItem, EmployeeItemAttribute, Log, ItemTransferHistory)
+        }
+
+def run_benchmarks(repeat: int = 5, only: str = None, progress=None):
+    """
+    Time every controller, search and export function against the configured database
+
+    Each case runs once with statement counting and tracemalloc on, then
+    `repeat` more times for wall-clock latency. The cache is cleared before
+    every run. Write cases work on BENCH-* fixture employees created here and
+    undo their changes in a teardown step; the log and transfer history rows
+    they add are kept, so regenerate the database between runs you compare.
+
+    Args:
+        repeat (int, optional): Timed runs per case
+        only (str, optional): Only run cases whose name contains this text
+        progress (callable, optional): Called with each case result
+
+    Returns:
+        Dictionary with created_at, environment, dataset, repeat, results
+        (one entry per case) and uncovered (functions without a case)
+    """
+    if repeat < 1:
+        raise ValueError("repeat must be at least 1")
+
+    sample = _sample_values()
+    dataset = _dataset_counts()
+    _remove_fixtures()
+    _create_fixtures(sample)
+
+    results = []
+    try:
+        with tempfile.TemporaryDirectory() as out_dir:
+            for name, group, run, setup, teardown in BENCHMARK_CASES + _export_cases(out_dir):
+                if only and only not in name:
+                    continue
+                result = {"name": name, "group": group, "error": None}
+                try:
+                    statements, peak, timings = _measure(name, run, setup, teardown, dict(sample), repeat)
+                    result.update({
+                        "queries": statements,
+                        "median_ms": round(statistics.median(timings), 3),
+                        "mean_ms": round(statistics.fmean(timings), 3),
+                        "min_ms": round(min(timings), 3),
+                        "max_ms": round(max(timings), 3),
+                        "peak_memory_kib": round(peak / 1024, 1)
+                    })
+                except Exception as e:
+                    result["error"] = str(e)
+                results.append(result)
+                if progress:
+                    progress(result)
+    finally:
+        _remove_fixtures()
+
+    return {
+        "created_at": datetime.utcnow().isoformat(timespec="seconds"),
+        "environment": {
+            "python": platform.python_version(),
+            "sqlalchemy": sqlalchemy.__version__,
+            "sqlite": sqlite3.sqlite_version,
+            "platform": platform.platform()
+        },
+        "dataset": dataset,
+        "repeat": repeat,
+        "results": results,
+        "uncovered": find_uncovered_functions()
+    }
+
+def compare_benchmarks(baseline: dict, current: dict, threshold: float = REGRESSION_THRESHOLD):
+    """
+    Compare two run_benchmarks results case by case
+
+    A case regresses when it issues more statements than before, or when its
+    median latency grows by more than `threshold` (0.2 = 20%) and by more
+    than NOISE_FLOOR_MS.
+
+    Returns:
+        List of dictionaries with name, queries and median_ms as (baseline, current)
+        pairs, change (relative median change) and regression
+    """
+    baseline_results = {result["name"]: result for result in baseline["results"] if not result["error"]}
+    comparison = []
+    for result in current["results"]:
+        before = baseline_results.get(result["name"])
+        if before is None or result["error"]:
+            continue
+        change = (result["median_ms"] - before["median_ms"]) / before["median_ms"] if before["median_ms"] else 0.0
+        slower = change > threshold and result["median_ms"] - before["median_ms"] > NOISE_FLOOR_MS
+        comparison.append({
+            "name": result["name"],
+            "queries": (before["queries"], result["queries"]),
+            "median_ms": (before["median_ms"], result["median_ms"]),
+            "change": round(change, 3),
+            "regression": slower or result["queries"] > before["queries"]
+        })
+    return comparison
@@ -0,0 +1,211 @@
+# inman/cli.py
+
+import argparse
+import contextlib
+import sys
+from datetime import date
+from models.database import initialize_database
+from utils.export import REPORTS, EXPORT_FORMATS, export_report
+from config import LOG_RETENTION_DAYS, SLOW_QUERY_LOG_PATH
+
+def export_command(args):
+    written = export_report(args.report, args.out, args.format)
+    print(f"Exported {written} rows of '{args.report}' to {args.out}", file=sys.stderr)
+
+def rebuild_search_index_command(args):
+    from controllers.search_index import rebuild_search_index
+    rebuilt = rebuild_search_index()
+    print(f"Rebuilt search tables: {', '.join(rebuilt) or 'none (FTS5 unavailable)'}", file=sys.stderr)
+
+def rebuild_counters_command(args):
+    from controllers.counters import rebuild_counters
+    print(f"Rebuilt counters: {rebuild_counters()}", file=sys.stderr)
+
+def check_query_plans_command(args):
+    from inman.query_plans import check_query_plans
+    flagged = 0
+    for result in check_query_plans():
+        unexpected = result["full_scans"] and not result["expected"]
+        flagged += bool(unexpected)
+        if unexpected:
+            status = f"FULL SCAN of {', '.join(result['full_scans'])}"
+        elif result["full_scans"]:
+            status = f"full scan of {', '.join(result['full_scans'])} (expected)"
+        else:
+            status = "ok"
+        if unexpected or args.verbose:
+            print(f"{result['check']}: {status}")
+            print(f"  {' '.join(result['statement'].split())}")
+            for detail in result["plan"]:
+                print(f"    {detail}")
+    print(f"{flagged} queries with unexpected full scans", file=sys.stderr)
+    if flagged:
+        raise RuntimeError("query plans need attention")
+
+def migration_status_command(args):
+    from models.migrations import get_migration_status
+    for migration in get_migration_status():
+        applied = migration["applied_at"] or "pending"
+        print(f"{migration['version']:>4}  {migration['name']:<40} {applied}")
+
+def print_progress(name, done, total):
+    print(f"Migration {name}: {done}/{total}", file=sys.stderr)
+
+def apply_log_retention_command(args):
+    from controllers.retention import apply_log_retention
+    archived = apply_log_retention(
+        retain_days=args.days,
+        max_batches=args.max_batches,
+        progress=lambda done: print(f"Archived {done} log entries", file=sys.stderr)
+    )
+    print(f"Archived {archived} log entries older than {args.days} days", file=sys.stderr)
+
+def generate_synthetic_data_command(args):
+    from inman.synthetic import generate_synthetic_data
+    written = generate_synthetic_data(
+        divisions=args.divisions,
+        employees=args.employees,
+        items=args.items,
+        assignments=args.assignments,
+        attributes=args.attributes,
+        logs=args.logs,
+        transfers=args.transfers,
+        seed=args.seed,
+        progress=lambda table, rows: print(f"Generated {rows} {table}", file=sys.stderr)
+    )
+    print(f"Generated synthetic data: {written}", file=sys.stderr)
+
+def print_benchmark_result(result):
+    if result["error"]:
+        print(f"{result['name']}: ERROR {result['error']}", file=sys.stderr)
+    else:
+        print(f"{result['name']}: {result['median_ms']:.2f} ms, {result['queries']} queries, "
+              f"{result['peak_memory_kib']:.0f} KiB peak", file=sys.stderr)
+
+def benchmark_command(args):
+    import json
+    from inman.benchmark import run_benchmarks
+    report = run_benchmarks(repeat=args.repeat, only=args.only, progress=print_benchmark_result)
+    with open(args.out, "w", encoding="utf-8") as file:
+        json.dump(report, file, indent=2)
+    if report["uncovered"]:
+        print(f"Functions without a benchmark: {', '.join(report['uncovered'])}", file=sys.stderr)
+    print(f"Wrote {len(report['results'])} benchmark results to {args.out}", file=sys.stderr)
+
+def compare_benchmarks_command(args):
+    import json
+    from inman.benchmark import compare_benchmarks
+    with open(args.baseline, encoding="utf-8") as file:
+        baseline = json.load(file)
+    with open(args.current, encoding="utf-8") as file:
+        current = json.load(file)
+
+    regressions = 0
+    for row in compare_benchmarks(baseline, current, threshold=args.threshold):
+        regressions += row["regression"]
+        if row["regression"] or args.verbose:
+            status = "REGRESSION" if row["regression"] else "ok"
+            print(f"{row['name']}: {row['median_ms'][0]:.2f} -> {row['median_ms'][1]:.2f} ms "
+                  f"({row['change']:+.0%}), queries {row['queries'][0]} -> {row['queries'][1]}  {status}")
+    print(f"{regressions} benchmark regressions", file=sys.stderr)
+    if regressions:
+        raise RuntimeError("benchmarks regressed")
+
+def slow_queries_command(args):
+    from controllers.slow_query_log import read_slow_query_log, summarize_slow_queries
+    records = read_slow_query_log(args.path, since=date.fromisoformat(args.since) if args.since else None)
+    for group in summarize_slow_queries(records, top=args.top):
+        print(f"{group['total_ms']:10.1f} ms  {group['count']:5d}x  max {group['max_ms']:8.1f} ms  {group['fingerprint']}")
+        print(f"  {group['statement']}")
+        for call_site, count in group["call_sites"]:
+            print(f"    {count:5d}x {call_site}")
+        for detail in group["plan"]:
+            print(f"    plan: {detail}")
+    print(f"{len(records)} slow statements in {args.path}", file=sys.stderr)
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="python -m inman", description="InMan command line tools (no GUI)")
+    parser.add_argument("--profile-queries", action="store_true",
+                        help="Print the statement counts and timings per call site when the command finishes")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    export = commands.add_parser("export", help="Export a report to xlsx, csv or json")
+    export.add_argument("report", choices=list(REPORTS), help="Report to export")
+    export.add_argument("--out", required=True, help="Output file, or - for stdout (csv/json)")
+    export.add_argument("--format", choices=EXPORT_FORMATS, help="Output format, defaults to the --out extension")
+    export.set_defaults(handler=export_command)
+
+    rebuild_index = commands.add_parser("rebuild-search-index", help="Rebuild the full-text search index")
+    rebuild_index.set_defaults(handler=rebuild_search_index_command)
+
+    rebuild_counters = commands.add_parser("rebuild-counters", help="Recompute the division and item counters")
+    rebuild_counters.set_defaults(handler=rebuild_counters_command)
+
+    query_plans = commands.add_parser("check-query-plans", help="EXPLAIN the controller queries and flag full table scans")
+    query_plans.add_argument("--verbose", action="store_true", help="Also print the plans without full scans")
+    query_plans.set_defaults(handler=check_query_plans_command)
+
+    migration_status = commands.add_parser("migration-status", help="List the schema migrations and when they were applied")
+    migration_status.set_defaults(handler=migration_status_command)
+
+    retention = commands.add_parser("apply-log-retention", help="Archive old log entries and keep daily summaries")
+    retention.add_argument("--days", type=int, default=LOG_RETENTION_DAYS, help="Days of logs to keep in the database")
+    retention.add_argument("--max-batches", type=int, help="Stop after this many batches")
+    retention.set_defaults(handler=apply_log_retention_command)
+
+    synthetic = commands.add_parser("generate-synthetic-data", help="Fill an empty database with deterministic synthetic data")
+    synthetic.add_argument("--divisions", type=int, default=10, help="Number of divisions")
+    synthetic.add_argument("--employees", type=int, default=1000, help="Number of employees")
+    synthetic.add_argument("--items", type=int, default=50, help="Number of item types")
+    synthetic.add_argument("--assignments", type=int, default=5000, help="Number of item assignments")
+    synthetic.add_argument("--attributes", type=int, default=2, help="Attributes per assignment")
+    synthetic.add_argument("--logs", type=int, default=5000, help="Number of log entries")
+    synthetic.add_argument("--transfers", type=int, default=1000, help="Number of transfer history records")
+    synthetic.add_argument("--seed", type=int, default=42, help="Random seed")
+    synthetic.set_defaults(handler=generate_synthetic_data_command)
+
+    benchmark = commands.add_parser("benchmark", help="Time the controller, search and export functions")
+    benchmark.add_argument("--out", required=True, help="JSON file for the results")
+    benchmark.add_argument("--repeat", type=int, default=5, help="Timed runs per function")
+    benchmark.add_argument("--only", help="Only run benchmarks whose name contains this text")
+    benchmark.set_defaults(handler=benchmark_command)
+
+    compare = commands.add_parser("compare-benchmarks", help="Compare two benchmark result files and flag regressions")
+    compare.add_argument("baseline", help="Results of the earlier release")
+    compare.add_argument("current", help="Results to check")
+    compare.add_argument("--threshold", type=float, default=0.2, help="Allowed median slowdown, 0.2 = 20%%")
+    compare.add_argument("--verbose", action="store_true", help="Also print the benchmarks that did not regress")
+    compare.set_defaults(handler=compare_benchmarks_command)
+
+    slow_queries = commands.add_parser("slow-queries", help="Summarize the slow query log by statement fingerprint")
+    slow_queries.add_argument("--path", default=SLOW_QUERY_LOG_PATH, help="Slow query log file")
+    slow_queries.add_argument("--top", type=int, default=10, help="Number of fingerprints to list")
+    slow_queries.add_argument("--since", help="Only count records from this day on (YYYY-MM-DD)")
+    slow_queries.set_defaults(handler=slow_queries_command)
+
+    return parser
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+
+    from controllers.slow_query_log import enable_slow_query_log
+    enable_slow_query_log()
+
+    # Keep stdout clean for "--out -" exports
+    with contextlib.redirect_stdout(sys.stderr):
+        initialize_database(progress=print_progress)
+
+    if args.profile_queries:
+        from controllers.instrumentation import enable_instrumentation
+        enable_instrumentation()
+
+    try:
+        args.handler(args)
+    except Exception as e:
+        print(f"Error: {str(e)}", file=sys.stderr)
+        return 1
+    finally:
+        if args.profile_queries:
+            from controllers.instrumentation import format_query_report
+            print(format_query_report(), file=sys.stderr)
+    return 0
@@ -0,0 +1,146 @@
+# inman/query_plans.py
+
+import re
+from contextlib import contextmanager
+from datetime import date, timedelta
+from sqlalchemy import event
+from models.database import engine, session_scope
+from models.models import Employee, Item, EmployeeItem, EmployeeItemAttribute, Log
+from controllers.cache import clear_cache
+from controllers.pagination import encode_cursor
+from controllers import crud
+from utils import search
+
+# Tables that grow with the inventory; a full scan of one of them is flagged.
+# Divisions, items and the counter tables stay small enough to scan.
+LARGE_TABLES = {"employees", "employee_items", "employee_item_attributes", "logs", "item_transfer_history"}
+
+# "SCAN logs" reads the whole table, "SCAN logs USING INDEX ..." walks an index in order
+FULL_SCAN = re.compile(r"^SCAN (\w+)(?: AS \w+)?$")
+
+@contextmanager
+def capture_statements(bind=engine):
+    """Collect the (statement, parameters) of every SELECT that ran successfully inside the block"""
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if not executemany and statement.lstrip().upper().startswith(("SELECT", "WITH")):
+            statements.append((statement, parameters))
+
+    event.listen(bind, "after_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        event.remove(bind, "after_cursor_execute", record)
+
+def explain(statement: str, parameters=()):
+    """Return the detail lines of EXPLAIN QUERY PLAN for a statement"""
+    with engine.connect() as conn:
+        rows = conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).fetchall()
+    return [row[-1] for row in rows]
+
+def find_full_scans(plan: list):
+    """Return the large tables a query plan reads without an index"""
+    scans = []
+    for detail in plan:
+        match = FULL_SCAN.match(detail)
+        if match and match.group(1) in LARGE_TABLES:
+            scans.append(match.group(1))
+    return scans
+
+def _sample_values():
+    """Pick existing keys so every check exercises its real filters"""
+    with session_scope() as db:
+        assignment = db.query(EmployeeItem).first()
+        attribute = db.query(EmployeeItemAttribute).first()
+        employee = db.query(Employee).filter(Employee.division_id.isnot(None)).first()
+        return {
+            "emp_id": assignment.emp_id if assignment else "",
+            "item_id": assignment.item_id if assignment else 0,
+            "emp_item_id": attribute.emp_item_id if attribute else 0,
+            "unique_key": (assignment.unique_key or "") if assignment else "",
+            "attr_name": attribute.name if attribute else "",
+            "division_id": employee.division_id if employee else 0,
+            "employee_name": employee.name if employee else "",
+            "item_name": (db.query(Item.name).filter(Item.item_id == assignment.item_id).scalar() or "") if assignment else "",
+            "action_type": db.query(Log.action_type).limit(1).scalar() or "",
+        }
+
+def _assignment_lookup(sample):
+    # The lookup transfer_item, remove_item_from_employee and save_item_attribute start with
+    with session_scope() as db:
+        db.query(EmployeeItem).filter(
+            EmployeeItem.item_id == sample["item_id"], EmployeeItem.emp_id == sample["emp_id"]
+        ).first()
+
+def _attribute_lookup(sample):
+    with session_scope() as db:
+        db.query(EmployeeItemAttribute).filter(
+            EmployeeItemAttribute.emp_item_id == sample["emp_item_id"],
+            EmployeeItemAttribute.name == sample["attr_name"]
+        ).first()
+
+# Page checks start from a cursor: the first page also runs a bounded count,
+# which scans by design
+_NEXT_PAGE = {
+    "employees": lambda s: encode_cursor([s["emp_id"]]),
+    "logs": lambda s: encode_cursor([date.today() + timedelta(days=1), 0]),
+}
+
+# (name, callable(sample), full scans expected). Checks marked as expected
+# list whole tables on purpose; their scans are reported but not flagged.
+QUERY_CHECKS = [
+    ("get_all_employees(division_id)", lambda s: crud.get_all_employees(division_id=s["division_id"]), False),
+    ("get_all_employees_page", lambda s: crud.get_all_employees_page(cursor=_NEXT_PAGE["employees"](s)), False),
+    ("get_employee", lambda s: crud.get_employee(s["emp_id"]), False),
+    ("get_employee_details_with_items_one", lambda s: crud.get_employee_details_with_items_one(s["emp_id"]), False),
+    ("get_employee_details_with_items_page",
+     lambda s: crud.get_employee_details_with_items_page(cursor=_NEXT_PAGE["employees"](s)), False),
+    ("assignment lookup (emp_id, item_id)", _assignment_lookup, False),
+    ("attribute lookup (emp_item_id, name)", _attribute_lookup, False),
+    ("search_employees", lambda s: search.search_employees(s["employee_name"]), False),
+    ("search_employees_page", lambda s: search.search_employees_page(s["employee_name"], cursor=_NEXT_PAGE["employees"](s)), False),
+    ("search_unique_key", lambda s: search.search_unique_key(s["unique_key"]), False),
+    ("search_employee_items", lambda s: search.search_employee_items(s["item_name"], attr_name=s["attr_name"]), False),
+    ("search_logs_page(action_type)",
+     lambda s: search.search_logs_page(action_type=s["action_type"], cursor=_NEXT_PAGE["logs"](s)), False),
+    ("search_logs_page(date range)",
+     lambda s: search.search_logs_page(start_date=date.today() - timedelta(days=7), cursor=_NEXT_PAGE["logs"](s)), False),
+    ("search_item_transfer_history_page(date range)",
+     lambda s: search.search_item_transfer_history_page(start_date=date.today() - timedelta(days=30), cursor=_NEXT_PAGE["logs"](s)), False),
+    ("get_recent_logs", lambda s: search.get_recent_logs(), False),
+    ("get_transfer_history_summary", lambda s: search.get_transfer_history_summary(), False),
+    ("get_all_divisions_with_counts", lambda s: crud.get_all_divisions_with_counts(), True),
+    ("get_all_items", lambda s: crud.get_all_items(), True),
+    ("get_employee_details_with_items", lambda s: crud.get_employee_details_with_items(), True),
+]
+
+def check_query_plans(checks=None):
+    """
+    Run the controller queries and EXPLAIN every SELECT they issue
+
+    Args:
+        checks (list, optional): Entries shaped like QUERY_CHECKS, defaults to QUERY_CHECKS
+
+    Returns:
+        List of dictionaries with check, statement, plan, full_scans and
+        expected (True when the check lists whole tables on purpose)
+    """
+    sample = _sample_values()
+    # Cached lookups would hide their queries
+    clear_cache()
+
+    results = []
+    for name, run, expected in checks or QUERY_CHECKS:
+        with capture_statements() as statements:
+            run(sample)
+        for statement, parameters in statements:
+            plan = explain(statement, parameters)
+            results.append({
+                "check": name,
+                "statement": statement,
+                "plan": plan,
+                "full_scans": find_full_scans(plan),
+                "expected": expected
+            })
+    return results
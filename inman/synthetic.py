@@ -0,0 +1,183 @@
+# inman/synthetic.py
+
+import random
+from datetime import datetime, timedelta
+from sqlalchemy import insert, select, func
+from models.database import session_scope
+from models.models import Division, Employee, Item, EmployeeItem, EmployeeItemAttribute, Log, ItemTransferHistory
+from controllers.counters import rebuild_counters
+from controllers.search_index import ensure_search_index
+
+# Rows inserted per executemany batch
+GENERATE_BATCH_SIZE = 5000
+
+FIRST_NAMES = ["Alice", "Bob", "Carol", "David", "Erin", "Frank", "Grace", "Heidi", "Ivan", "Judy",
+               "Kasun", "Lakmal", "Mala", "Nimal", "Oscar", "Priya", "Ruwan", "Sunil", "Tharaka", "Uma"]
+LAST_NAMES = ["Perera", "Silva", "Fernando", "Jayasinghe", "Smith", "Johnson", "Brown", "Taylor",
+              "Wilson", "Dias", "Gunawardena", "Wickramasinghe", "Bandara", "Clark", "Lewis"]
+ITEM_TYPES = ["Laptop", "Desktop", "Monitor", "Phone", "Tablet", "Printer", "Router", "Keyboard",
+              "Mouse", "Headset", "Docking Station", "Projector", "Camera", "Scanner", "UPS"]
+ATTRIBUTE_VALUES = {
+    "Serial": lambda rng: f"{rng.randrange(16 ** 8):08X}",
+    "RAM": lambda rng: f"{rng.choice([4, 8, 16, 32, 64])}GB",
+    "CPU": lambda rng: rng.choice(["i3", "i5", "i7", "i9", "Ryzen 5", "Ryzen 7", "M1", "M2"]),
+    "Storage": lambda rng: f"{rng.choice([128, 256, 512, 1024])}GB",
+    "Color": lambda rng: rng.choice(["Black", "Silver", "White", "Grey", "Blue"]),
+    "IMEI": lambda rng: "".join(rng.choice("0123456789") for _ in range(15)),
+}
+LOG_ACTIONS = ["assign_item", "transfer_item", "update_employee", "remove_item", "update_item", "error"]
+
+def _insert_batches(model, rows, batch_size: int):
+    """Insert rows with executemany, one transaction per batch"""
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= batch_size:
+            with session_scope() as db:
+                db.execute(insert(model), batch)
+                db.commit()
+            batch = []
+    if batch:
+        with session_scope() as db:
+            db.execute(insert(model), batch)
+            db.commit()
+
+def generate_synthetic_data(divisions: int = 10, employees: int = 1000, items: int = 50, assignments: int = 5000,
+                            attributes: int = 2, logs: int = 5000, transfers: int = 1000, days: int = 365,
+                            seed: int = 42, batch_size: int = GENERATE_BATCH_SIZE, progress=None):
+    """
+    Fill an empty database with a deterministic synthetic inventory
+
+    The same arguments always produce the same rows. Timestamps are spread
+    over the last `days` days counted back from midnight UTC today, so date
+    range searches see the same distribution whenever the data is generated.
+
+    Args:
+        divisions (int, optional): Number of divisions
+        employees (int, optional): Number of employees, spread over the divisions
+        items (int, optional): Number of item types
+        assignments (int, optional): Number of item assignments, spread over the employees
+        attributes (int, optional): Attributes per assignment
+        logs (int, optional): Number of log entries
+        transfers (int, optional): Number of transfer history records
+        days (int, optional): Days of history the timestamps are spread over
+        seed (int, optional): Random seed
+        batch_size (int, optional): Rows per insert batch
+        progress (callable, optional): Called with (table, rows) after each table is filled
+
+    Returns:
+        Dictionary of rows written per table
+    """
+    if divisions < 1 or items < 1 or (assignments and employees < 1):
+        raise ValueError("Need at least one division and item, and employees to assign items to")
+    if attributes > len(ATTRIBUTE_VALUES):
+        raise ValueError(f"At most {len(ATTRIBUTE_VALUES)} attributes per assignment are supported")
+
+    with session_scope() as db:
+        if db.query(Division).first() or db.query(Employee).first() or db.query(Item).first():
+            raise ValueError("The database is not empty, point INMAN_DB_PATH at a new file")
+
+    rng = random.Random(seed)
+    end = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
+
+    def random_time():
+        return end - timedelta(seconds=rng.randrange(days * 86400))
+
+    def report(table, rows):
+        if progress:
+            progress(table, rows)
+
+    division_ids = list(range(1, divisions + 1))
+    _insert_batches(Division, (
+        {"division_id": division_id, "name": f"Division {division_id:03d}"} for division_id in division_ids
+    ), batch_size)
+    report("divisions", divisions)
+
+    item_ids = list(range(1, items + 1))
+    _insert_batches(Item, (
+        {"item_id": item_id, "name": f"{ITEM_TYPES[(item_id - 1) % len(ITEM_TYPES)]} {item_id:04d}"}
+        for item_id in item_ids
+    ), batch_size)
+    report("items", items)
+
+    emp_ids = [f"E{number:07d}" for number in range(1, employees + 1)]
+    _insert_batches(Employee, (
+        {
+            "emp_id": emp_id,
+            "name": f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}",
+            "division_id": rng.choice(division_ids),
+            "item_count": 0,
+            "date_joined": random_time()
+        } for emp_id in emp_ids
+    ), batch_size)
+    report("employees", employees)
+
+    # Assignment ids are generated here so the attributes can refer to them
+    attribute_names = list(ATTRIBUTE_VALUES)[:attributes]
+    attribute_rows = []
+
+    def assignment_rows():
+        for assignment_id in range(1, assignments + 1):
+            for name in attribute_names:
+                attribute_rows.append({"emp_item_id": assignment_id, "name": name, "value": ATTRIBUTE_VALUES[name](rng)})
+            yield {
+                "id": assignment_id,
+                "emp_id": rng.choice(emp_ids),
+                "item_id": rng.choice(item_ids),
+                "unique_key": f"SN{assignment_id:09d}",
+                "date_assigned": random_time(),
+                "notes": ""
+            }
+
+    _insert_batches(EmployeeItem, assignment_rows(), batch_size)
+    report("employee_items", assignments)
+    _insert_batches(EmployeeItemAttribute, attribute_rows, batch_size)
+    report("employee_item_attributes", len(attribute_rows))
+
+    def log_rows():
+        for _ in range(logs):
+            action_type = rng.choice(LOG_ACTIONS)
+            yield {
+                "action_type": action_type,
+                "details": f"Synthetic {action_type} for employee {rng.choice(emp_ids)} item {rng.choice(item_ids)}",
+                "timestamp": random_time()
+            }
+
+    _insert_batches(Log, log_rows(), batch_size)
+    report("logs", logs)
+
+    def transfer_rows():
+        for _ in range(transfers):
+            from_emp_id, to_emp_id = rng.sample(emp_ids, 2)
+            yield {
+                "item_id": rng.choice(item_ids),
+                "from_emp_id": from_emp_id,
+                "to_emp_id": to_emp_id,
+                "transfer_date": random_time().date(),
+                "notes": ""
+            }
+
+    if transfers and len(emp_ids) > 1:
+        _insert_batches(ItemTransferHistory, transfer_rows(), batch_size)
+        report("item_transfer_history", transfers)
+
+    # Counters and Employee.item_count are derived from the rows above
+    with session_scope() as db:
+        db.query(Employee).update({
+            Employee.item_count: select(func.count(EmployeeItem.id))
+            .where(EmployeeItem.emp_id == Employee.emp_id)
+            .scalar_subquery()
+        }, synchronize_session=False)
+        db.commit()
+    rebuild_counters()
+    ensure_search_index()
+
+    return {
+        "divisions": divisions,
+        "items": items,
+        "employees": employees,
+        "employee_items": assignments,
+        "employee_item_attributes": len(attribute_rows),
+        "logs": logs,
+        "item_transfer_history": transfers if len(emp_ids) > 1 else 0
+    }
@@ -1,9 +1,11 @@
 import customtkinter as ctk
 from gui.ui import InventoryApp
 from models import initialize_database
+from controllers import ensure_counters, ensure_search_index, apply_log_retention, enable_slow_query_log
 import hashlib
 import winreg
 import webbrowser
+from config import LOG_RETENTION_STARTUP_BATCHES
 
 COLORS = {
     'black': '#2c363f',
@@ -188,7 +190,11 @@ class ProductKeyPrompt:
                 winreg.SetValueEx(reg_key, "ProductKey", 0, winreg.REG_SZ, hashed_product_key)
                 winreg.CloseKey(reg_key)
                 self.root.destroy()
+                enable_slow_query_log()
                 initialize_database()
+                ensure_counters()
+                ensure_search_index()
+                apply_log_retention(max_batches=LOG_RETENTION_STARTUP_BATCHES)
                 app = InventoryApp()
                 app.run()
             except Exception as e:
@@ -205,7 +211,11 @@ class ProductKeyPrompt:
             winreg.CloseKey(reg_key)
             if product_key == self.hashkey:
                 self.root.destroy()
+                enable_slow_query_log()
                 initialize_database()
+                ensure_counters()
+                ensure_search_index()
+                apply_log_retention(max_batches=LOG_RETENTION_STARTUP_BATCHES)
                 app = InventoryApp()
                 app.run()
             else:
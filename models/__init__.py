@@ -1,4 +1,4 @@
-from .models import Division, Employee, Item, EmployeeItem, User, Log, ItemTransferHistory
+from .models import Division, Employee, Item, EmployeeItem, User, Log, ItemTransferHistory, DivisionCounter, ItemCounter, LogDailySummary
 from .database import get_db, initialize_database, SessionLocal, session_scope
 
 __all__ = [
@@ -9,6 +9,9 @@ __all__ = [
     'User',
     'Log',
     'ItemTransferHistory',
+    'DivisionCounter',
+    'ItemCounter',
+    'LogDailySummary',
 
     'get_db',
     'initialize_database',
@@ -1,16 +1,49 @@
 # models/database.py
 
-from sqlalchemy import create_engine, inspect
+from sqlalchemy import create_engine, event, inspect
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, scoped_session
 from contextlib import contextmanager 
 import logging
+from config import DATABASE_URL, DATABASE_ECHO, DATABASE_BUSY_TIMEOUT, SQLITE_PRAGMAS
 
 logging.basicConfig(level=logging.INFO)
 
+def create_db_engine(url: str = DATABASE_URL, echo: bool = DATABASE_ECHO, pragmas: dict = None):
+    """
+    Create an engine with the production SQLite profile
+
+    Args:
+        url (str, optional): Database URL. Defaults to config.DATABASE_URL
+        echo (bool, optional): Log every SQL statement. Defaults to config.DATABASE_ECHO
+        pragmas (dict, optional): PRAGMAs run on every new SQLite connection.
+                                  Defaults to config.SQLITE_PRAGMAS
+
+    Returns:
+        Engine
+    """
+    pragmas = SQLITE_PRAGMAS if pragmas is None else pragmas
+
+    if not url.startswith("sqlite"):
+        return create_engine(url, echo=echo)
+
+    db_engine = create_engine(
+        url,
+        echo=echo,
+        connect_args={"timeout": DATABASE_BUSY_TIMEOUT, "check_same_thread": False}
+    )
+
+    @event.listens_for(db_engine, "connect")
+    def apply_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for name, value in pragmas.items():
+            cursor.execute(f"PRAGMA {name}={value}")
+        cursor.close()
+
+    return db_engine
+
 # Database Configuration
-DATABASE_URL = "sqlite:///inventory.db"
-engine = create_engine(DATABASE_URL, echo=True)
+engine = create_db_engine()
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Session = scoped_session(SessionLocal)
 Base = declarative_base()
@@ -28,12 +61,50 @@ def is_database_initialized():
     tables = inspector.get_table_names()
     return len(tables) > 0
         
-def initialize_database():
+def ensure_indexes(bind=engine):
+    """
+    Create the model indexes missing from an existing database
+
+    create_all() only adds indexes together with new tables, so indexes
+    added to tables that already exist are created here.
+
+    Returns:
+        List of the index names that were created
+    """
+    existing = inspect(bind)
+    tables = set(existing.get_table_names())
+    created = []
+    for table in Base.metadata.sorted_tables:
+        if table.name not in tables:
+            continue
+        present = {index["name"] for index in existing.get_indexes(table.name)}
+        for index in table.indexes:
+            if index.name not in present:
+                index.create(bind=bind)
+                created.append(index.name)
+    return created
+
+def initialize_database(progress=None):
+    """
+    Create a new database, or bring an existing one up to date
+
+    Existing databases are upgraded by the pending steps in models/migrations.py.
+
+    Args:
+        progress (callable, optional): Called as progress(name, done, total) by long migrations
+    """
+    from .migrations import run_migrations, stamp_migrations, log_progress
+
     if is_database_initialized():
+        applied = run_migrations(progress=progress or log_progress)
+        if applied:
+            print(f"Applied migrations: {', '.join(applied)}")
         print("Database already initialized.")
         return None
     else:
+        # A new database already matches the latest schema
         Base.metadata.create_all(bind=engine)
+        stamp_migrations()
         print("Database initialized with SQLAlchemy.")
         return None
 
@@ -0,0 +1,158 @@
+# models/migrations.py
+
+import logging
+from sqlalchemy import text, bindparam, inspect
+from config import MIGRATION_BATCH_SIZE
+from .database import engine, Base, ensure_indexes
+from .models import SchemaMigration, LogDailySummary
+
+logger = logging.getLogger(__name__)
+
+# Registered migrations in version order, see migration()
+MIGRATIONS = []
+
+def migration(version: int, name: str):
+    """
+    Register an upgrade step
+
+    Each step runs once per database, in version order, and is recorded in
+    schema_migrations when it finishes. A step that is interrupted runs
+    again on the next start, so steps must be safe to repeat.
+    """
+    def decorator(func):
+        MIGRATIONS.append((version, name, func))
+        MIGRATIONS.sort(key=lambda entry: entry[0])
+        return func
+    return decorator
+
+def log_progress(name: str, done: int, total: int):
+    logger.info(f"Migration {name}: {done}/{total}")
+
+class MigrationContext:
+    """Helpers handed to every migration step"""
+    def __init__(self, bind, name: str, progress=log_progress):
+        self.bind = bind
+        self.name = name
+        self.progress = progress
+
+    def execute(self, sql: str, params: dict = None):
+        with self.bind.begin() as conn:
+            return conn.execute(text(sql), params or {})
+
+    def has_column(self, table: str, column: str):
+        return column in {col["name"] for col in inspect(self.bind).get_columns(table)}
+
+    def add_column(self, table: str, column: str, definition: str):
+        """ALTER TABLE ADD COLUMN unless the column already exists"""
+        if not self.has_column(table, column):
+            self.execute(f"ALTER TABLE {table} ADD COLUMN {column} {definition}")
+
+    def backfill(self, table: str, key: str, update_sql: str, batch_size: int = MIGRATION_BATCH_SIZE):
+        """
+        Run an UPDATE over a large table in key-ordered chunks
+
+        Every chunk is its own short transaction, so readers and the GUI are
+        never locked out for long, and progress is reported after each one.
+
+        Args:
+            table (str): Table to walk
+            key (str): Unique, indexed column to walk the table by
+            update_sql (str): UPDATE statement restricted with "{key} IN :keys"
+            batch_size (int, optional): Rows per transaction
+
+        Returns:
+            int: Number of rows processed
+        """
+        update = text(update_sql).bindparams(bindparam("keys", expanding=True))
+        first_keys = text(f"SELECT {key} FROM {table} ORDER BY {key} LIMIT :limit")
+        next_keys = text(f"SELECT {key} FROM {table} WHERE {key} > :last ORDER BY {key} LIMIT :limit")
+        with self.bind.connect() as conn:
+            total = conn.execute(text(f"SELECT count(*) FROM {table}")).scalar()
+
+        done, last = 0, None
+        while True:
+            with self.bind.begin() as conn:
+                if last is None:
+                    rows = conn.execute(first_keys, {"limit": batch_size})
+                else:
+                    rows = conn.execute(next_keys, {"last": last, "limit": batch_size})
+                keys = [row[0] for row in rows]
+                if not keys:
+                    break
+                conn.execute(update, {"keys": keys})
+            done += len(keys)
+            last = keys[-1]
+            self.progress(self.name, done, total)
+        return done
+
+def get_applied_versions(bind=engine):
+    with bind.connect() as conn:
+        return {row[0] for row in conn.execute(text("SELECT version FROM schema_migrations"))}
+
+def get_migration_status(bind=engine):
+    """
+    Returns:
+        List of {version, name, applied_at} in version order; applied_at is None for pending steps
+    """
+    with bind.connect() as conn:
+        applied = dict(conn.execute(text("SELECT version, applied_at FROM schema_migrations")).all())
+    return [
+        {"version": version, "name": name, "applied_at": applied.get(version)}
+        for version, name, _ in MIGRATIONS
+    ]
+
+def stamp_migrations(bind=engine):
+    """Mark every migration as applied, used for databases created from the current models"""
+    with bind.begin() as conn:
+        applied = {row[0] for row in conn.execute(text("SELECT version FROM schema_migrations"))}
+        for version, name, _ in MIGRATIONS:
+            if version not in applied:
+                conn.execute(SchemaMigration.__table__.insert().values(version=version, name=name))
+
+def run_migrations(bind=engine, progress=log_progress):
+    """
+    Apply the pending migrations in version order
+
+    Args:
+        bind (Engine, optional): Database to upgrade
+        progress (callable, optional): Called as progress(name, done, total) by backfills
+
+    Returns:
+        List of the names of the migrations that were applied
+    """
+    SchemaMigration.__table__.create(bind=bind, checkfirst=True)
+    applied = get_applied_versions(bind)
+
+    ran = []
+    for version, name, upgrade in MIGRATIONS:
+        if version in applied:
+            continue
+        logger.info(f"Applying migration {version}: {name}")
+        upgrade(MigrationContext(bind, name, progress))
+        with bind.begin() as conn:
+            conn.execute(SchemaMigration.__table__.insert().values(version=version, name=name))
+        ran.append(name)
+    return ran
+
+# Migrations. Append new steps with the next version number; never renumber.
+@migration(1, "baseline schema")
+def create_baseline_schema(ctx: MigrationContext):
+    Base.metadata.create_all(bind=ctx.bind)
+
+@migration(2, "indexes for hot filters")
+def create_hot_filter_indexes(ctx: MigrationContext):
+    ensure_indexes(ctx.bind)
+
+@migration(3, "backfill employees.item_count")
+def backfill_employee_item_count(ctx: MigrationContext):
+    # Older databases left item_count NULL or stale for employees created before it was maintained
+    ctx.backfill(
+        "employees", "emp_id",
+        "UPDATE employees SET item_count = ("
+        "SELECT count(*) FROM employee_items WHERE employee_items.emp_id = employees.emp_id"
+        ") WHERE emp_id IN :keys"
+    )
+
+@migration(4, "log daily summaries")
+def create_log_daily_summaries(ctx: MigrationContext):
+    LogDailySummary.__table__.create(bind=ctx.bind, checkfirst=True)
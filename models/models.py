@@ -1,6 +1,6 @@
 # models/models.py
 
-from sqlalchemy import Column, Integer, String, Boolean, ForeignKey, Date, DateTime, Enum, Text, UniqueConstraint
+from sqlalchemy import Column, Integer, String, Boolean, ForeignKey, Date, DateTime, Enum, Text, UniqueConstraint, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from datetime import datetime
@@ -20,7 +20,7 @@ class Employee(Base):
     __tablename__ = "employees"
     emp_id = Column(String, primary_key=True, index=True)
     name = Column(String, nullable=False)
-    division_id = Column(Integer, ForeignKey("divisions.division_id"))
+    division_id = Column(Integer, ForeignKey("divisions.division_id"), index=True)
     item_count = Column(Integer, default=0)
     date_joined = Column(DateTime, server_default=func.now())
 
@@ -47,9 +47,11 @@ class Item(Base):
 # EmployeeItem Model (Associative Table)
 class EmployeeItem(Base):
     __tablename__ = "employee_items"
+    # Lookups by employee and item (transfer, remove, attributes); also serves emp_id alone
+    __table_args__ = (Index("ix_employee_items_emp_id_item_id", "emp_id", "item_id"),)
 
     id = Column(Integer, primary_key=True, index=True)
-    emp_id = Column(String, ForeignKey("employees.emp_id"), index=True)
+    emp_id = Column(String, ForeignKey("employees.emp_id"))
     item_id = Column(Integer, ForeignKey("items.item_id"), index=True)
     unique_key = Column(String, nullable=True)
     date_assigned = Column(DateTime, default=datetime.utcnow)
@@ -77,6 +79,8 @@ class ItemAttribute(Base):
 
 class EmployeeItemAttribute(Base):
     __tablename__ = "employee_item_attributes"
+    # Attributes are always read per assignment, usually by name
+    __table_args__ = (Index("ix_employee_item_attributes_emp_item_id_name", "emp_item_id", "name"),)
     emp_attribute_id = Column(Integer, primary_key=True, index=True)
     emp_item_id = Column(Integer, ForeignKey("employee_items.id"))
     name = Column(String, nullable=False)
@@ -99,9 +103,16 @@ class Log(Base):
     log_id = Column(Integer, primary_key=True, index=True)
     action_type = Column(String, nullable=False)
     details = Column(Text, nullable=True)
-    timestamp = Column(DateTime, server_default=func.now())
+    timestamp = Column(DateTime, server_default=func.now(), index=True)
     user_id = Column(Integer, ForeignKey("users.user_id"))
 
+# LogDailySummary Model (Per-day action counts of archived logs)
+class LogDailySummary(Base):
+    __tablename__ = "log_daily_summaries"
+    day = Column(Date, primary_key=True)
+    action_type = Column(String, primary_key=True)
+    count = Column(Integer, nullable=False, default=0)
+
 # ItemTransferHistory Model
 class ItemTransferHistory(Base):
     __tablename__ = "item_transfer_history"
@@ -109,7 +120,7 @@ class ItemTransferHistory(Base):
     item_id = Column(Integer, ForeignKey("items.item_id"))
     from_emp_id = Column(String, ForeignKey("employees.emp_id"))
     to_emp_id = Column(String, ForeignKey("employees.emp_id"))
-    transfer_date = Column(Date, server_default=func.now())
+    transfer_date = Column(Date, server_default=func.now(), index=True)
 
     notes = Column(Text)
 
@@ -117,3 +128,23 @@ class ItemTransferHistory(Base):
     item = relationship("Item")
     from_employee = relationship("Employee", foreign_keys=[from_emp_id])
     to_employee = relationship("Employee", foreign_keys=[to_emp_id])
+
+# DivisionCounter Model (Materialized per-division counts)
+class DivisionCounter(Base):
+    __tablename__ = "division_counters"
+    division_id = Column(Integer, ForeignKey("divisions.division_id"), primary_key=True)
+    employee_count = Column(Integer, nullable=False, default=0)
+    item_count = Column(Integer, nullable=False, default=0)
+
+# ItemCounter Model (Materialized per-item counts)
+class ItemCounter(Base):
+    __tablename__ = "item_counters"
+    item_id = Column(Integer, ForeignKey("items.item_id"), primary_key=True)
+    assignment_count = Column(Integer, nullable=False, default=0)
+
+# SchemaMigration Model (Applied schema versions, see models/migrations.py)
+class SchemaMigration(Base):
+    __tablename__ = "schema_migrations"
+    version = Column(Integer, primary_key=True)
+    name = Column(String, nullable=False)
+    applied_at = Column(DateTime, server_default=func.now())
@@ -0,0 +1,17 @@
+# tests/conftest.py
+
+import os
+import sys
+import tempfile
+import pytest
+
+# Point the application at a throwaway database before models.database creates its engine
+os.environ.pop("INMAN_DATABASE_URL", None)
+os.environ["INMAN_DB_PATH"] = os.path.join(tempfile.mkdtemp(prefix="inman-tests-"), "inventory.db")
+os.environ["INMAN_AUDIT_LOG_DURABILITY"] = "immediate"
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+@pytest.fixture(scope="session", autouse=True)
+def database():
+    from models.database import initialize_database
+    initialize_database()
@@ -0,0 +1,27 @@
+# tests/test_bulk_import.py
+
+import csv
+from controllers import create_division, get_employee, import_employees_bulk
+from controllers import bulk_import
+
+def test_failed_batch_reports_source_rows(tmp_path, monkeypatch):
+    division = create_division("Import Division")
+    # A division that passes validation but is gone by the time the batch is written
+    monkeypatch.setattr(
+        bulk_import, "get_division_id_from_name",
+        lambda: {"Import Division": division.division_id, "Removed Division": -1}
+    )
+    path = tmp_path / "employees.csv"
+    with open(path, "w", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(["EMP_ID", "Name", "Division"])
+        writer.writerow(["IMP-1", "First", "Import Division"])
+        writer.writerow(["IMP-2", "Second", "Removed Division"])
+        writer.writerow(["IMP-3", "Third", "Import Division"])
+
+    report = import_employees_bulk(str(path))
+
+    assert report["created"] == 2
+    assert [(error["row"], error["emp_id"]) for error in report["errors"]] == [(3, "IMP-2")]
+    assert get_employee("IMP-1") is not None and get_employee("IMP-3") is not None
+    assert get_employee("IMP-2") is None
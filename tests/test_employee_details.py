@@ -0,0 +1,24 @@
+# tests/test_employee_details.py
+
+from controllers import (
+    create_division,
+    create_employee,
+    create_item,
+    assign_item_to_employee,
+    get_employee_details_with_items_one,
+    get_employee_details_with_items_many
+)
+
+def test_many_matches_one_and_skips_missing():
+    division = create_division("Details Division")
+    for n in range(5):
+        create_employee(f"DET-{n}", f"Detail Employee {n}", division.division_id)
+    item_id = create_item("Details Item")
+    assign_item_to_employee("DET-1", item_id, "DET-KEY-1", {"Size": "L"})
+    emp_ids = [f"DET-{n}" for n in range(5)] + ["DET-MISSING"]
+
+    details = get_employee_details_with_items_many(emp_ids, chunk_size=2)
+
+    assert sorted(details) == [f"DET-{n}" for n in range(5)]
+    for emp_id, employee in details.items():
+        assert employee == get_employee_details_with_items_one(emp_id)
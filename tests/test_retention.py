@@ -0,0 +1,15 @@
+# tests/test_retention.py
+
+from datetime import datetime
+from controllers.retention import _write_archive, search_log_archive
+from models.models import Log
+
+def test_archive_search_keeps_entries_with_reused_ids(tmp_path):
+    first = Log(log_id=7, action_type="Create", details="First entry", user_id=None, timestamp=datetime(2024, 1, 5, 9, 0))
+    reused = Log(log_id=7, action_type="Delete", details="Reused id", user_id=None, timestamp=datetime(2024, 1, 20, 9, 0))
+    # The first entry archived twice, as by a batch interrupted before its delete
+    _write_archive(str(tmp_path), [first, first, reused])
+
+    results = search_log_archive(archive_dir=str(tmp_path))
+
+    assert [(entry.log_id, entry.details) for entry in results] == [(7, "Reused id"), (7, "First entry")]
@@ -0,0 +1,80 @@
+# tests/test_search_index.py
+
+import sqlite3
+from sqlalchemy import event, text
+from controllers import (
+    create_division,
+    create_employee,
+    create_item,
+    assign_item_to_employee,
+    delete_employee,
+    rebuild_counters,
+    update_employee,
+    update_employee_id
+)
+from controllers.search_index import ensure_search_index
+from models.database import engine
+from utils.search import search_employee_items, search_unique_key
+
+def _indexed_employees(match: str):
+    with engine.connect() as conn:
+        return [
+            row[0] for row in conn.execute(
+                text("SELECT emp_id FROM employee_fts WHERE employee_fts MATCH :match"), {"match": match}
+            )
+        ]
+
+def test_employee_index_follows_changes():
+    ensure_search_index()
+    division = create_division("Index Division")
+    create_employee("IDX-1", "Quentin Indexed", division.division_id)
+    create_employee("IDX-2", "Quentin Other", division.division_id)
+
+    update_employee("IDX-1", new_name="Rupert Indexed")
+    update_employee_id("IDX-2", "IDX-2B")
+    assert _indexed_employees('"quentin"*') == ["IDX-2B"]
+    assert _indexed_employees('"rupert"*') == ["IDX-1"]
+
+    delete_employee("IDX-1")
+    assert _indexed_employees('"rupert"*') == []
+    with engine.connect() as conn:
+        employees, indexed, rowids = conn.execute(text(
+            "SELECT (SELECT count(*) FROM employees), (SELECT count(*) FROM employee_fts), "
+            "(SELECT count(*) FROM employee_fts_rowids)"
+        )).fetchone()
+    assert employees == indexed == rowids
+
+def test_search_combines_index_filters():
+    ensure_search_index()
+    division = create_division("Combined Search Division")
+    create_employee("CMB-1", "Combined Searcher", division.division_id)
+    item_id = create_item("Combinedscope Laptop")
+    assign_item_to_employee("CMB-1", item_id, "CMB-KEY-1", {"Colour": "Vermilion"})
+    assign_item_to_employee("CMB-1", item_id, "CMB-KEY-2", {"Colour": "Teal"})
+
+    results = search_employee_items("Combinedscope", attr_name="Colour", attr_value="vermil")
+
+    assert [result["unique_key"] for result in results] == ["CMB-KEY-1"]
+
+def test_broad_match_is_not_limited_by_sql_variables():
+    ensure_search_index()
+    division = create_division("Broad Search Division")
+    create_employee("BRD-1", "Broad Holder", division.division_id)
+    item_id = create_item("Broad Item")
+    with engine.begin() as conn:
+        conn.execute(
+            text("INSERT INTO employee_items (emp_id, item_id, unique_key) VALUES ('BRD-1', :item_id, :key)"),
+            [{"item_id": item_id, "key": f"BRDKEY{n:04d}"} for n in range(1500)]
+        )
+    rebuild_counters()
+
+    # More matches than the connections accept bound variables
+    def limit_variables(dbapi_connection, connection_record, connection_proxy):
+        dbapi_connection.setlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER, 999)
+    event.listen(engine, "checkout", limit_variables)
+    try:
+        results = search_unique_key("BRDKEY")
+    finally:
+        event.remove(engine, "checkout", limit_variables)
+
+    assert len(results) == 1500
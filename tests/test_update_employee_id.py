@@ -0,0 +1,57 @@
+# tests/test_update_employee_id.py
+
+from controllers import (
+    create_division,
+    create_employee,
+    create_item,
+    assign_item_to_employee,
+    transfer_item,
+    update_employee_id,
+    get_employee,
+    get_employee_details_with_items_one,
+    get_counter_stats,
+    verify_counters
+)
+from models.database import session_scope
+from models.models import EmployeeItem, ItemTransferHistory
+
+def test_rename_employee_with_items():
+    division = create_division("Rename Division")
+    create_employee("REN-1", "Renamed Employee", division.division_id)
+    create_employee("REN-2", "Other Employee", division.division_id)
+    item_id = create_item("Rename Item")
+    assign_item_to_employee("REN-1", item_id, "REN-KEY-1", {"colour": "red"})
+    assign_item_to_employee("REN-2", item_id, "REN-KEY-2", {})
+    assert transfer_item("REN-2", "REN-1", item_id, "REN-KEY-2")
+    division_counts = get_counter_stats()["divisions"][division.division_id]
+
+    renamed = update_employee_id("REN-1", "REN-1B")
+
+    assert renamed is not None and renamed.emp_id == "REN-1B"
+    assert get_employee("REN-1") is None
+    details = get_employee_details_with_items_one("REN-1B")
+    assert sorted(item["unique_key"] for item in details["items"]) == ["REN-KEY-1", "REN-KEY-2"]
+    assert {"name": "colour", "value": "red"} in next(
+        item["attributes"] for item in details["items"] if item["unique_key"] == "REN-KEY-1"
+    )
+    with session_scope() as db:
+        assert db.query(EmployeeItem).filter(EmployeeItem.emp_id == "REN-1").count() == 0
+        history = db.query(ItemTransferHistory.from_emp_id, ItemTransferHistory.to_emp_id).filter(
+            ItemTransferHistory.item_id == item_id
+        ).all()
+    assert history == [("REN-2", "REN-1B")]
+    assert get_counter_stats()["divisions"][division.division_id] == division_counts
+    assert verify_counters() == []
+
+def test_rename_to_existing_id_changes_nothing():
+    division = create_division("Rename Conflict Division")
+    create_employee("REN-3", "First", division.division_id)
+    create_employee("REN-4", "Second", division.division_id)
+    item_id = create_item("Rename Conflict Item")
+    assign_item_to_employee("REN-3", item_id, "REN-KEY-3", {})
+
+    assert update_employee_id("REN-3", "REN-4") is None
+
+    assert [item["unique_key"] for item in get_employee_details_with_items_one("REN-3")["items"]] == ["REN-KEY-3"]
+    assert get_employee_details_with_items_one("REN-4")["items"] == []
+    assert verify_counters() == []
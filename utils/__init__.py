@@ -8,7 +8,10 @@ from .search import (
     get_transfer_history_summary,
     search_logs,
     search_unique_key,
-    search_employee_items
+    search_employee_items,
+    search_employees_page,
+    search_logs_page,
+    search_item_transfer_history_page
 
 
 )
@@ -16,6 +19,8 @@ from .summary import (
     get_employee_items,
     get_items_by_division,
     get_item_transfer_history,
+    get_dashboard_versions,
+    get_dashboard_stats,
     generate_employee_report,
     generate_item_report,
     divison_wise_employee_items_to_excel,
@@ -23,16 +28,31 @@ from .summary import (
     items_to_excel
     
 )
+from .export import (
+    write_rows_to_excel,
+    export_report,
+    export_division_report,
+    export_employee_report,
+    export_item_report
+)
 
 __all__ = [
     'search_employees', 'search_items', 'search_divisions', 'get_item_by_key',
     'search_logs','search_item_transfer_history','get_recent_logs',
     'get_transfer_history_summary',
-    'get_employee_items', 'get_items_by_division', 'get_item_transfer_history', 'generate_employee_report', 'generate_item_report',
+    'get_employee_items', 'get_items_by_division', 'get_item_transfer_history', 'get_dashboard_versions', 'get_dashboard_stats', 'generate_employee_report', 'generate_item_report',
     'divison_wise_employee_items_to_excel',
     'search_unique_key',
     'employee_id_name_to_excel',
     'items_to_excel',
-    'search_employee_items'
+    'search_employee_items',
+    'search_employees_page',
+    'search_logs_page',
+    'search_item_transfer_history_page',
+    'write_rows_to_excel',
+    'export_report',
+    'export_division_report',
+    'export_employee_report',
+    'export_item_report'
     
 ]
\ No newline at end of file
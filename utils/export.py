@@ -0,0 +1,292 @@
+# utils/export.py
+
+import csv
+import json
+import os
+import sys
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font, PatternFill, Alignment, Border, Side, NamedStyle
+from openpyxl.utils import get_column_letter
+from sqlalchemy import func
+from models.database import session_scope
+from models.models import Division, Employee, Item, EmployeeItem, EmployeeItemAttribute
+
+STREAM_BATCH_SIZE = 1000
+
+# Report layouts: headers and fixed column widths (widths are set up front
+# because a streamed sheet cannot be measured after it is written)
+DIVISION_REPORT_HEADERS = ['Division', 'Employee Name', 'Employee ID', 'Item Name', 'Unique Key | Reference ID', 'Attributes']
+DIVISION_REPORT_WIDTHS = [28, 30, 18, 25, 30, 60]
+EMPLOYEE_REPORT_HEADERS = ['Employee ID', 'Name', 'Division']
+EMPLOYEE_REPORT_WIDTHS = [18, 35, 28]
+ITEM_REPORT_HEADERS = ['Name']
+ITEM_REPORT_WIDTHS = [40]
+
+def _thin_border():
+    side = Side(style='thin')
+    return Border(left=side, right=side, top=side, bottom=side)
+
+def _register_styles(wb: Workbook):
+    """Register the shared named styles once so every cell reuses the same style record"""
+    center_align = Alignment(horizontal='center', vertical='center')
+    styles = [
+        NamedStyle(
+            name="report_header", font=Font(bold=True, size=12), alignment=center_align, border=_thin_border(),
+            fill=PatternFill(start_color='D3D3D3', end_color='D3D3D3', fill_type='solid')
+        ),
+        NamedStyle(name="report_cell", alignment=center_align, border=_thin_border()),
+        NamedStyle(name="report_total", font=Font(bold=True, underline='single')),
+        NamedStyle(name="report_grand_total", font=Font(bold=True, size=11, underline='double')),
+    ]
+    for style in styles:
+        wb.add_named_style(style)
+
+def write_rows_to_excel(file_path: str, title: str, headers: list, widths: list, rows):
+    """
+    Stream rows into an .xlsx file with constant memory use
+
+    Args:
+        file_path (str): Destination file
+        title (str): Worksheet title
+        headers (list): Column headers
+        widths (list): Column widths, one per header
+        rows: Iterable of (style, values) tuples, where style is "cell",
+              "total" or "grand_total"; an empty values list writes a blank row
+
+    Returns:
+        int: Number of rows written below the header
+    """
+    wb = Workbook(write_only=True)
+    _register_styles(wb)
+    ws = wb.create_sheet(title)
+
+    for col, width in enumerate(widths, 1):
+        ws.column_dimensions[get_column_letter(col)].width = width
+
+    def styled(values, style):
+        cells = []
+        for value in values:
+            cell = WriteOnlyCell(ws, value=value)
+            cell.style = style
+            cells.append(cell)
+        return cells
+
+    ws.append(styled(headers, "report_header"))
+    written = 0
+    for style, values in rows:
+        ws.append(styled(values, f"report_{style}") if values else [])
+        written += 1
+
+    wb.save(file_path)
+    return written
+
+# Row generators, fed straight from the database cursor
+def _division_report_query(db):
+    attributes = (
+        db.query(func.group_concat(EmployeeItemAttribute.name + ': ' + EmployeeItemAttribute.value, ', '))
+        .filter(EmployeeItemAttribute.emp_item_id == EmployeeItem.id)
+        .correlate(EmployeeItem)
+        .scalar_subquery()
+    )
+    return (
+        db.query(
+            Employee.division_id,
+            func.coalesce(Division.name, 'Unassigned'),
+            Employee.name,
+            Employee.emp_id,
+            EmployeeItem.id,
+            Item.name,
+            EmployeeItem.unique_key,
+            attributes
+        )
+        .select_from(Employee)
+        .outerjoin(Division, Employee.division_id == Division.division_id)
+        .outerjoin(EmployeeItem, EmployeeItem.emp_id == Employee.emp_id)
+        .outerjoin(Item, EmployeeItem.item_id == Item.item_id)
+        .order_by(Division.name, Employee.emp_id, EmployeeItem.id)
+        .yield_per(STREAM_BATCH_SIZE)
+    )
+
+def division_report_records():
+    """
+    Yield one flat record per assignment, in DIVISION_REPORT_HEADERS order
+
+    Yields:
+        Tuples of (division, employee name, employee ID, item name, unique key, attributes)
+    """
+    with session_scope() as db:
+        for _, division, emp_name, emp_id, assignment_id, item_name, unique_key, attrs in _division_report_query(db):
+            if assignment_id is not None:
+                yield division, emp_name, emp_id, item_name, unique_key, attrs or ''
+
+def division_report_rows():
+    """
+    Yield the division-wise employee items report, one assignment per row,
+    with per-division and grand totals
+
+    Yields:
+        (style, values) tuples for write_rows_to_excel
+    """
+    with session_scope() as db:
+        current_division = current_employee = object()
+        division_employees = division_items = 0
+        total_divisions = total_employees = total_items = 0
+
+        def division_totals():
+            yield "cell", []
+            yield "total", ["Total Employees:", division_employees, "Total Items:", division_items]
+            yield "cell", []
+
+        for division_id, division, emp_name, emp_id, assignment_id, item_name, unique_key, attrs in _division_report_query(db):
+            if division_id != current_division:
+                if division_items:
+                    yield from division_totals()
+                    total_employees += division_employees
+                    total_items += division_items
+                current_division = division_id
+                first_in_division = True
+                division_employees = division_items = 0
+                total_divisions += 1
+
+            if emp_id != current_employee:
+                current_employee = emp_id
+                first_for_employee = True
+                division_employees += 1
+
+            # Employees without items count towards the totals but get no row
+            if assignment_id is None:
+                continue
+
+            yield "cell", [
+                division if first_in_division else '',
+                emp_name if first_for_employee else '',
+                emp_id if first_for_employee else '',
+                item_name,
+                unique_key,
+                attrs or ''
+            ]
+            first_in_division = first_for_employee = False
+            division_items += 1
+
+        if division_items:
+            yield from division_totals()
+            total_employees += division_employees
+            total_items += division_items
+
+        if total_divisions > 1:
+            yield "grand_total", ["TOTAL DIVISIONS:", total_divisions]
+            yield "grand_total", ["TOTAL EMPLOYEES COUNT:", total_employees]
+            yield "grand_total", ["TOTAL ITEMS COUNT:", total_items]
+
+def employee_report_records():
+    """
+    Yield (Employee ID, Name, Division) records ordered by employee ID
+    """
+    with session_scope() as db:
+        yield from (
+            db.query(Employee.emp_id, Employee.name, Division.name)
+            .outerjoin(Division, Employee.division_id == Division.division_id)
+            .order_by(Employee.emp_id)
+            .yield_per(STREAM_BATCH_SIZE)
+        )
+
+def employee_report_rows():
+    """
+    Yield Employee ID, Name and Division rows followed by the employee count
+
+    Yields:
+        (style, values) tuples for write_rows_to_excel
+    """
+    total_employees = 0
+    for record in employee_report_records():
+        yield "cell", list(record)
+        total_employees += 1
+
+    yield "cell", []
+    yield "total", ["TOTAL EMPLOYEES COUNT:", total_employees]
+
+def item_report_records():
+    """
+    Yield one (Name,) record per item
+    """
+    with session_scope() as db:
+        yield from db.query(Item.name).order_by(Item.item_id).yield_per(STREAM_BATCH_SIZE)
+
+def item_report_rows():
+    """
+    Yield one row per item name
+
+    Yields:
+        (style, values) tuples for write_rows_to_excel
+    """
+    for record in item_report_records():
+        yield "cell", list(record)
+
+def write_records_to_csv(file, headers: list, records):
+    """Stream records into an open text file as CSV, returns the record count"""
+    writer = csv.writer(file)
+    writer.writerow(headers)
+    written = 0
+    for record in records:
+        writer.writerow(record)
+        written += 1
+    return written
+
+def write_records_to_json(file, headers: list, records):
+    """Stream records into an open text file as a JSON array of objects, returns the record count"""
+    written = 0
+    file.write("[")
+    for record in records:
+        file.write(",\n  " if written else "\n  ")
+        json.dump(dict(zip(headers, record)), file, default=str)
+        written += 1
+    file.write("\n]\n" if written else "]\n")
+    return written
+
+# Report exports
+REPORTS = {
+    "division-report": ("Division Report", DIVISION_REPORT_HEADERS, DIVISION_REPORT_WIDTHS, division_report_rows, division_report_records),
+    "employees": ("Employees", EMPLOYEE_REPORT_HEADERS, EMPLOYEE_REPORT_WIDTHS, employee_report_rows, employee_report_records),
+    "items": ("Items", ITEM_REPORT_HEADERS, ITEM_REPORT_WIDTHS, item_report_rows, item_report_records),
+}
+EXPORT_FORMATS = ("xlsx", "csv", "json")
+
+def export_report(report: str, file_path: str, file_format: str = None):
+    """
+    Export a report to .xlsx, .csv or .json without any GUI
+
+    Args:
+        report (str): One of the REPORTS keys
+        file_path (str): Destination file, or "-" for stdout (csv/json only)
+        file_format (str, optional): xlsx, csv or json; taken from the file extension if omitted
+
+    Returns:
+        int: Number of rows or records written
+    """
+    if report not in REPORTS:
+        raise ValueError(f"Unknown report '{report}', choose from {', '.join(REPORTS)}")
+    file_format = (file_format or os.path.splitext(file_path)[1].lstrip(".") or "xlsx").lower()
+    if file_format not in EXPORT_FORMATS:
+        raise ValueError(f"Unsupported format '{file_format}', choose from {', '.join(EXPORT_FORMATS)}")
+
+    title, headers, widths, rows, records = REPORTS[report]
+    if file_format == "xlsx":
+        if file_path == "-":
+            raise ValueError("Excel reports cannot be written to stdout")
+        return write_rows_to_excel(file_path, title, headers, widths, rows())
+
+    write = write_records_to_csv if file_format == "csv" else write_records_to_json
+    if file_path == "-":
+        return write(sys.stdout, headers, records())
+    with open(file_path, "w", newline="", encoding="utf-8") as file:
+        return write(file, headers, records())
+
+def export_division_report(file_path: str):
+    return export_report("division-report", file_path, "xlsx")
+
+def export_employee_report(file_path: str):
+    return export_report("employees", file_path, "xlsx")
+
+def export_item_report(file_path: str):
+    return export_report("items", file_path, "xlsx")
@@ -1,9 +1,15 @@
 # utils/search.py
 from controllers.crud import *
-from sqlalchemy.orm import joinedload
-from sqlalchemy import or_
+from sqlalchemy.orm import joinedload, aliased
+from sqlalchemy import or_, func, select
 from models.models import Log, ItemTransferHistory, Employee, Item
+from controllers.search_index import match_search_index
+from controllers.pagination import paginate
+from controllers.audit import flush_audit_log
+from controllers.retention import search_log_archive
+from config import PAGE_SIZE
 from datetime import datetime, timedelta
+from collections import Counter
 
 def convert_items_to_dict(items):
     return [
@@ -15,23 +21,39 @@ def convert_items_to_dict(items):
     ]
 
 def convert_employees_to_dict(employees):
+    # Read the rows first: the lookup below closes the shared session
+    rows = [(emp.emp_id, emp.name, emp.division_id) for emp in employees]
+
+    # Look up all division names at once instead of once per employee
+    division_ids = {division_id for _, _, division_id in rows if division_id is not None}
+    division_names = {}
+    if division_ids:
+        with session_scope() as db:
+            division_names = dict(
+                db.query(Division.division_id, Division.name).filter(Division.division_id.in_(division_ids)).all()
+            )
+
     return [
         {
-            'emp_id': emp.emp_id,
-            'name': emp.name,
-            'division_id': emp.division_id,
-            'division': str(get_division(emp.division_id).name)  # Assuming get_division returns a Division object
+            'emp_id': emp_id,
+            'name': name,
+            'division_id': division_id,
+            'division': division_names.get(division_id, "Unassigned")
         }
-        for emp in employees
+        for emp_id, name, division_id in rows
     ]
 
 def search_employees(query: str, division_name: str = None, items_need=False):
     with session_scope() as db:
-        # Base query to search by name or emp_id
-        base_query = db.query(Employee).filter(
-            (Employee.name.ilike(f"%{query}%")) |
-            (Employee.emp_id.ilike(f"%{query}%"))
-        )
+        # Search by name or emp_id, ranked through the full-text index when possible
+        ranked = match_search_index(db, "employee_fts", query)
+        if ranked is None:
+            base_query = db.query(Employee).filter(
+                (Employee.name.ilike(f"%{query}%")) |
+                (Employee.emp_id.ilike(f"%{query}%"))
+            )
+        else:
+            base_query = db.query(Employee).join(ranked, Employee.emp_id == ranked.c.key).order_by(ranked.c.rank)
         
         # If division name is provided, add division filter
         if division_name:
@@ -59,6 +81,45 @@ def search_employees(query: str, division_name: str = None, items_need=False):
         
         return employee_list
     
+def search_employees_page(query: str, division_name: str = None, cursor: str = None, page_size: int = PAGE_SIZE):
+    """
+    Page through employees matching query by name or emp_id
+
+    Pages are ordered by emp_id rather than search rank, so the order stays
+    stable from one page to the next.
+
+    Args:
+        query (str): Search term
+        division_name (str, optional): Only match employees of this division
+        cursor (str, optional): next_cursor of the previous page
+        page_size (int, optional): Employees per page
+
+    Returns:
+        Page dictionary whose items are {'emp_id', 'name', 'division'} dictionaries
+    """
+    with session_scope() as db:
+        ranked = match_search_index(db, "employee_fts", query)
+        base_query = (
+            db.query(Employee.emp_id, Employee.name, Division.name.label("division"))
+            .outerjoin(Division, Employee.division_id == Division.division_id)
+        )
+        if ranked is None:
+            base_query = base_query.filter(
+                (Employee.name.ilike(f"%{query}%")) |
+                (Employee.emp_id.ilike(f"%{query}%"))
+            )
+        else:
+            base_query = base_query.filter(Employee.emp_id.in_(select(ranked.c.key)))
+        if division_name:
+            base_query = base_query.filter(Division.name == division_name)
+
+        return paginate(
+            base_query, [Employee.emp_id], cursor, page_size,
+            transform=lambda rows: [
+                {"emp_id": row.emp_id, "name": row.name, "division": row.division} for row in rows
+            ]
+        )
+
 def search_employee_items(query: str, attr_name: str = None, attr_value: str = None):
     """
     Search for employee items by item name, attribute name, or attribute value.
@@ -73,21 +134,35 @@ def search_employee_items(query: str, attr_name: str = None, attr_value: str = N
     """
     with SessionLocal() as db:
         # Base query to search by item name
-        base_query = db.query(EmployeeItem).join(Item).filter(
-            Item.name.ilike(f"%{query}%")
-        )
+        ranked = match_search_index(db, "item_fts", query)
+        if ranked is None:
+            base_query = db.query(EmployeeItem).join(Item).filter(
+                Item.name.ilike(f"%{query}%")
+            )
+        else:
+            base_query = (
+                db.query(EmployeeItem).join(Item)
+                .join(ranked, Item.item_id == ranked.c.key)
+                .order_by(ranked.c.rank)
+            )
         
         # If attribute name is provided, add attribute filter
+        if attr_name or attr_value:
+            base_query = base_query.join(EmployeeItemAttribute).distinct()
         if attr_name:
-            base_query = base_query.join(EmployeeItemAttribute).filter(
+            base_query = base_query.filter(
                 EmployeeItemAttribute.name == attr_name
             )
         
         # If attribute value is provided, add attribute value filter
         if attr_value:
-            base_query = base_query.join(EmployeeItemAttribute).filter(
-                EmployeeItemAttribute.value.ilike(f"%{attr_value}%")
-            )
+            attr_ranked = match_search_index(db, "employee_item_attribute_fts", attr_value, column="value")
+            if attr_ranked is None:
+                base_query = base_query.filter(
+                    EmployeeItemAttribute.value.ilike(f"%{attr_value}%")
+                )
+            else:
+                base_query = base_query.filter(EmployeeItemAttribute.emp_attribute_id.in_(select(attr_ranked.c.key)))
         
         # Execute the query
         results = base_query.all()
@@ -111,9 +186,13 @@ def search_employee_items(query: str, attr_name: str = None, attr_value: str = N
 def search_items(query: str, status: str = None, is_common: bool = None):
     with session_scope() as db:
         # Base query to search by name
-        base_query = db.query(Item).filter(
-            Item.name.ilike(f"%{query}%")
-        )
+        ranked = match_search_index(db, "item_fts", query)
+        if ranked is None:
+            base_query = db.query(Item).filter(
+                Item.name.ilike(f"%{query}%")
+            )
+        else:
+            base_query = db.query(Item).join(ranked, Item.item_id == ranked.c.key).order_by(ranked.c.rank)
                 
         # Execute the query
         items = base_query.all()
@@ -132,13 +211,17 @@ def search_items(query: str, status: str = None, is_common: bool = None):
 def search_unique_key(query=""):
     l = []
     with session_scope() as db:
+        ranked = match_search_index(db, "employee_item_fts", query, column="unique_key")
         empitems = (
             db.query(EmployeeItem, Item.name.label('item_name'), Employee.name.label('employee_name'))
             .join(Item, EmployeeItem.item_id == Item.item_id)
             .join(Employee, EmployeeItem.emp_id == Employee.emp_id)
-            .filter(EmployeeItem.unique_key.ilike(f"%{query}%"))
-            .all()
         )
+        if ranked is None:
+            empitems = empitems.filter(EmployeeItem.unique_key.ilike(f"%{query}%"))
+        else:
+            empitems = empitems.join(ranked, EmployeeItem.id == ranked.c.key).order_by(ranked.c.rank)
+        empitems = empitems.all()
         for i, item_name, employee_name in empitems:
             q = {
                 "emp_id": i.emp_id,
@@ -160,7 +243,7 @@ def search_divisions(query: str):
         query (str): Search term to find divisions
     
     Returns:
-        List of dictionaries containing division details
+        List of dictionaries containing division details and per-item counts
     """
     with session_scope() as db:
         # Search for divisions matching the query
@@ -170,29 +253,7 @@ def search_divisions(query: str):
             .all()
         )
         
-        division_details_list = []
-        
-        for division in divisions:
-            # Count employees in the division
-            employee_count = db.query(Employee).filter(Employee.division_id == division.division_id).count()
-            
-            # Count items owned by employees in the division
-            item_count = db.query(Item).join(EmployeeItem).filter(
-                EmployeeItem.emp_id == Employee.emp_id, 
-                Employee.division_id == division.division_id
-            ).count()
-            
-            # Prepare the details for the division
-            division_details = {
-                "division_id": division.division_id,
-                "name": division.name,
-                "employee_count": employee_count,
-                "item_count": item_count
-            }
-            
-            division_details_list.append(division_details)
-        
-        return division_details_list
+        return load_division_counts(db, divisions)
     
 # Get item by its unique key
 def get_item_by_key(db: Session, unique_key: str):
@@ -227,43 +288,128 @@ def search_employees_by_item_name(db: Session, item_name: str):
 
 
 
+def _logs_query(db: Session, search_term: str = None, start_date: datetime = None,
+                end_date: datetime = None, action_type: str = None):
+    query = db.query(Log)
+
+    # Apply search term filter across multiple fields
+    if search_term:
+        query = query.filter(
+            or_(
+                Log.details.ilike(f"%{search_term}%"),
+                Log.action_type.ilike(f"%{search_term}%")
+            )
+        )
+
+    # Apply date range filter
+    if start_date:
+        query = query.filter(Log.timestamp >= start_date)
+
+    if end_date:
+        query = query.filter(Log.timestamp <= end_date)
+
+    # Apply action type filter
+    if action_type:
+        query = query.filter(Log.action_type == action_type)
+
+    return query
+
 def search_logs(search_term: str = None, 
                 start_date: datetime = None, 
                 end_date: datetime = None, 
-                action_type: str = None):
+                action_type: str = None,
+                include_archive: bool = False):
+    """
+    Search logs, most recent first
+
+    Args:
+        search_term (str, optional): Matched against details and action type
+        start_date, end_date (datetime, optional): Timestamp range
+        action_type (str, optional): Exact action type
+        include_archive (bool, optional): Also search the logs moved out by
+                                          apply_log_retention, which is slower
+
+    Returns:
+        List of Log objects
+    """
+    # Include entries still waiting in the audit log buffer
+    flush_audit_log()
     db = SessionLocal()
     
     try:
-        query = db.query(Log)
-        
-        # Apply search term filter across multiple fields
-        if search_term:
-            query = query.filter(
-                or_(
-                    Log.details.ilike(f"%{search_term}%"),
-                    Log.action_type.ilike(f"%{search_term}%")
-                )
-            )
-        
-        # Apply date range filter
-        if start_date:
-            query = query.filter(Log.timestamp >= start_date)
-        
-        if end_date:
-            query = query.filter(Log.timestamp <= end_date)
-        
-        # Apply action type filter
-        if action_type:
-            query = query.filter(Log.action_type == action_type)
+        query = _logs_query(db, search_term, start_date, end_date, action_type)
         
         # Order by most recent first
-        query = query.order_by(Log.timestamp.desc())
+        query = query.order_by(Log.timestamp.desc(), Log.log_id.desc())
         
-        return query.all()
+        logs = query.all()
     
     finally:
         db.close()
 
+    if include_archive:
+        # Archived entries are all older than the ones still in the table
+        logs.extend(search_log_archive(search_term, start_date, end_date, action_type))
+    return logs
+
+def search_logs_page(search_term: str = None,
+                     start_date: datetime = None,
+                     end_date: datetime = None,
+                     action_type: str = None,
+                     cursor: str = None,
+                     page_size: int = PAGE_SIZE):
+    """
+    Page through matching logs, most recent first
+
+    Args:
+        search_term, start_date, end_date, action_type: Filters as in search_logs
+        cursor (str, optional): next_cursor of the previous page
+        page_size (int, optional): Logs per page
+
+    Returns:
+        Page dictionary whose items are Log objects
+    """
+    if cursor is None:
+        flush_audit_log()
+    with session_scope() as db:
+        page = paginate(
+            _logs_query(db, search_term, start_date, end_date, action_type),
+            [Log.timestamp, Log.log_id], cursor, page_size, descending=True
+        )
+        db.expunge_all()
+        return page
+
+def _transfer_history_query(db: Session, search_term: str = None, start_date: datetime = None,
+                            end_date: datetime = None):
+    # Both employee joins need their own alias
+    from_employee = aliased(Employee)
+    to_employee = aliased(Employee)
+    query = db.query(ItemTransferHistory).join(Item).outerjoin(
+        from_employee, ItemTransferHistory.from_emp_id == from_employee.emp_id
+    ).outerjoin(
+        to_employee, ItemTransferHistory.to_emp_id == to_employee.emp_id
+    )
+
+    # Apply search term filter across multiple fields
+    if search_term:
+        query = query.filter(
+            or_(
+                from_employee.name.ilike(f"%{search_term}%"),
+                to_employee.name.ilike(f"%{search_term}%"),
+                Item.name.ilike(f"%{search_term}%"),
+                ItemTransferHistory.notes.ilike(f"%{search_term}%")
+            )
+        )
+
+    # Apply date range filter
+    if start_date:
+        query = query.filter(ItemTransferHistory.transfer_date >= start_date)
+
+    if end_date:
+        query = query.filter(ItemTransferHistory.transfer_date <= end_date)
+
+    return query
+
 def search_item_transfer_history(
     search_term: str = None, 
     start_date: datetime = None, 
@@ -272,39 +418,45 @@ def search_item_transfer_history(
     db = SessionLocal()
     
     try:
-        query = db.query(ItemTransferHistory).join(Item).join(
-            Employee, ItemTransferHistory.from_emp_id == Employee.emp_id
-        ).join(
-            Employee, ItemTransferHistory.to_emp_id == Employee.emp_id,
-            isouter=True
-        )
-        
-        # Apply search term filter across multiple fields
-        if search_term:
-            query = query.filter(
-                or_(
-                    Employee.name.ilike(f"%{search_term}%"),
-                    Item.name.ilike(f"%{search_term}%"),
-                    ItemTransferHistory.notes.ilike(f"%{search_term}%")
-                )
-            )
-        
-        # Apply date range filter
-        if start_date:
-            query = query.filter(ItemTransferHistory.transfer_date >= start_date)
-        
-        if end_date:
-            query = query.filter(ItemTransferHistory.transfer_date <= end_date)
+        query = _transfer_history_query(db, search_term, start_date, end_date)
         
         # Order by most recent first
-        query = query.order_by(ItemTransferHistory.transfer_date.desc())
+        query = query.order_by(ItemTransferHistory.transfer_date.desc(), ItemTransferHistory.transfer_id.desc())
         
         return query.all()
     
     finally:
         db.close()
 
+def search_item_transfer_history_page(
+    search_term: str = None,
+    start_date: datetime = None,
+    end_date: datetime = None,
+    cursor: str = None,
+    page_size: int = PAGE_SIZE
+):
+    """
+    Page through matching transfers, most recent first
+
+    Args:
+        search_term, start_date, end_date: Filters as in search_item_transfer_history
+        cursor (str, optional): next_cursor of the previous page
+        page_size (int, optional): Transfers per page
+
+    Returns:
+        Page dictionary whose items are ItemTransferHistory objects
+    """
+    with session_scope() as db:
+        page = paginate(
+            _transfer_history_query(db, search_term, start_date, end_date),
+            [ItemTransferHistory.transfer_date, ItemTransferHistory.transfer_id], cursor, page_size,
+            descending=True
+        )
+        db.expunge_all()
+        return page
+
 def get_recent_logs(days: int = 30, limit: int = 100):
+    flush_audit_log()
     db = SessionLocal()
     
     try:
@@ -322,44 +474,84 @@ def get_recent_logs(days: int = 30, limit: int = 100):
     finally:
         db.close()
 
-def get_transfer_history_summary(days: int = 30):
+def get_transfer_history_summary(days: int = 30, top: int = 5):
     """
-    Get a summary of item transfers in the past specified number of days
+    Summarize item transfers of the past days
+    
+    Reads the date range once through the transfer_date index, grouped by
+    day, item and both employees, and derives every figure from those rows.
     
     Args:
-        days (int, optional): Number of days to retrieve transfer history for. Defaults to 30.
+        days (int, optional): Number of days, including today, to summarize. Defaults to 30.
+        top (int, optional): Length of the top items and employees lists. Defaults to 5.
     
     Returns:
-        Dictionary with transfer summary statistics
+        Dictionary with total_transfers, top_transferred_items,
+        top_source_employees, top_destination_employees ({"name", "count"}
+        lists, plus item_id or emp_id) and daily ({"date", "count"} for every
+        day of the range, oldest first)
     """
-    db = SessionLocal()
+    start_date = datetime.utcnow().date() - timedelta(days=days - 1)
+    from_employee = aliased(Employee)
+    to_employee = aliased(Employee)
     
-    try:
-        # Calculate the date threshold
-        threshold_date = datetime.utcnow() - timedelta(days=days)
-        
-        # Count total transfers
-        total_transfers = (
-            db.query(ItemTransferHistory)
-            .filter(ItemTransferHistory.transfer_date >= threshold_date)
-            .count()
-        )
-        
-        # Group transfers by item
-        item_transfer_counts = (
-            db.query(Item.name, db.func.count(ItemTransferHistory.transfer_id))
-            .join(ItemTransferHistory, Item.item_id == ItemTransferHistory.item_id)
-            .filter(ItemTransferHistory.transfer_date >= threshold_date)
-            .group_by(Item.name)
-            .order_by(db.func.count(ItemTransferHistory.transfer_id).desc())
-            .limit(10)
+    with session_scope() as db:
+        rows = (
+            db.query(
+                ItemTransferHistory.transfer_date,
+                ItemTransferHistory.item_id,
+                Item.name,
+                ItemTransferHistory.from_emp_id,
+                from_employee.name,
+                ItemTransferHistory.to_emp_id,
+                to_employee.name,
+                func.count(ItemTransferHistory.transfer_id)
+            )
+            .outerjoin(Item, ItemTransferHistory.item_id == Item.item_id)
+            .outerjoin(from_employee, ItemTransferHistory.from_emp_id == from_employee.emp_id)
+            .outerjoin(to_employee, ItemTransferHistory.to_emp_id == to_employee.emp_id)
+            .filter(ItemTransferHistory.transfer_date >= start_date)
+            .group_by(
+                ItemTransferHistory.transfer_date,
+                ItemTransferHistory.item_id,
+                ItemTransferHistory.from_emp_id,
+                ItemTransferHistory.to_emp_id
+            )
             .all()
         )
-        
-        return {
-            "total_transfers": total_transfers,
-            "top_transferred_items": item_transfer_counts
-        }
     
-    finally:
-        db.close()
\ No newline at end of file
+    total = 0
+    daily = Counter()
+    items, sources, destinations = Counter(), Counter(), Counter()
+    names = {}
+    for transfer_date, item_id, item_name, from_emp_id, from_name, to_emp_id, to_name, count in rows:
+        total += count
+        daily[transfer_date] += count
+        items[item_id] += count
+        names[("item", item_id)] = item_name
+        # Deleted employees are detached from their history, their side stays NULL
+        if from_emp_id is not None:
+            sources[from_emp_id] += count
+            names[("emp", from_emp_id)] = from_name
+        if to_emp_id is not None:
+            destinations[to_emp_id] += count
+            names[("emp", to_emp_id)] = to_name
+    
+    def ranked(counter, kind, key):
+        return [
+            {key: id_, "name": names[(kind, id_)] or "Unknown", "count": count}
+            for id_, count in counter.most_common(top)
+        ]
+    
+    return {
+        "days": days,
+        "start_date": start_date,
+        "total_transfers": total,
+        "top_transferred_items": ranked(items, "item", "item_id"),
+        "top_source_employees": ranked(sources, "emp", "emp_id"),
+        "top_destination_employees": ranked(destinations, "emp", "emp_id"),
+        "daily": [
+            {"date": start_date + timedelta(days=offset), "count": daily.get(start_date + timedelta(days=offset), 0)}
+            for offset in range(days)
+        ]
+    }
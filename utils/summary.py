@@ -1,13 +1,10 @@
 # utils/summary.py
 
 from controllers.crud import *
-from .search  import search_items_by_attribute
-from openpyxl import Workbook
-from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
-from openpyxl.utils import get_column_letter
-import tkinter as tk
-from tkinter import filedialog, messagebox
-from controllers.crud import get_employee_details_with_items
+from controllers.counters import get_counter_stats
+from controllers.cache import get_versions
+from .search  import search_items_by_attribute, get_transfer_history_summary
+from .export import export_division_report, export_employee_report, export_item_report
 
 # Get all items assigned to an employee
 def get_employee_items(db: Session, emp_id: str):
@@ -25,6 +22,55 @@ def get_items_by_division(db: Session, division_name: str):
 def get_item_transfer_history(db: Session):
     return db.query(ItemTransferHistory).all()
 
+# Dashboard sections and the change namespaces their figures are read from
+DASHBOARD_SECTIONS = {
+    "overview": ("divisions", "employees", "items", "assignments"),
+    "transfers": ("employees", "items", "transfers"),
+    "divisions": ("divisions", "employees", "items", "assignments")
+}
+
+def get_dashboard_versions(transfer_days: int = 30):
+    """
+    Current version of every dashboard section, read from memory without
+    touching the database. A section whose version is unchanged since it
+    was loaded still shows current figures.
+
+    Returns:
+        Dictionary of section name to version tuple
+    """
+    versions = {section: get_versions(*namespaces) for section, namespaces in DASHBOARD_SECTIONS.items()}
+    # The transfer window moves with the date even when nothing is written
+    versions["transfers"] += (datetime.utcnow().date(), transfer_days)
+    return versions
+
+def get_dashboard_stats(sections: list = None, transfer_days: int = 30):
+    """
+    Snapshot of the dashboard figures
+
+    Versions are read before the figures, so a write that lands while
+    loading leaves the section stale and it is loaded again next time.
+
+    Args:
+        sections (list, optional): Section names to load, defaults to all of DASHBOARD_SECTIONS
+        transfer_days (int, optional): Days covered by the transfer section. Defaults to 30.
+
+    Returns:
+        Dictionary with "versions" (section name to version, for the loaded
+        sections) and "sections" (section name to its data: the counter
+        stats, the transfer summary or the division details)
+    """
+    sections = list(sections or DASHBOARD_SECTIONS)
+    versions = get_dashboard_versions(transfer_days)
+    loaders = {
+        "overview": get_counter_stats,
+        "transfers": lambda: get_transfer_history_summary(transfer_days),
+        "divisions": get_all_divisions_with_counts
+    }
+    return {
+        "versions": {section: versions[section] for section in sections},
+        "sections": {section: loaders[section]() for section in sections}
+    }
+
 # Generate a report of all items assigned to an employee
 def generate_employee_report(db: Session, emp_id: str):
     employee = get_employee(db, emp_id)
@@ -100,40 +146,9 @@ def generate_attribute_filtered_item_report(db: Session, name: str, value: str):
     
     return report
 
-def get_column_width(cell_value):
-    """
-    Calculate appropriate column width based on content.
-    Add padding and account for different character widths.
-    
-    Args:
-        cell_value: The value in the cell
-    Returns:
-        float: Calculated width for the column
-    """
-    if cell_value is None:
-        return 10  # Default minimum width
-    
-    # Convert to string and handle numbers
-    str_value = str(cell_value)
-    
-    # Calculate base width (rough approximation)
-    # Add extra space for bold text, numbers, special characters
-    base_width = len(str_value)
-    
-    # Add padding for comfortable reading
-    padding = 4
-    
-    # Adjust width based on content type
-    if any(c.isupper() for c in str_value):
-        base_width *= 1.1  # Upper case letters need more space
-    
-    if any(not c.isalnum() for c in str_value):
-        base_width *= 1.1  # Special characters might need more space
-    
-    return base_width + padding
-
-
 def divison_wise_employee_items_to_excel():
+    from tkinter import filedialog, messagebox  # Imported here so headless exports never load Tk
+
     file_path = filedialog.asksaveasfilename(
         defaultextension=".xlsx",
         filetypes=[("Excel files", "*.xlsx")],
@@ -145,173 +160,7 @@ def divison_wise_employee_items_to_excel():
         return
     
     try:
-        headers = ['Division', 'Employee Name', 'Employee ID', 'Item Name', 'Unique Key | Reference ID', 'Attributes']
-        employees = get_employee_details_with_items()
-        division_dict = {}
-        for employee in employees:
-            emp_id = employee['emp_id']
-            emp_name = employee['name']
-            emp_division = employee['division']
-            items = employee.get('items', [])
-
-            # If division is not in the dictionary, add it
-            if emp_division not in division_dict:
-                division_dict[emp_division] = []
-
-            # Append employee details to the division
-            division_dict[emp_division].append({
-                'Employee ID': emp_id,
-                'Employee Name': emp_name,
-                'Items': items  # Store items as a list
-            })
-
-        wb = Workbook()
-        ws = wb.active
-        data = division_dict
-        # Styles
-        header_font = Font(bold=True, size=12)
-        header_fill = PatternFill(start_color='D3D3D3', end_color='D3D3D3', fill_type='solid')
-        total_font = Font(bold=True, underline='single')
-        grand_total_font = Font(bold=True, size=11, underline='double')
-        center_align = Alignment(horizontal='center', vertical='center')
-        border = Border(
-            left=Side(style='thin'),
-            right=Side(style='thin'),
-            top=Side(style='thin'),
-            bottom=Side(style='thin')
-        )
-        
-        # Initialize column width trackers
-        max_column_widths = {i+1: get_column_width(header) for i, header in enumerate(headers)}
-        
-        # Write headers
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(row=1, column=col)
-            cell.value = header
-            cell.font = header_font
-            cell.fill = header_fill
-            cell.alignment = center_align
-            cell.border = border
-        
-        current_row = 2
-        total_all_employees = 0
-        total_all_items = 0
-        total_divisions = len(data)
-        
-        # Process each division
-        for division, employees in data.items():
-            division_start_row = current_row
-            total_division_items = 0
-            
-            # Update max width for division column
-            max_column_widths[1] = max(max_column_widths[1], get_column_width(division))
-            
-            # Process employees and their items
-            for employee in employees:
-                items = employee['Items']
-                total_division_items += len(items)
-                
-                # Update max widths for employee columns
-                max_column_widths[2] = max(max_column_widths[2], get_column_width(employee['Employee Name']))
-                max_column_widths[3] = max(max_column_widths[3], get_column_width(employee['Employee ID']))
-                
-                employee_start_row = current_row
-                
-                # Write employee items
-                for idx, item in enumerate(items):
-                    attributes = ', '.join([f"{attr['name']}: {attr['value']}" for attr in item.get('attributes', [])])
-                    row_data = [
-                        division if idx == 0 else '',
-                        employee['Employee Name'] if idx == 0 else '',
-                        employee['Employee ID'] if idx == 0 else '',
-                        item['name'],
-                        item['unique_key'],
-                        attributes
-                    ]
-                    
-                    # Update max widths for item columns
-                    max_column_widths[4] = max(max_column_widths[4], get_column_width(item['name']))
-                    max_column_widths[5] = max(max_column_widths[5], get_column_width(item['unique_key']))
-                    max_column_widths[6] = max(max_column_widths[6], get_column_width(attributes))
-                    
-                    for col, value in enumerate(row_data, 1):
-                        cell = ws.cell(row=current_row, column=col)
-                        cell.value = value
-                        cell.alignment = center_align
-                        cell.border = border
-                    
-                    current_row += 1
-                
-                # Merge employee cells if there are multiple items
-                if len(items) > 1:
-                    for col in [2, 3]:  # Employee Name and Employee ID columns
-                        ws.merge_cells(
-                            start_row=employee_start_row,
-                            start_column=col,
-                            end_row=current_row - 1,
-                            end_column=col
-                        )
-                        merged_cell = ws.cell(row=employee_start_row, column=col)
-                        merged_cell.alignment = center_align
-            
-            # Merge cells for division
-            if current_row > division_start_row:
-                ws.merge_cells(
-                    start_row=division_start_row,
-                    start_column=1,
-                    end_row=current_row - 1,
-                    end_column=1
-                )
-                division_cell = ws.cell(row=division_start_row, column=1)
-                division_cell.alignment = center_align
-                
-                # Write division totals
-                current_row += 1
-                total_text = "Total Employees:"
-                items_text = "Total Items:"
-                max_column_widths[1] = max(max_column_widths[1], get_column_width(total_text))
-                max_column_widths[3] = max(max_column_widths[3], get_column_width(items_text))
-                
-                ws.cell(row=current_row, column=1, value=total_text).font = total_font
-                ws.cell(row=current_row, column=2, value=len(employees)).font = total_font
-                ws.cell(row=current_row, column=3, value=items_text).font = total_font
-                ws.cell(row=current_row, column=4, value=total_division_items).font = total_font
-                
-                total_all_employees += len(employees)
-                total_all_items += total_division_items
-                
-                current_row += 2  # Add spacing between divisions
-        
-        # Write grand totals if there are multiple divisions
-        if total_divisions > 1:
-            grand_total_texts = [
-                "TOTAL DIVISIONS:",
-                "TOTAL EMPLOYEES COUNT:",
-                "TOTAL ITEMS COUNT:"
-            ]
-            
-            # Update max widths for grand total texts
-            for text in grand_total_texts:
-                max_column_widths[1] = max(max_column_widths[1], get_column_width(text))
-            
-            ws.cell(row=current_row, column=1, value=grand_total_texts[0]).font = grand_total_font
-            ws.cell(row=current_row, column=2, value=total_divisions).font = grand_total_font
-            current_row += 1
-            
-            ws.cell(row=current_row, column=1, value=grand_total_texts[1]).font = grand_total_font
-            ws.cell(row=current_row, column=2, value=total_all_employees).font = grand_total_font
-            current_row += 1
-            
-            ws.cell(row=current_row, column=1, value=grand_total_texts[2]).font = grand_total_font
-            ws.cell(row=current_row, column=2, value=total_all_items).font = grand_total_font
-        
-        # Apply the calculated column widths
-        for col, width in max_column_widths.items():
-            # Ensure minimum width and add some padding for better readability
-            final_width = max(10, min(60, width))  # Cap between 10 and 60 characters
-            ws.column_dimensions[get_column_letter(col)].width = final_width
-        
-        wb.save(file_path)
+        export_division_report(file_path)
         messagebox.showinfo(
             "Export Successful", 
             f"Division-wise Employee Items report saved to:\n{file_path}"
@@ -326,6 +175,8 @@ def employee_id_name_to_excel():
     """
     Export Employee ID, Name, and Division to Excel with user-selected save location
     """
+    from tkinter import filedialog, messagebox
+
     # Prompt user to choose save location
     file_path = filedialog.asksaveasfilename(
         defaultextension=".xlsx",
@@ -338,82 +189,7 @@ def employee_id_name_to_excel():
         return
     
     try:
-        # Get all employees
-        employees = get_all_employees()  # Assuming this function exists
-        
-        # Create workbook and worksheet
-        wb = Workbook()
-        ws = wb.active
-        ws.title = "Employees"
-        
-        # Headers
-        headers = ['Employee ID', 'Name', 'Division']
-        
-        # Styling
-        header_font = Font(bold=True, size=12)
-        header_fill = PatternFill(start_color='D3D3D3', end_color='D3D3D3', fill_type='solid')
-        total_font = Font(bold=True, underline='single')
-        center_align = Alignment(horizontal='center', vertical='center')
-        border = Border(
-            left=Side(style='thin'),
-            right=Side(style='thin'),
-            top=Side(style='thin'),
-            bottom=Side(style='thin')
-        )
-        
-        # Initialize column width trackers
-        max_column_widths = {i+1: get_column_width(header) for i, header in enumerate(headers)}
-        
-        # Write headers
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(row=1, column=col)
-            cell.value = header
-            cell.font = header_font
-            cell.fill = header_fill
-            cell.alignment = center_align
-            cell.border = border
-        
-        # Current row to write data
-        current_row = 2
-        total_employees = 0
-        
-        # Process each employee
-        for employee in employees:
-            # Get employee details
-            emp_id = employee['emp_id']
-            emp_name = employee['name']
-            emp_division = employee['division']
-            
-            # Update max widths
-            max_column_widths[1] = max(max_column_widths[1], get_column_width(emp_id))
-            max_column_widths[2] = max(max_column_widths[2], get_column_width(emp_name))
-            max_column_widths[3] = max(max_column_widths[3], get_column_width(emp_division))
-            
-            # Write employee row
-            row_data = [emp_id, emp_name, emp_division]
-            
-            for col, value in enumerate(row_data, 1):
-                cell = ws.cell(row=current_row, column=col)
-                cell.value = value
-                cell.alignment = center_align
-                cell.border = border
-            
-            current_row += 1
-            total_employees += 1
-        
-        # Write total employees count
-        current_row += 1
-        ws.cell(row=current_row, column=1, value="TOTAL EMPLOYEES COUNT:").font = total_font
-        ws.cell(row=current_row, column=2, value=total_employees).font = total_font
-        
-        # Apply the calculated column widths
-        for col, width in max_column_widths.items():
-            # Ensure minimum width and add some padding for better readability
-            final_width = max(10, min(60, width))  # Cap between 10 and 60 characters
-            ws.column_dimensions[get_column_letter(col)].width = final_width
-        
-        # Save the workbook
-        wb.save(file_path)
+        export_employee_report(file_path)
         
         # Show success message
         messagebox.showinfo(
@@ -428,26 +204,12 @@ def employee_id_name_to_excel():
             f"Failed to export report:\n{str(e)}"
         )
 
-def convert_items_to_dicts(items):
-        """
-        Convert SQLAlchemy Item objects to dictionaries with detailed attributes
-        """
-        items_data = []
-        for item in items:
-            item_dict = {
-                "item_id": item.item_id,
-                "name": item.name,
-            }
-                        
-            items_data.append(item_dict)
-        
-        return items_data
-
-
 def items_to_excel():
     """
     Export Items with Name to Excel
     """
+    from tkinter import filedialog, messagebox
+
     # Prompt user to choose save location
     file_path = filedialog.asksaveasfilename(
         defaultextension=".xlsx",
@@ -460,62 +222,7 @@ def items_to_excel():
         return
     
     try:
-        # Get all items
-        items = convert_items_to_dicts(get_all_items())  # Assuming this function exists
-        
-        # Create workbook and worksheet
-        wb = Workbook()
-        ws = wb.active
-        ws.title = "Items"
-        
-        # Styling
-        header_font = Font(bold=True, size=12)
-        header_fill = PatternFill(start_color='D3D3D3', end_color='D3D3D3', fill_type='solid')
-        center_alignment = Alignment(horizontal='center', vertical='center')
-        thin_border = Border(
-            left=Side(style='thin'),
-            right=Side(style='thin'),
-            top=Side(style='thin'),
-            bottom=Side(style='thin')
-        )
-        
-        # Write headers
-        headers = [
-            "Name"
-        ]
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(row=1, column=col)
-            cell.value = header
-            cell.font = header_font
-            cell.fill = header_fill
-            cell.alignment = center_alignment
-            cell.border = thin_border
-        
-        # Current row to write data
-        current_row = 2
-        
-        # Process each item
-        for item in items:
-            name_cell = ws.cell(row=current_row, column=1, value=item['name'])
-            name_cell.border = thin_border
-            
-            current_row += 1
-        
-        # Auto-adjust column widths
-        for col in ws.columns:
-            max_length = 0
-            column = col[0].column_letter
-            for cell in col:
-                try:
-                    if len(str(cell.value)) > max_length:
-                        max_length = len(cell.value)
-                except:
-                    pass
-                adjusted_width = (max_length + 2)
-                ws.column_dimensions[column].width = adjusted_width
-        
-        # Save the workbook
-        wb.save(file_path)
+        export_item_report(file_path)
         
         # Show success message
         messagebox.showinfo(
@@ -528,4 +235,4 @@ def items_to_excel():
         messagebox.showerror(
             "Export Error", 
             f"Failed to export report:\n{str(e)}"
-        )
\ No newline at end of file
+        )